@@ -1,43 +1,53 @@
+from typing import AsyncGenerator
+
 import jwt
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
-from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
 from app.core.config import settings
 from app.core.constants import AUTH_ALGORITHM
-from app.db import UserDAO, get_session
+from app.db import (
+    UserDAO,
+    get_session,
+    open_read_session,
+    release_connection,
+    select_read_session_maker,
+)
 from app.models import UserModel
+from app.schemas import PrincipalSchema
+from app.services import get_principal
 
 auth_header = HTTPBearer()
 
 
-async def get_current_user(
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_401_UNAUTHORIZED,
+        detail="Ошибка валидации токена аутентификации",
+        headers={"WWW-Authenticate": "Bearer"},
+    )
+
+
+async def get_token_payload(
     *,
-    session: AsyncSession = Depends(get_session),
     credentials: HTTPAuthorizationCredentials = Depends(auth_header),
-) -> UserModel:
+) -> dict:
     """
-    Возвращает текущего пользователя, при наличии верного токена в заголовке
-    запроса. В случае проблем с аутентификацией, вызывает `HTTPException` со
-    статус-кодом 401.
+    Проверяет подпись и срок действия токена из заголовка запроса и возвращает
+    его содержимое. Не обращается к базе данных.
+
     Args:
-        session (AsyncSession): Асинхронная сессия базы данных.
         credentials (HTTPAuthorizationCredentials): Данные аутентификации из
             заголовка запроса, содержащие токен.
     Returns:
-        UserModel: Модель пользователя, если токен действителен.
+        dict: Claims токена.
     Raises:
-        HTTPException: Если токен недействителен или пользователь не найден.
+        HTTPException: Если токен недействителен.
     """
 
-    credentials_exception = HTTPException(
-        status_code=status.HTTP_401_UNAUTHORIZED,
-        detail="Ошибка валидации токена аутентификации",
-        headers={"WWW-Authenticate": "Bearer"},
-    )
-
     if not credentials.scheme == "Bearer":
-        raise credentials_exception
+        raise _credentials_exception()
     token: str = credentials.credentials
 
     try:
@@ -46,22 +56,181 @@ async def get_current_user(
             settings.AUTH_SECRET_KEY,
             algorithms=[AUTH_ALGORITHM],
         )
-        email: str = payload.get("sub")
-
-        if email is None:
-            raise credentials_exception
     except (jwt.ExpiredSignatureError, jwt.InvalidTokenError, jwt.DecodeError):
-        raise credentials_exception
+        raise _credentials_exception()
 
-    current_user = await UserDAO.find_one_or_none(
+    user_id = payload.get("uid")
+    email = payload.get("sub")
+
+    if user_id is None:
+        # Токен старого формата: пользователь определяется только по email
+        if email is None or not settings.AUTH_ACCEPT_LEGACY_TOKENS:
+            raise _credentials_exception()
+    elif not isinstance(user_id, int) or not isinstance(payload.get("ver"), int):
+        raise _credentials_exception()
+
+    return payload
+
+
+async def get_read_session(
+    *,
+    payload: dict = Depends(get_token_payload),
+) -> AsyncGenerator[AsyncSession, None]:
+    """
+    Возвращает сессию только для чтения данных текущего пользователя: на
+    реплике, если они настроены, или на основной БД, если пользователь
+    недавно изменял данные.
+
+    Args:
+        payload (dict): Claims токена.
+    Returns:
+        AsyncSession: Сессия БД.
+    """
+
+    async with await open_read_session(user_id=payload.get("uid")) as session:
+        yield session
+
+
+def get_read_session_maker(
+    *,
+    payload: dict = Depends(get_token_payload),
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Возвращает фабрику сессий только для чтения данных текущего пользователя
+    для обработчиков, работа которых продолжается после возврата из них.
+
+    Args:
+        payload (dict): Claims токена.
+    Returns:
+        async_sessionmaker[AsyncSession]: Фабрика сессий.
+    """
+
+    return select_read_session_maker(user_id=payload.get("uid"))
+
+
+async def get_current_principal(
+    *,
+    session: AsyncSession = Depends(get_session),
+    payload: dict = Depends(get_token_payload),
+) -> PrincipalSchema:
+    """
+    Возвращает минимальные данные текущего пользователя, нужные для авторизации
+    запроса. Данные берутся из кэша, поэтому в большинстве случаев запрос
+    обходится без обращения к таблице users. В случае проблем с
+    аутентификацией, вызывает `HTTPException` со статус-кодом 401.
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+        payload (dict): Claims токена.
+    Returns:
+        PrincipalSchema: Данные пользователя, если токен действителен.
+    Raises:
+        HTTPException: Если токен отозван или пользователь не найден.
+    """
+
+    # Данные для авторизации читаются с основной БД: отзыв токенов должен
+    # действовать сразу, без учета отставания реплик
+    principal = await get_principal(
         session=session,
-        email=email,
+        user_id=payload.get("uid"),
+        email=payload.get("sub"),
     )
 
+    return authorize_principal(principal=principal, payload=payload)
+
+
+async def get_admin_principal(
+    *,
+    principal: PrincipalSchema = Depends(get_current_principal),
+) -> PrincipalSchema:
+    """
+    Возвращает данные текущего пользователя, если его email указан в
+    `ADMIN_EMAILS`, иначе вызывает `HTTPException` со статус-кодом 403.
+    Args:
+        principal (PrincipalSchema): Данные текущего пользователя.
+    Returns:
+        PrincipalSchema: Данные администратора.
+    Raises:
+        HTTPException: Если пользователь не является администратором.
+    """
+
+    admin_emails = {email.lower() for email in settings.ADMIN_EMAILS}
+    if principal.email.lower() not in admin_emails:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Недостаточно прав",
+        )
+
+    return principal
+
+
+def authorize_principal(
+    *,
+    principal: PrincipalSchema | None,
+    payload: dict,
+) -> PrincipalSchema:
+    """
+    Проверяет, что пользователь, которому выдан токен, существует и токен не
+    отозван (см. `get_current_principal`).
+
+    Args:
+        principal (PrincipalSchema | None): Данные пользователя из БД или кэша.
+        payload (dict): Claims токена.
+    Returns:
+        PrincipalSchema: Данные пользователя, если токен действителен.
+    Raises:
+        HTTPException: Если токен отозван или пользователь не найден.
+    """
+
     # Если пользователь не найден, в целях безопасности не раскрываем,
     # что токен был действителен, просто возвращаем ошибку
     # аутентификации.
+    if principal is None:
+        raise _credentials_exception()
+
+    # Токены старого формата не содержат версию и считаются выпущенными
+    # с версией 0: отзыв токенов пользователя действует и на них.
+    if payload.get("ver", 0) != principal.token_version:
+        raise _credentials_exception()
+
+    return principal
+
+
+async def get_current_user(
+    *,
+    session: AsyncSession = Depends(get_read_session),
+    primary_session: AsyncSession = Depends(get_session),
+    principal: PrincipalSchema = Depends(get_current_principal),
+) -> UserModel:
+    """
+    Возвращает модель текущего пользователя, при наличии верного токена в
+    заголовке запроса. В случае проблем с аутентификацией, вызывает
+    `HTTPException` со статус-кодом 401.
+    Args:
+        session (AsyncSession): Сессия для чтения (может быть на реплике).
+        primary_session (AsyncSession): Сессия основной БД.
+        principal (PrincipalSchema): Данные текущего пользователя.
+    Returns:
+        UserModel: Модель пользователя, если токен действителен.
+    Raises:
+        HTTPException: Если токен недействителен или пользователь не найден.
+    """
+
+    current_user = await UserDAO.find_one_or_none(
+        session=session,
+        id=principal.id,
+    )
+    await release_connection(session)
+
+    # Пользователь найден на основной БД при авторизации, но мог еще не
+    # появиться на реплике (например, сразу после регистрации в другом
+    # процессе)
+    if current_user is None and session is not primary_session:
+        current_user = await UserDAO.find_one_or_none(
+            session=primary_session,
+            id=principal.id,
+        )
+
     if current_user is None:
-        raise credentials_exception
+        raise _credentials_exception()
 
     return current_user
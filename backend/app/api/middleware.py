@@ -0,0 +1,86 @@
+"""Содержит ASGI middleware приложения."""
+
+import time
+
+from opentelemetry import trace
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.metrics import (
+    DB_REQUEST_QUERIES,
+    DB_REQUEST_SECONDS,
+    DB_REQUEST_SLOWEST_QUERY_SECONDS,
+)
+from app.db.instrumentation import QueryStats, query_stats
+
+
+class QueryStatsMiddleware:
+    """
+    Учитывает запросы к БД, выполненные при обработке HTTP-запроса (см.
+    `app.db.instrumentation`), и после ответа записывает их количество, общее
+    время и время самого долгого запроса в метрики с шаблоном пути маршрута
+    и в атрибуты span logfire запроса. Запросы без маршрута (например, 404)
+    в метриках не учитываются, чтобы не создавать метку на каждый путь.
+
+    С `server_timing` статистика также возвращается в заголовке
+    `Server-Timing` (время БД и общее время обработки до начала ответа).
+    Заголовок отправляется до тела ответа, поэтому запросы, выполненные при
+    потоковой отдаче тела, в него не попадают, но учитываются в метриках.
+    """
+
+    def __init__(self, app: ASGIApp, *, server_timing: bool = False):
+        self.app = app
+        self.server_timing = server_timing
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = QueryStats(scope=scope)
+        token = query_stats.set(stats)
+        started_at = time.perf_counter()
+
+        async def send_wrapper(message: Message) -> None:
+            if message["type"] == "http.response.start" and self.server_timing:
+                headers = MutableHeaders(scope=message)
+                headers.append(
+                    "Server-Timing",
+                    _format_server_timing(stats, time.perf_counter() - started_at),
+                )
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            query_stats.reset(token)
+            _record(scope, stats)
+
+
+def _format_server_timing(stats: QueryStats, seconds: float) -> str:
+    return (
+        f'db;dur={stats.seconds * 1000:.1f};desc="{stats.count} queries", '
+        f"db-slowest;dur={stats.slowest_seconds * 1000:.1f}, "
+        f"app;dur={seconds * 1000:.1f}"
+    )
+
+
+def _record(scope: Scope, stats: QueryStats) -> None:
+    span = trace.get_current_span()
+    span.set_attributes(
+        {
+            "db.query_count": stats.count,
+            "db.duration_ms": stats.seconds * 1000,
+            "db.slowest_query_ms": stats.slowest_seconds * 1000,
+        }
+    )
+    if stats.slowest_statement is not None:
+        span.set_attribute("db.slowest_statement", stats.slowest_statement)
+
+    if stats.route is None:
+        return
+
+    labels = {"method": scope["method"], "route": stats.route}
+    DB_REQUEST_QUERIES.labels(**labels).observe(stats.count)
+    DB_REQUEST_SECONDS.labels(**labels).observe(stats.seconds)
+    DB_REQUEST_SLOWEST_QUERY_SECONDS.labels(**labels).observe(stats.slowest_seconds)
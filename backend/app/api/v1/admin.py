@@ -0,0 +1,42 @@
+"""Содержит служебные обработчики маршрутов, доступные администраторам."""
+
+from fastapi import APIRouter, Depends
+
+from app.api.dependencies import get_admin_principal
+from app.db import SlowQueryLog, get_slow_query_log
+from app.schemas import SlowQueryListResponseSchema, SlowQueryPlanSchema
+
+router = APIRouter(
+    prefix="/admin",
+    tags=["Администрирование"],
+    dependencies=[Depends(get_admin_principal)],
+)
+
+
+# MARK: GET
+@router.get(
+    "/slow-queries",
+    summary="Получить планы медленных запросов к БД",
+)
+async def admin_slow_queries_route(
+    slow_query_log: SlowQueryLog = Depends(get_slow_query_log),
+) -> SlowQueryListResponseSchema:
+    """
+    Возвращает последние планы медленных запросов, снятые этим процессом
+    приложения (см. `SLOW_QUERY_EXPLAIN_SAMPLE_RATE`).
+
+    Доступно пользователям из `ADMIN_EMAILS`.
+
+    Args:
+        slow_query_log: Журнал медленных запросов
+
+    Returns:
+        SlowQueryListResponseSchema: Планы медленных запросов
+    """
+
+    return SlowQueryListResponseSchema(
+        queries=[
+            SlowQueryPlanSchema.model_validate(plan)
+            for plan in reversed(slow_query_log.plans)
+        ]
+    )
@@ -1,14 +1,16 @@
 """Содержит обработчики маршрутов для аутентификации и регистрации пользователей."""
 
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.api.dependencies import get_current_user
+from app.api.dependencies import get_current_principal, get_current_user
+from app.core.exceptions import ServiceOverloadedException
 from app.db import get_session
 from app.models import UserModel
 from app.schemas import (
     LoginRequestSchema,
     LoginResponseSchema,
+    PrincipalSchema,
     SignupRequestSchema,
     SignupResponseSchema,
     UserResponseSchema,
@@ -18,7 +20,9 @@ from app.services import (
     authenticate_user,
     create_user,
     create_user_token,
+    revoke_user_tokens,
 )
+from app.utils.http import etag_matches, format_http_date, make_etag
 
 router = APIRouter(
     prefix="/auth",
@@ -26,6 +30,14 @@ router = APIRouter(
 )
 
 
+def _service_overloaded_exception(ex: ServiceOverloadedException) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+        detail=ex.msg,
+        headers={"Retry-After": "1"},
+    )
+
+
 # MARK: POST
 @router.post(
     "/signup",
@@ -48,6 +60,7 @@ async def auth_signup_route(
 
     Raises:
         HTTPException: При попытке создать пользователя с существующим email
+            или при перегрузке сервиса
     """
 
     try:
@@ -60,6 +73,8 @@ async def auth_signup_route(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail=ex.msg,
         )
+    except ServiceOverloadedException as ex:
+        raise _service_overloaded_exception(ex) from ex
 
     return SignupResponseSchema(
         user=user,
@@ -86,11 +101,14 @@ async def auth_login_route(
     `Authorization: Bearer token_value`
     """
 
-    db_user = await authenticate_user(
-        session=session,
-        email=login_data.email,
-        password=login_data.password,
-    )
+    try:
+        db_user = await authenticate_user(
+            session=session,
+            email=login_data.email,
+            password=login_data.password,
+        )
+    except ServiceOverloadedException as ex:
+        raise _service_overloaded_exception(ex) from ex
 
     if not db_user:
         raise HTTPException(
@@ -108,20 +126,55 @@ async def auth_login_route(
     )
 
 
+@router.post(
+    "/logout",
+    summary="Отозвать все токены текущего пользователя",
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def auth_logout_route(
+    session: AsyncSession = Depends(get_session),
+    principal: PrincipalSchema = Depends(get_current_principal),
+) -> None:
+    """
+    Отзывает все выданные текущему пользователю токены (выход на всех
+    устройствах). Для продолжения работы необходимо получить новый токен.
+    """
+
+    await revoke_user_tokens(
+        session=session,
+        user_id=principal.id,
+    )
+
+
 # MARK: GET
 @router.get(
     "/me",
     summary="Получить информацию о текущем пользователе",
     response_model=UserResponseSchema,
     status_code=status.HTTP_200_OK,
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "Данные не изменились"},
+    },
 )
 async def auth_me_route(
+    response: Response,
+    if_none_match: str | None = Header(None),
     current_user: UserModel = Depends(get_current_user),
-) -> UserResponseSchema:
+) -> UserResponseSchema | Response:
     """
     Эндпоинт возвращает информацию о текущем аутентифицированном пользователе.
 
     Для доступа к эндпоинту необходимо передать токен аутентификации в заголовке
-    запроса.
+    запроса. Ответ содержит заголовки `ETag` и `Last-Modified`; при совпадении
+    `If-None-Match` с текущим ETag возвращается ответ 304 без тела.
     """
+    headers = {
+        "ETag": make_etag(current_user.id, current_user.email, current_user.updated_at),
+        "Last-Modified": format_http_date(current_user.updated_at),
+        "Cache-Control": "private, no-cache",
+    }
+    if etag_matches(etag=headers["ETag"], if_none_match=if_none_match):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    response.headers.update(headers)
     return current_user
@@ -1,23 +1,81 @@
 """Содержит обработчики маршрутов для работы с задачами."""
 
-from fastapi import APIRouter, Body, Depends, HTTPException, Path, status
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import (
+    APIRouter,
+    Body,
+    Depends,
+    Header,
+    HTTPException,
+    Path,
+    Query,
+    Request,
+    Response,
+    status,
+)
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 
-from app.api.dependencies import get_current_user
-from app.db import get_session
-from app.models import UserModel
+from app.api.dependencies import (
+    get_current_principal,
+    get_read_session,
+    get_read_session_maker,
+)
+from app.core.config import settings
+from app.core.constants import (
+    TASKS_AUTOCOMPLETE_DEFAULT_LIMIT,
+    TASKS_AUTOCOMPLETE_MAX_LIMIT,
+    TASKS_AUTOCOMPLETE_QUERY_MAX_LENGTH,
+    TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH,
+    TASKS_BATCH_MAX_SIZE,
+    TASKS_PAGE_DEFAULT_LIMIT,
+    TASKS_PAGE_MAX_LIMIT,
+    TASKS_SEARCH_DEFAULT_LIMIT,
+    TASKS_SEARCH_MAX_LIMIT,
+    TASKS_SEARCH_QUERY_MAX_LENGTH,
+)
+from app.db import get_session, release_connection
 from app.schemas import (
+    PrincipalSchema,
+    SortOrder,
+    TaskBatchCreateResponseSchema,
+    TaskBatchCreateSchema,
+    TaskBulkResultSchema,
+    TaskBulkUpdateSchema,
     TaskCreateSchema,
+    TaskFileFormat,
+    TaskImportResponseSchema,
     TaskListResponseSchema,
     TaskResponseSchema,
+    TaskSortField,
+    TaskStatusFilter,
+    TaskSuggestionListResponseSchema,
     TaskUpdateSchema,
 )
-from app.services import create_task, delete_task, get_user_tasks, update_task
+from app.services import (
+    autocomplete_user_tasks,
+    create_task,
+    create_tasks,
+    delete_task,
+    delete_tasks,
+    export_user_tasks,
+    get_user_tasks,
+    get_user_tasks_etag,
+    get_user_tasks_json,
+    get_user_tasks_with_etag,
+    import_tasks,
+    search_user_tasks,
+    update_task,
+    update_tasks,
+)
 from app.services.exceptions import (
+    InvalidCursorException,
+    TaskAutocompleteSupersededException,
     TaskCreateException,
     TaskDeleteException,
+    TaskImportException,
     TaskUpdateException,
 )
+from app.utils.http import etag_matches, json_response
 
 router = APIRouter(
     prefix="/tasks",
@@ -34,7 +92,7 @@ router = APIRouter(
 async def create_task_route(
     task_data: TaskCreateSchema = Body(..., description="Данные для создания задачи"),
     session: AsyncSession = Depends(get_session),
-    current_user: UserModel = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> TaskResponseSchema:
     """
     Создает новую задачу для текущего пользователя.
@@ -65,44 +123,505 @@ async def create_task_route(
         ) from ex
 
 
+@router.post(
+    "/batch",
+    summary="Создать несколько задач",
+    status_code=status.HTTP_201_CREATED,
+)
+async def create_tasks_batch_route(
+    batch_data: TaskBatchCreateSchema = Body(
+        ..., description="Данные для создания задач"
+    ),
+    session: AsyncSession = Depends(get_session),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> TaskBatchCreateResponseSchema:
+    """
+    Создает несколько задач для текущего пользователя одним запросом к БД.
+
+    Элементы пакета проверяются по отдельности: задачи из корректных элементов
+    создаются, а для некорректных возвращаются ошибки валидации с индексом
+    элемента в пакете.
+
+    Args:
+        batch_data: Данные для создания задач
+        session: Сессия базы данных
+        current_user: Текущий пользователь
+
+    Returns:
+        TaskBatchCreateResponseSchema: Созданные задачи и ошибки валидации
+    """
+    try:
+        return await create_tasks(
+            session=session,
+            tasks_data=batch_data.tasks,
+            user_id=current_user.id,
+        )
+    except TaskCreateException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ex.msg,
+        ) from ex
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(ex),
+        ) from ex
+
+
+@router.post(
+    "/import",
+    summary="Загрузить задачи из файла",
+    status_code=status.HTTP_201_CREATED,
+    openapi_extra={
+        "requestBody": {
+            "required": True,
+            "content": {
+                "application/x-ndjson": {"schema": {"type": "string"}},
+                "text/csv": {"schema": {"type": "string"}},
+            },
+        },
+    },
+)
+async def import_tasks_route(
+    request: Request,
+    import_format: TaskFileFormat = Query(
+        TaskFileFormat.NDJSON,
+        alias="format",
+        description="Формат файла",
+    ),
+    session: AsyncSession = Depends(get_session),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> TaskImportResponseSchema:
+    """
+    Загружает задачи текущего пользователя из файла, переданного в теле
+    запроса: NDJSON с объектами в формате TaskCreateSchema (по одному в
+    строке) или CSV с заголовком, содержащим поля `title` и `description`.
+
+    Тело запроса обрабатывается по мере получения. Записи, не прошедшие
+    валидацию, пропускаются и возвращаются в списке ошибок; остальные
+    загружаются в одной транзакции.
+
+    Args:
+        request: Запрос с содержимым файла в теле
+        import_format: Формат файла
+        session: Сессия базы данных
+        current_user: Текущий пользователь
+
+    Returns:
+        TaskImportResponseSchema: Количество загруженных задач и ошибки валидации
+    """
+    try:
+        return await import_tasks(
+            session=session,
+            user_id=current_user.id,
+            chunks=request.stream(),
+            import_format=import_format,
+        )
+    except TaskImportException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ex.msg,
+        ) from ex
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(ex),
+        ) from ex
+
+
 # MARK: GET
 @router.get(
     "",
-    summary="Получить все задачи текущего пользователя",
+    summary="Получить задачи текущего пользователя",
     status_code=status.HTTP_200_OK,
+    response_model=TaskListResponseSchema,
+    responses={
+        status.HTTP_304_NOT_MODIFIED: {"description": "Список задач не изменился"},
+    },
 )
 async def get_user_tasks_route(
-    session: AsyncSession = Depends(get_session),
-    current_user: UserModel = Depends(get_current_user),
-) -> TaskListResponseSchema:
+    limit: int = Query(
+        TASKS_PAGE_DEFAULT_LIMIT,
+        ge=1,
+        le=TASKS_PAGE_MAX_LIMIT,
+        description="Максимальное количество задач на странице",
+    ),
+    after: str | None = Query(
+        None,
+        description="Курсор `next_cursor` из ответа с предыдущей страницей",
+    ),
+    status_filter: TaskStatusFilter = Query(
+        TaskStatusFilter.ALL,
+        alias="status",
+        description="Фильтр по статусу выполнения задачи",
+    ),
+    sort: TaskSortField = Query(
+        TaskSortField.CREATED_AT,
+        description="Поле сортировки",
+    ),
+    order: SortOrder = Query(
+        SortOrder.ASC,
+        description="Направление сортировки",
+    ),
+    if_none_match: str | None = Header(None),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> Response:
     """
-    Получает все задачи текущего пользователя.
+    Получает задачи текущего пользователя постранично, с фильтрацией по статусу
+    и сортировкой по дате создания или статусу.
+
+    Для получения следующей страницы нужно передать значение `next_cursor`
+    из ответа в параметре `after`, не меняя остальные параметры запроса.
+
+    Ответ содержит заголовок `ETag`. Если передать его значение в заголовке
+    `If-None-Match` и задачи пользователя с тех пор не менялись, вернется
+    ответ 304 без тела: страница задач при этом не загружается ни из кэша,
+    ни из БД.
+
+    Страницы хранятся в кэше до изменения задач пользователя. Без заголовка
+    `If-None-Match` ETag и страница задач, отсутствующая в кэше, загружаются
+    одним запросом к БД.
 
     Args:
+        limit: Максимальное количество задач на странице
+        after: Курсор предыдущей страницы
+        status_filter: Фильтр по статусу выполнения
+        sort: Поле сортировки
+        order: Направление сортировки
+        if_none_match: ETag, полученный клиентом ранее
         session: Сессия базы данных
         current_user: Текущий пользователь
 
     Returns:
-        Список задач текущего пользователя
+        Страница списка задач текущего пользователя или ответ 304
+
+    Raises:
+        HTTPException: Если передан некорректный курсор
     """
+    query = (limit, after, status_filter, sort, order)
+    tasks = None
+
     try:
-        tasks = await get_user_tasks(
+        if settings.TASKS_CACHE_ENABLED:
+            etag, tasks = await get_user_tasks_json(
+                session=session,
+                user_id=current_user.id,
+                limit=limit,
+                after=after,
+                status=status_filter,
+                sort=sort,
+                order=order,
+                query=query,
+                if_none_match=if_none_match,
+            )
+        elif if_none_match is None:
+            etag, tasks = await get_user_tasks_with_etag(
+                session=session,
+                user_id=current_user.id,
+                limit=limit,
+                after=after,
+                status=status_filter,
+                sort=sort,
+                order=order,
+                query=query,
+            )
+        else:
+            # При условном запросе сначала проверяется ETag, чтобы при его
+            # совпадении не загружать задачи
+            etag = await get_user_tasks_etag(
+                session=session,
+                user_id=current_user.id,
+                query=query,
+            )
+            if not etag_matches(etag=etag, if_none_match=if_none_match):
+                tasks = await get_user_tasks(
+                    session=session,
+                    user_id=current_user.id,
+                    limit=limit,
+                    after=after,
+                    status=status_filter,
+                    sort=sort,
+                    order=order,
+                )
+        await release_connection(session)
+    except InvalidCursorException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ex.msg,
+        ) from ex
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(ex),
+        ) from ex
+
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if tasks is None or (
+        if_none_match is not None
+        and etag_matches(etag=etag, if_none_match=if_none_match)
+    ):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+
+    return json_response(tasks, headers=headers)
+
+
+@router.get(
+    "/export",
+    summary="Выгрузить все задачи текущего пользователя",
+    status_code=status.HTTP_200_OK,
+    response_class=StreamingResponse,
+    responses={
+        status.HTTP_200_OK: {
+            "content": {"application/x-ndjson": {}, "text/csv": {}},
+            "description": "Задачи пользователя в порядке создания",
+        },
+    },
+)
+async def export_user_tasks_route(
+    export_format: TaskFileFormat = Query(
+        TaskFileFormat.NDJSON,
+        alias="format",
+        description="Формат выгрузки",
+    ),
+    session_maker: async_sessionmaker[AsyncSession] = Depends(get_read_session_maker),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> StreamingResponse:
+    """
+    Выгружает все задачи текущего пользователя в формате NDJSON (по одной
+    задаче в строке) или CSV (с заголовком).
+
+    Ответ передается по частям по мере чтения задач из БД через серверный
+    курсор, поэтому потребление памяти не зависит от количества задач.
+
+    Args:
+        export_format: Формат выгрузки
+        session_maker: Фабрика сессий базы данных
+        current_user: Текущий пользователь
+
+    Returns:
+        StreamingResponse: Потоковый ответ с задачами
+    """
+
+    # Тело ответа передается уже после выхода из обработчика, когда сессия из
+    # get_session закрыта, поэтому выгрузка открывает собственную сессию
+    async def content():
+        async with session_maker() as session:
+            async for chunk in export_user_tasks(
+                session=session,
+                user_id=current_user.id,
+                export_format=export_format,
+            ):
+                yield chunk
+
+    if export_format == TaskFileFormat.CSV:
+        media_type = "text/csv; charset=utf-8"
+    else:
+        media_type = "application/x-ndjson"
+
+    return StreamingResponse(
+        content(),
+        media_type=media_type,
+        headers={
+            "Content-Disposition": f'attachment; filename="tasks.{export_format}"',
+        },
+    )
+
+
+@router.get(
+    "/search",
+    summary="Найти задачи текущего пользователя",
+    status_code=status.HTTP_200_OK,
+    response_model=TaskListResponseSchema,
+)
+async def search_user_tasks_route(
+    q: str = Query(
+        min_length=1,
+        max_length=TASKS_SEARCH_QUERY_MAX_LENGTH,
+        description="Поисковый запрос",
+    ),
+    limit: int = Query(
+        TASKS_SEARCH_DEFAULT_LIMIT,
+        ge=1,
+        le=TASKS_SEARCH_MAX_LIMIT,
+        description="Максимальное количество задач на странице",
+    ),
+    after: str | None = Query(
+        None,
+        description="Курсор `next_cursor` из ответа с предыдущей страницей",
+    ),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> Response:
+    """
+    Ищет задачи текущего пользователя по словам из заголовка и описания с
+    учетом словоформ русского языка. Задачи упорядочены по релевантности;
+    совпадения в заголовке важнее совпадений в описании.
+
+    Запрос поддерживает синтаксис веб-поиска: фразы в кавычках, `or` и
+    исключение слов с помощью `-`.
+
+    Для получения следующей страницы нужно передать значение `next_cursor`
+    из ответа в параметре `after`, не меняя поисковый запрос.
+
+    Args:
+        q: Поисковый запрос
+        limit: Максимальное количество задач на странице
+        after: Курсор предыдущей страницы
+        session: Сессия базы данных
+        current_user: Текущий пользователь
+
+    Returns:
+        Страница найденных задач
+
+    Raises:
+        HTTPException: Если передан некорректный курсор или произошла ошибка
+            при поиске
+    """
+
+    try:
+        tasks = await search_user_tasks(
             session=session,
             user_id=current_user.id,
+            text=q,
+            limit=limit,
+            after=after,
         )
+        await release_connection(session)
+    except InvalidCursorException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ex.msg,
+        ) from ex
     except Exception as ex:
         raise HTTPException(
             status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
             detail=str(ex),
         ) from ex
 
-    return TaskListResponseSchema(
-        tasks=tasks,
-        total=len(tasks),
-    )
+    return json_response(tasks)
+
+
+@router.get(
+    "/autocomplete",
+    summary="Подсказать задачи текущего пользователя по набранному тексту",
+    status_code=status.HTTP_200_OK,
+    response_model=TaskSuggestionListResponseSchema,
+    responses={
+        status.HTTP_204_NO_CONTENT: {
+            "description": "Запрос вытеснен более новым запросом пользователя",
+        },
+    },
+)
+async def autocomplete_user_tasks_route(
+    q: str = Query(
+        min_length=TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH,
+        max_length=TASKS_AUTOCOMPLETE_QUERY_MAX_LENGTH,
+        description="Набранный текст",
+    ),
+    limit: int = Query(
+        TASKS_AUTOCOMPLETE_DEFAULT_LIMIT,
+        ge=1,
+        le=TASKS_AUTOCOMPLETE_MAX_LIMIT,
+        description="Максимальное количество подсказок",
+    ),
+    session: AsyncSession = Depends(get_read_session),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> Response:
+    """
+    Подсказывает задачи текущего пользователя при наборе текста: находит
+    задачи, заголовок которых содержит текст как подстроку (без учета
+    регистра) или содержит похожее слово, например с опечаткой.
+
+    Предназначен для вызова на каждое нажатие клавиши. Первый запрос серии
+    выполняется сразу. Запрос, отправленный быстрее
+    `TASKS_AUTOCOMPLETE_DEBOUNCE_SECONDS` (по умолчанию 50 мс) после
+    предыдущего, выполняется с такой же задержкой; если за это время
+    пользователь отправил новый запрос, текущий завершается ответом 204 без
+    тела: клиенту нужен только ответ на последний запрос.
+
+    Args:
+        q: Набранный текст
+        limit: Максимальное количество подсказок
+        session: Сессия базы данных
+        current_user: Текущий пользователь
+
+    Returns:
+        Подсказки, упорядоченные по убыванию сходства с текстом
+
+    Raises:
+        HTTPException: Если произошла ошибка при поиске подсказок
+    """
+
+    try:
+        suggestions = await autocomplete_user_tasks(
+            session=session,
+            user_id=current_user.id,
+            text=q,
+            limit=limit,
+        )
+        await release_connection(session)
+    except TaskAutocompleteSupersededException:
+        return Response(status_code=status.HTTP_204_NO_CONTENT)
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(ex),
+        ) from ex
+
+    return json_response(suggestions)
 
 
 # MARK: UPDATE
+@router.patch(
+    "",
+    summary="Обновить несколько задач",
+    status_code=status.HTTP_200_OK,
+)
+async def update_tasks_route(
+    bulk_data: TaskBulkUpdateSchema = Body(
+        ..., description="Условия выбора задач и данные для их обновления"
+    ),
+    session: AsyncSession = Depends(get_session),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> TaskBulkResultSchema:
+    """
+    Обновляет задачи текущего пользователя, выбранные по списку идентификаторов
+    и/или статусу выполнения, одним запросом к БД. Например, чтобы отметить все
+    задачи выполненными, нужно передать `status: "pending"` и
+    `changes: {"is_completed": true}`.
+
+    Статус `all` без идентификаторов не принимается; количество
+    идентификаторов в запросе ограничено.
+
+    Args:
+        bulk_data: Условия выбора задач и данные для обновления
+        session: Сессия базы данных
+        current_user: Текущий пользователь
+
+    Returns:
+        TaskBulkResultSchema: Идентификаторы и количество обновленных задач
+    """
+    try:
+        return await update_tasks(
+            session=session,
+            task_data=bulk_data.changes,
+            user_id=current_user.id,
+            ids=bulk_data.ids,
+            status=bulk_data.status,
+        )
+    except TaskUpdateException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ex.msg,
+        ) from ex
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(ex),
+        ) from ex
+
+
 @router.patch(
     "/{task_id}",
     summary="Обновить задачу",
@@ -112,7 +631,7 @@ async def update_task_route(
     task_id: int = Path(..., gt=0, description="ID задачи"),
     task_data: TaskUpdateSchema = Body(..., description="Данные для обновления задачи"),
     session: AsyncSession = Depends(get_session),
-    current_user: UserModel = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> TaskResponseSchema:
     """
     Обновляет задачу по идентификатору.
@@ -149,6 +668,61 @@ async def update_task_route(
 
 
 # MARK: DELETE
+@router.delete(
+    "",
+    summary="Удалить несколько задач",
+    status_code=status.HTTP_200_OK,
+)
+async def delete_tasks_route(
+    ids: list[int] | None = Query(
+        None,
+        max_length=TASKS_BATCH_MAX_SIZE,
+        description="Идентификаторы удаляемых задач",
+    ),
+    status_filter: TaskStatusFilter | None = Query(
+        None,
+        alias="status",
+        description="Удалить задачи с указанным статусом выполнения",
+    ),
+    session: AsyncSession = Depends(get_session),
+    current_user: PrincipalSchema = Depends(get_current_principal),
+) -> TaskBulkResultSchema:
+    """
+    Удаляет задачи текущего пользователя, выбранные по списку идентификаторов
+    и/или статусу выполнения, одним запросом к БД. Например, для удаления всех
+    выполненных задач: `DELETE /tasks?status=completed`.
+
+    Статус `all` без идентификаторов не принимается, чтобы случайный запрос
+    не удалил все задачи; количество идентификаторов в запросе ограничено.
+
+    Args:
+        ids: Идентификаторы удаляемых задач
+        status_filter: Статус выполнения удаляемых задач
+        session: Сессия базы данных
+        current_user: Текущий пользователь
+
+    Returns:
+        TaskBulkResultSchema: Идентификаторы и количество удаленных задач
+    """
+    try:
+        return await delete_tasks(
+            session=session,
+            user_id=current_user.id,
+            ids=ids,
+            status=status_filter,
+        )
+    except TaskDeleteException as ex:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=ex.msg,
+        ) from ex
+    except Exception as ex:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=str(ex),
+        ) from ex
+
+
 @router.delete(
     "/{task_id}",
     summary="Удалить задачу",
@@ -157,7 +731,7 @@ async def update_task_route(
 async def delete_task_route(
     task_id: int = Path(..., gt=0, description="ID задачи"),
     session: AsyncSession = Depends(get_session),
-    current_user: UserModel = Depends(get_current_user),
+    current_user: PrincipalSchema = Depends(get_current_principal),
 ) -> None:
     """
     Удаляет задачу по идентификатору.
@@ -10,6 +10,38 @@ class Settings(BaseSettings):
 
     AUTH_SECRET_KEY: str
     ACCESS_TOKEN_EXPIRE_MINUTES: int = Field(1440)
+    # Email пользователей с доступом к служебным эндпоинтам (JSON-список)
+    ADMIN_EMAILS: list[str] = Field([])
+    # Принимать токены, выпущенные до появления claim `uid` (только с `sub`)
+    AUTH_ACCEPT_LEGACY_TOKENS: bool = Field(True)
+
+    # Пул потоков для хэширования паролей и ограничение очереди к нему:
+    # при превышении лимита запрос отклоняется с кодом 503
+    PASSWORD_HASH_WORKERS: int = Field(2)
+    PASSWORD_HASH_MAX_PENDING: int = Field(32)
+
+    # Кэш аутентифицированных пользователей; TTL 0 отключает кэш
+    PRINCIPAL_CACHE_TTL_SECONDS: float = Field(30)
+    PRINCIPAL_CACHE_MAX_SIZE: int = Field(10_000)
+
+    # Кэш страниц списка задач. Хранилище: `memory://` - в памяти процесса
+    # (только для запуска в одном процессе), `redis://host:port/db` - общее
+    # для всех процессов. Ограничения размера действуют для хранилища в памяти
+    TASKS_CACHE_ENABLED: bool = Field(True)
+    TASKS_CACHE_URL: str = Field("memory://")
+    TASKS_CACHE_TTL_SECONDS: float = Field(300)
+    TASKS_CACHE_MAX_SIZE: int = Field(10_000)
+    TASKS_CACHE_MAX_BYTES: int = Field(64 * 1024 * 1024)
+    TASKS_CACHE_TIMEOUT_SECONDS: float = Field(0.5)
+    TASKS_CACHE_POOL_SIZE: int = Field(10)
+    # Сброс кэшей в памяти процесса по уведомлениям LISTEN/NOTIFY от других
+    # процессов; нужен при запуске нескольких процессов приложения
+    CACHE_INVALIDATION_ENABLED: bool = Field(True)
+    # Запрос автодополнения задач, пришедший быстрее этого времени после
+    # предыдущего запроса того же пользователя, ждет столько же: если за это
+    # время пришел более новый запрос, он завершается без обращения к БД.
+    # Первый запрос серии выполняется без задержки; 0 отключает ожидание
+    TASKS_AUTOCOMPLETE_DEBOUNCE_SECONDS: float = Field(0.05)
 
     POSTGRES_USER: str
     POSTGRES_PASSWORD: str
@@ -18,6 +50,41 @@ class Settings(BaseSettings):
     POSTGRES_PORT: int
 
     ASYNC_POSTGRES_URI: PostgresDsn | None = None
+    # DSN реплик для чтения в формате JSON-списка; пустой список отключает
+    # чтение с реплик
+    ASYNC_POSTGRES_REPLICA_URIS: list[str] = Field([])
+    # Время, на которое недоступная реплика исключается из балансировки
+    DB_REPLICA_EJECT_SECONDS: float = Field(30)
+    # Время после записи, в течение которого чтения пользователя выполняются
+    # на основной БД, чтобы он видел свои изменения несмотря на отставание реплик
+    DB_READ_YOUR_WRITES_SECONDS: float = Field(5)
+
+    # Пул соединений с БД: постоянные соединения, дополнительные соединения
+    # сверх них и время ожидания свободного соединения до ошибки
+    DB_POOL_SIZE: int = Field(10)
+    DB_POOL_MAX_OVERFLOW: int = Field(10)
+    DB_POOL_TIMEOUT_SECONDS: float = Field(30)
+    # Соединения старше этого времени переоткрываются; -1 отключает ограничение
+    DB_POOL_RECYCLE_SECONDS: int = Field(1800)
+    # Проверять соединение перед выдачей из пула (лишний запрос SELECT 1)
+    DB_POOL_PRE_PING: bool = Field(True)
+    DB_CONNECT_TIMEOUT_SECONDS: float = Field(5)
+    # Количество соединений, открываемых при запуске приложения
+    DB_POOL_WARMUP_CONNECTIONS: int = Field(5)
+    # Кэши подготовленных выражений asyncpg и SQLAlchemy на соединение;
+    # при работе через pgbouncer в режиме transaction оба нужно обнулить
+    DB_STATEMENT_CACHE_SIZE: int = Field(100)
+    DB_PREPARED_STATEMENT_CACHE_SIZE: int = Field(100)
+
+    # Запросы к БД дольше порога записываются в лог; 0 отключает журнал.
+    # Для доли медленных запросов на чтение снимается план EXPLAIN ANALYZE
+    # (запрос выполняется повторно); планы доступны администраторам
+    SLOW_QUERY_THRESHOLD_SECONDS: float = Field(0.5)
+    SLOW_QUERY_EXPLAIN_SAMPLE_RATE: float = Field(0)
+    SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS: float = Field(10)
+    # Возвращать в заголовке Server-Timing количество и время запросов к БД;
+    # раскрывает клиентам сведения о работе сервера
+    SERVER_TIMING_ENABLED: bool = Field(False)
 
     LOGFIRE_TOKEN: str | None = Field(None)
     LOGFIRE_SERVICE_NAME: str = Field("Backend")
@@ -5,3 +5,40 @@ from sqlalchemy import TextClause, text
 AUTH_ALGORITHM: str = "HS256"
 
 CURRENT_TIMESTAMP_UTC: TextClause = text("(CURRENT_TIMESTAMP AT TIME ZONE 'UTC')")
+
+RECENT_WRITERS_CACHE_MAX_SIZE: int = 100_000
+
+# Канал LISTEN/NOTIFY для сброса кэшей в других процессах приложения
+INVALIDATION_CHANNEL: str = "todo_invalidate"
+INVALIDATION_RECONNECT_MIN_SECONDS: float = 0.5
+INVALIDATION_RECONNECT_MAX_SECONDS: float = 30
+INVALIDATION_KEEPALIVE_SECONDS: float = 15
+
+# Максимальная длина текста запроса к БД в атрибутах span и логах
+QUERY_STATEMENT_MAX_LENGTH: int = 1000
+# Количество хранимых планов медленных запросов и одновременно снимаемых планов
+SLOW_QUERY_PLANS_MAX_SIZE: int = 100
+SLOW_QUERY_EXPLAIN_MAX_CONCURRENCY: int = 2
+
+TASKS_PAGE_DEFAULT_LIMIT: int = 100
+TASKS_PAGE_MAX_LIMIT: int = 1000
+TASKS_BATCH_MAX_SIZE: int = 1000
+TASKS_EXPORT_CHUNK_SIZE: int = 1000
+TASKS_IMPORT_CHUNK_SIZE: int = 5000
+TASKS_IMPORT_MAX_ERRORS: int = 100
+TASKS_IMPORT_MAX_LINE_SIZE: int = 64 * 1024
+
+# Конфигурация полнотекстового поиска PostgreSQL для задач. При ее изменении
+# нужна миграция: она используется в выражении столбца tasks.search_vector
+TASKS_SEARCH_CONFIG: str = "russian"
+TASKS_SEARCH_DEFAULT_LIMIT: int = 20
+TASKS_SEARCH_MAX_LIMIT: int = 100
+TASKS_SEARCH_QUERY_MAX_LENGTH: int = 256
+# Автодополнение по заголовкам задач. Из запроса короче трех символов не
+# извлекаются триграммы, и индекс ix_tasks_user_id_title_trgm читается
+# по всем задачам пользователя
+TASKS_AUTOCOMPLETE_DEFAULT_LIMIT: int = 10
+TASKS_AUTOCOMPLETE_MAX_LIMIT: int = 20
+TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH: int = 3
+TASKS_AUTOCOMPLETE_QUERY_MAX_LENGTH: int = 100
+TASKS_AUTOCOMPLETE_DEBOUNCE_MAX_USERS: int = 10_000
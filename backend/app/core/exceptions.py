@@ -1,4 +1,4 @@
-"""Содержит базовый класс для исключений приложения."""
+"""Содержит базовые классы для исключений приложения."""
 
 
 class CustomException(Exception):
@@ -14,3 +14,14 @@ class CustomException(Exception):
 
     def __str__(self) -> str:
         return self.msg
+
+
+class ServiceOverloadedException(CustomException):
+    """Сервис перегружен и временно не принимает новые запросы."""
+
+    def __init__(
+        self,
+        *,
+        msg: str = "Сервис перегружен, повторите запрос позже",
+    ):
+        super().__init__(msg=msg)
@@ -0,0 +1,140 @@
+"""
+Содержит метрики Prometheus, собираемые приложением.
+
+Метрики регистрируются в реестре `prometheus_client` по умолчанию, поэтому
+отдаются на эндпоинте `/metrics` вместе с метриками `Instrumentator`.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+CACHE_HITS = Counter(
+    "cache_hits_total",
+    "Количество попаданий в кэш",
+    ["cache"],
+)
+CACHE_MISSES = Counter(
+    "cache_misses_total",
+    "Количество промахов кэша",
+    ["cache"],
+)
+CACHE_ENTRIES = Gauge(
+    "cache_entries",
+    "Количество записей в кэше",
+    ["cache"],
+)
+CACHE_SIZE_BYTES = Gauge(
+    "cache_size_bytes",
+    "Суммарный размер записей в кэше",
+    ["cache"],
+)
+CACHE_ERRORS = Counter(
+    "cache_errors_total",
+    "Количество ошибок обращения к внешнему хранилищу кэша",
+    ["cache"],
+)
+CACHE_INVALIDATION_MESSAGES = Counter(
+    "cache_invalidation_messages_total",
+    "Количество полученных уведомлений о сбросе кэшей пользователя",
+)
+CACHE_INVALIDATION_GAPS = Counter(
+    "cache_invalidation_gaps_total",
+    "Количество сбросов всех кэшей процесса из-за возможной потери уведомлений",
+)
+CACHE_INVALIDATION_LISTENER_UP = Gauge(
+    "cache_invalidation_listener_up",
+    "Подписан ли процесс на уведомления о сбросе кэшей",
+)
+
+DB_POOL_CHECKOUT_SECONDS = Histogram(
+    "db_pool_checkout_seconds",
+    "Время ожидания соединения из пула соединений с БД",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0),
+)
+DB_CONNECTION_HOLD_SECONDS = Histogram(
+    "db_connection_hold_seconds",
+    "Время от выдачи соединения из пула до его возврата в пул",
+    ["pool"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+DB_POOL_TIMEOUTS = Counter(
+    "db_pool_timeouts_total",
+    "Количество запросов соединения, не дождавшихся свободного соединения",
+    ["pool"],
+)
+DB_POOL_SIZE = Gauge(
+    "db_pool_size",
+    "Количество постоянных соединений в пуле",
+    ["pool"],
+)
+DB_POOL_CHECKED_OUT = Gauge(
+    "db_pool_checked_out",
+    "Количество соединений, выданных из пула",
+    ["pool"],
+)
+DB_POOL_OVERFLOW = Gauge(
+    "db_pool_overflow",
+    "Количество дополнительных соединений, открытых сверх размера пула",
+    ["pool"],
+)
+
+DB_REQUEST_QUERIES = Histogram(
+    "db_request_queries",
+    "Количество запросов к БД при обработке HTTP-запроса",
+    ["method", "route"],
+    buckets=(0, 1, 2, 3, 5, 10, 20, 50, 100, 250),
+)
+DB_REQUEST_SECONDS = Histogram(
+    "db_request_seconds",
+    "Суммарное время запросов к БД при обработке HTTP-запроса",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+DB_REQUEST_SLOWEST_QUERY_SECONDS = Histogram(
+    "db_request_slowest_query_seconds",
+    "Время самого долгого запроса к БД при обработке HTTP-запроса",
+    ["method", "route"],
+    buckets=(0.001, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+
+DB_SLOW_QUERIES = Counter(
+    "db_slow_queries_total",
+    "Количество запросов к БД, выполнявшихся дольше SLOW_QUERY_THRESHOLD_SECONDS",
+)
+
+DB_REPLICA_EJECTIONS = Counter(
+    "db_replica_ejections_total",
+    "Количество исключений реплики из балансировки из-за ошибки соединения",
+    ["pool"],
+)
+DB_READ_SESSIONS = Counter(
+    "db_read_sessions_total",
+    "Количество сессий для чтения по типу БД (primary или replica)",
+    ["target"],
+)
+
+DEBOUNCED_CALLS = Counter(
+    "debounced_calls_total",
+    "Количество операций, пропущенных из-за более новой операции с тем же ключом",
+    ["name"],
+)
+
+PASSWORD_HASH_PENDING = Gauge(
+    "password_hash_pending",
+    "Количество операций с хэшами паролей, выполняемых или ожидающих в очереди",
+)
+PASSWORD_HASH_REJECTED = Counter(
+    "password_hash_rejected_total",
+    "Количество операций с хэшами паролей, отклонённых из-за переполнения очереди",
+)
+PASSWORD_HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Время выполнения операций с хэшами паролей в пуле потоков",
+    ["operation"],
+    buckets=(0.05, 0.1, 0.2, 0.3, 0.5, 0.75, 1.0, 2.0, 5.0),
+)
+PASSWORD_HASH_WAIT_SECONDS = Histogram(
+    "password_hash_wait_seconds",
+    "Время ожидания операции с хэшем пароля в очереди пула потоков",
+    buckets=(0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0),
+)
@@ -1,10 +1,30 @@
 from app.db.base_dao import BaseDAO
-from app.db.session import get_session
+from app.db.invalidation import InvalidationListener, publish_invalidation
+from app.db.session import (
+    get_session,
+    get_session_maker,
+    get_slow_query_log,
+    mark_user_write,
+    open_read_session,
+    release_connection,
+    select_read_session_maker,
+)
+from app.db.slow_queries import SlowQueryLog, SlowQueryPlan
 from app.db.task_dao import TaskDAO
 from app.db.user_dao import UserDAO
 
 __all__ = [
     "get_session",
+    "get_session_maker",
+    "get_slow_query_log",
+    "select_read_session_maker",
+    "open_read_session",
+    "release_connection",
+    "mark_user_write",
+    "publish_invalidation",
+    "InvalidationListener",
+    "SlowQueryLog",
+    "SlowQueryPlan",
     "BaseDAO",
     "UserDAO",
     "TaskDAO",
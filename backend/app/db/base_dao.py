@@ -1,8 +1,18 @@
-from typing import Any, Generic, TypeVar
+from typing import Any, AsyncIterator, Generic, Sequence, TypeVar
 
 from pydantic import BaseModel as PydanticBaseModel
-from sqlalchemy import delete, insert, select, update
+from sqlalchemy import (
+    RowMapping,
+    Select,
+    Update,
+    delete,
+    insert,
+    select,
+    tuple_,
+    update,
+)
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
 
 from app.models import BaseModel as SQLAlchemyBaseModel
 
@@ -42,6 +52,71 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         result = await session.execute(stmt)
         return result.scalars().first()
 
+    @classmethod
+    async def add_many(
+        cls,
+        session: AsyncSession,
+        objs_in: Sequence[CreateSchemaType | dict[str, Any]],
+    ) -> list[ModelType]:
+        """Добавляет несколько объектов в базу данных одним запросом INSERT.
+
+        Объекты с одинаковым набором полей вставляются одним многострочным
+        INSERT ... RETURNING, поэтому для максимальной эффективности все объекты
+        должны содержать одни и те же поля.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            objs_in: Данные для создания объектов (схемы Pydantic или словари)
+
+        Returns:
+            Созданные объекты в том же порядке, что и входные данные
+        """
+
+        if not objs_in:
+            return []
+
+        create_data = [
+            (
+                obj_in
+                if isinstance(obj_in, dict)
+                else obj_in.model_dump(exclude_unset=True)
+            )
+            for obj_in in objs_in
+        ]
+
+        stmt = insert(cls.model).returning(cls.model, sort_by_parameter_order=True)
+        result = await session.scalars(stmt, create_data)
+        return list(result.all())
+
+    @classmethod
+    async def copy_records(
+        cls,
+        session: AsyncSession,
+        records: Sequence[tuple],
+        *,
+        columns: Sequence[str],
+    ) -> None:
+        """Загружает строки в таблицу модели командой COPY в рамках текущей
+        транзакции сессии. COPY передает строки в бинарном формате одним
+        потоком и работает на порядок быстрее INSERT, но не возвращает
+        созданные строки. Столбцы, не указанные в `columns`, получают значения
+        по умолчанию на стороне БД.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            records: Значения столбцов загружаемых строк
+            columns: Имена загружаемых столбцов
+        """
+
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        # Команда COPY доступна только через драйвер asyncpg
+        await raw_connection.driver_connection.copy_records_to_table(
+            cls.model.__tablename__,
+            records=records,
+            columns=columns,
+        )
+
     # MARK: Read
     @classmethod
     async def find_one_or_none(
@@ -72,6 +147,9 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         *filter,
         offset: int | None = None,
         limit: int | None = None,
+        order_by: Sequence[InstrumentedAttribute] | None = None,
+        descending: bool = False,
+        after: Sequence[Any] | None = None,
         **filter_by,
     ) -> list[ModelType] | None:
         """Находит все объекты, соответствующие условиям фильтрации.
@@ -81,13 +159,171 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             filter: Условия фильтрации
             offset: Смещение для пагинации
             limit: Ограничение количества возвращаемых объектов
+            order_by: Столбцы, задающие порядок сортировки (ключ keyset-пагинации)
+            descending: Сортировать по убыванию ключа сортировки
+            after: Значения ключа сортировки последнего объекта предыдущей
+                страницы; возвращаются только объекты, следующие за ним
             filter_by: Именованные условия фильтрации
 
         Returns:
             Список найденных объектов или None
         """
 
-        stmt = select(cls.model).filter(*filter).filter_by(**filter_by)
+        stmt = cls.build_select(
+            *filter,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            **filter_by,
+        )
+        result = await session.execute(stmt)
+        return result.scalars().all()
+
+    @classmethod
+    async def find_all_mappings(
+        cls,
+        session: AsyncSession,
+        *filter,
+        columns: Sequence[InstrumentedAttribute] | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        order_by: Sequence[InstrumentedAttribute] | None = None,
+        descending: bool = False,
+        after: Sequence[Any] | None = None,
+        **filter_by,
+    ) -> Sequence[RowMapping]:
+        """Находит все объекты, соответствующие условиям фильтрации, и возвращает
+        их столбцы в виде словарей, не создавая экземпляры модели. Используется
+        на путях чтения, где объекты ORM не нужны: результат не попадает в
+        identity map сессии и не отслеживается ею.
+
+        Args:
+            columns: Загружаемые столбцы; по умолчанию все столбцы таблицы
+            Остальные аргументы совпадают с аргументами `find_all`.
+
+        Returns:
+            Список строк в виде словарей «имя столбца — значение»
+        """
+
+        stmt = cls.build_select(
+            *filter,
+            columns=columns or cls.model.__table__.columns,
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+            **filter_by,
+        )
+        result = await session.execute(stmt)
+        return result.mappings().all()
+
+    @classmethod
+    async def stream_mappings(
+        cls,
+        session: AsyncSession,
+        *filter,
+        columns: Sequence[InstrumentedAttribute] | None = None,
+        order_by: Sequence[InstrumentedAttribute] | None = None,
+        chunk_size: int = 1000,
+        **filter_by,
+    ) -> AsyncIterator[Sequence[RowMapping]]:
+        """Читает объекты, соответствующие условиям фильтрации, через серверный
+        курсор и отдаёт их пачками по `chunk_size` строк. В памяти одновременно
+        находится не больше одной пачки, а первая пачка доступна до того, как
+        БД вернёт все строки.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            filter: Условия фильтрации
+            columns: Загружаемые столбцы; по умолчанию все столбцы таблицы
+            order_by: Столбцы, задающие порядок сортировки
+            chunk_size: Количество строк, получаемых из курсора за один раз
+            filter_by: Именованные условия фильтрации
+
+        Yields:
+            Пачки строк в виде словарей «имя столбца — значение»
+        """
+
+        stmt = cls.build_select(
+            *filter,
+            columns=columns or cls.model.__table__.columns,
+            order_by=order_by,
+            **filter_by,
+        ).execution_options(yield_per=chunk_size)
+
+        result = await session.stream(stmt)
+        async for partition in result.mappings().partitions():
+            yield partition
+
+    @classmethod
+    def build_select(
+        cls,
+        *filter,
+        columns: Sequence[Any] | None = None,
+        offset: int | None = None,
+        limit: int | None = None,
+        order_by: Sequence[InstrumentedAttribute] | None = None,
+        descending: bool = False,
+        after: Sequence[Any] | None = None,
+        **filter_by,
+    ) -> Select:
+        """Строит запрос SELECT, выполняемый `find_all` и `find_all_mappings`.
+        Построение запроса отделено от выполнения, чтобы его можно было
+        проверять и замерять без обращения к БД.
+
+        Args:
+            columns: Выбираемые столбцы; по умолчанию - объекты модели
+            Остальные аргументы совпадают с аргументами `find_all`.
+
+        Returns:
+            Запрос SELECT
+        """
+
+        return cls._paginate(
+            select(*(columns or (cls.model,))).filter(*filter).filter_by(**filter_by),
+            offset=offset,
+            limit=limit,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+        )
+
+    @classmethod
+    def _paginate(
+        cls,
+        stmt: Select,
+        *,
+        offset: int | None,
+        limit: int | None,
+        order_by: Sequence[InstrumentedAttribute] | None,
+        descending: bool,
+        after: Sequence[Any] | None,
+    ) -> Select:
+        """Добавляет к запросу сортировку и пагинацию (см. `find_all`)."""
+
+        if after is not None and not order_by:
+            raise ValueError("Для keyset-пагинации необходимо указать order_by")
+
+        if order_by:
+            # Все столбцы сортируются в одном направлении, поэтому индекс по
+            # ключу сортировки можно читать как в прямом, так и в обратном порядке
+            if descending:
+                stmt = stmt.order_by(*(column.desc() for column in order_by))
+            else:
+                stmt = stmt.order_by(*order_by)
+
+            # Keyset-пагинация: сравниваем кортеж ключа сортировки с ключом
+            # последней строки предыдущей страницы. В отличие от OFFSET, такой
+            # запрос проходит по индексу сразу к нужной позиции, поэтому его
+            # стоимость не зависит от номера страницы.
+            if after is not None:
+                key = tuple_(*order_by)
+                stmt = stmt.filter(
+                    key < tuple(after) if descending else key > tuple(after)
+                )
 
         if offset is not None:
             stmt = stmt.offset(offset)
@@ -95,8 +331,7 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         if limit is not None:
             stmt = stmt.limit(limit)
 
-        result = await session.execute(stmt)
-        return result.scalars().all()
+        return stmt
 
     # MARK: Update
     @classmethod
@@ -117,16 +352,55 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
             Обновленный объект или None
         """
 
+        stmt = cls.build_update(*where, obj_in=obj_in).returning(cls.model)
+        result = await session.execute(stmt)
+        return result.scalars().one_or_none()
+
+    @classmethod
+    async def update_many(
+        cls,
+        session: AsyncSession,
+        *where,
+        obj_in: UpdateSchemaType | dict[str, Any],
+    ) -> list[int]:
+        """Обновляет все объекты, соответствующие условиям, одним запросом UPDATE.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            where: Условия для выбора обновляемых объектов
+            obj_in: Данные для обновления (схема Pydantic или словарь)
+
+        Returns:
+            Список идентификаторов обновленных объектов
+        """
+
+        stmt = cls.build_update(*where, obj_in=obj_in).returning(cls.model.id)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
+
+    @classmethod
+    def build_update(
+        cls,
+        *where,
+        obj_in: UpdateSchemaType | dict[str, Any],
+    ) -> Update:
+        """Строит запрос UPDATE, выполняемый `update` и `update_many`, без
+        RETURNING (см. `build_select`).
+
+        Args:
+            where: Условия для выбора обновляемых объектов
+            obj_in: Данные для обновления (схема Pydantic или словарь)
+
+        Returns:
+            Запрос UPDATE
+        """
+
         if isinstance(obj_in, dict):
             update_data = obj_in
         else:
             update_data = obj_in.model_dump(exclude_unset=True)
 
-        stmt = (
-            update(cls.model).where(*where).values(**update_data).returning(cls.model)
-        )
-        result = await session.execute(stmt)
-        return result.scalars().one_or_none()
+        return update(cls.model).where(*where).values(**update_data)
 
     # MARK: Delete
     @classmethod
@@ -150,3 +424,31 @@ class BaseDAO(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         stmt = delete(cls.model).filter(*filter).filter_by(**filter_by)
         result = await session.execute(stmt)
         return result.rowcount
+
+    @classmethod
+    async def delete_many(
+        cls,
+        session: AsyncSession,
+        *filter,
+        **filter_by,
+    ) -> list[int]:
+        """Удаляет объекты, соответствующие условиям фильтрации, одним запросом
+        DELETE и возвращает их идентификаторы.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            filter: Условия фильтрации
+            filter_by: Именованные условия фильтрации
+
+        Returns:
+            Список идентификаторов удаленных объектов
+        """
+
+        stmt = (
+            delete(cls.model)
+            .filter(*filter)
+            .filter_by(**filter_by)
+            .returning(cls.model.id)
+        )
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
@@ -0,0 +1,103 @@
+"""
+Содержит учет запросов к БД, выполненных при обработке HTTP-запроса.
+
+Обработчики событий движка суммируют количество и время запросов в объекте
+`QueryStats` из контекстной переменной `query_stats`. Объект создается
+middleware на время обработки HTTP-запроса; вне запроса (фоновые задачи,
+утилиты) переменная пуста и запросы не учитываются. Медленные запросы
+передаются в журнал `SlowQueryLog` независимо от того, выполнены ли они при
+обработке HTTP-запроса.
+"""
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any, Mapping
+
+from sqlalchemy import event
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.constants import QUERY_STATEMENT_MAX_LENGTH
+from app.db.slow_queries import SlowQueryLog
+
+
+@dataclass
+class QueryStats:
+    """Статистика запросов к БД, выполненных при обработке HTTP-запроса."""
+
+    count: int = 0
+    seconds: float = 0.0
+    slowest_seconds: float = 0.0
+    slowest_statement: str | None = None
+    # ASGI scope запроса: маршрут записывается в него при сопоставлении пути
+    scope: Mapping[str, Any] | None = field(default=None, repr=False)
+
+    @property
+    def route(self) -> str | None:
+        """Шаблон пути маршрута или None, если маршрут еще не определен."""
+
+        route = self.scope.get("route") if self.scope is not None else None
+        return route.path if route is not None else None
+
+    def add(self, statement: str, seconds: float) -> None:
+        self.count += 1
+        self.seconds += seconds
+        if seconds > self.slowest_seconds:
+            self.slowest_seconds = seconds
+            self.slowest_statement = statement[:QUERY_STATEMENT_MAX_LENGTH]
+
+
+query_stats: ContextVar[QueryStats | None] = ContextVar("query_stats", default=None)
+
+
+def _finish_query(conn, statement: str) -> tuple[float, QueryStats | None]:
+    seconds = time.perf_counter() - conn.info["query_started_at"].pop()
+    stats = query_stats.get()
+    if stats is not None:
+        stats.add(statement, seconds)
+    return seconds, stats
+
+
+def register_query_instrumentation(
+    engine: AsyncEngine,
+    *,
+    slow_query_log: SlowQueryLog | None = None,
+) -> None:
+    """
+    Регистрирует обработчики событий движка, учитывающие запросы в
+    `query_stats` и передающие успешно выполненные запросы в `slow_query_log`.
+    Время запроса измеряется от отправки до получения результата драйвером;
+    запросы, завершившиеся ошибкой, тоже учитываются в статистике.
+
+    Контекстная переменная доступна в обработчиках, так как SQLAlchemy
+    выполняет синхронный код асинхронного движка в greenlet с контекстом
+    вызывающей задачи.
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+        slow_query_log (SlowQueryLog | None): Журнал медленных запросов.
+    """
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def on_before_execute(conn, cursor, statement, parameters, context, executemany):
+        conn.info.setdefault("query_started_at", []).append(time.perf_counter())
+
+    @event.listens_for(engine.sync_engine, "after_cursor_execute")
+    def on_after_execute(conn, cursor, statement, parameters, context, executemany):
+        seconds, stats = _finish_query(conn, statement)
+        if slow_query_log is not None:
+            slow_query_log.observe(
+                engine,
+                statement=statement,
+                parameters=parameters,
+                executemany=executemany,
+                seconds=seconds,
+                route=stats.route if stats is not None else None,
+            )
+
+    @event.listens_for(engine.sync_engine, "handle_error")
+    def on_error(exception_context):
+        conn = exception_context.connection
+        # Ошибка могла произойти до отправки запроса (например, при подключении)
+        if conn is not None and conn.info.get("query_started_at"):
+            _finish_query(conn, exception_context.statement or "")
@@ -0,0 +1,185 @@
+"""
+Содержит шину сброса кэшей между процессами приложения через
+LISTEN/NOTIFY PostgreSQL.
+
+Сервисы, изменяющие данные пользователя, публикуют в канал
+`INVALIDATION_CHANNEL` уведомление с его ID (и, если он известен, email в
+виде `ID:email`), а каждый процесс слушает канал на отдельном соединении и
+сбрасывает свои кэши этого пользователя.
+"""
+
+import asyncio
+import logging
+from typing import Awaitable, Callable
+
+import asyncpg
+from sqlalchemy import func, select
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.core.constants import INVALIDATION_CHANNEL
+from app.core.metrics import (
+    CACHE_INVALIDATION_GAPS,
+    CACHE_INVALIDATION_LISTENER_UP,
+    CACHE_INVALIDATION_MESSAGES,
+)
+
+logger = logging.getLogger(__name__)
+
+
+async def publish_invalidation(
+    session: AsyncSession,
+    *,
+    user_id: int,
+    email: str | None = None,
+) -> None:
+    """
+    Публикует уведомление об изменении данных пользователя в текущей
+    транзакции. PostgreSQL доставляет уведомление только после фиксации
+    транзакции и не доставляет при ее откате, поэтому функция вызывается
+    перед `commit`.
+
+    Args:
+        session (AsyncSession): Сессия, в которой изменяются данные.
+        user_id (int): ID пользователя.
+        email (str | None): Email пользователя; нужен, если изменились данные,
+            закэшированные по email (например, для токенов без `uid`).
+    """
+
+    payload = str(user_id) if email is None else f"{user_id}:{email}"
+    await session.execute(select(func.pg_notify(INVALIDATION_CHANNEL, payload)))
+
+
+class InvalidationListener:
+    """
+    Слушает канал `INVALIDATION_CHANNEL` на отдельном соединении asyncpg и
+    вызывает `on_message` с ID и email (или None) пользователя из каждого
+    уведомления.
+
+    Пока соединение разорвано, уведомления теряются, поэтому при обнаружении
+    разрыва и после повторной подписки вызывается `on_gap`, который должен
+    сбросить все кэши процесса. Переподключение выполняется с экспоненциально
+    растущей задержкой. Живость соединения проверяется запросом раз в
+    `keepalive_seconds`, так как без запросов разрыв соединения может долго
+    оставаться незамеченным.
+    """
+
+    def __init__(
+        self,
+        *,
+        url: str,
+        on_message: Callable[[int, str | None], Awaitable[None]],
+        on_gap: Callable[[], Awaitable[None]],
+        connect_timeout: float,
+        min_backoff: float,
+        max_backoff: float,
+        keepalive_seconds: float,
+    ):
+        """
+        Args:
+            url (str): URL основной БД в формате SQLAlchemy.
+            on_message (Callable): Сбрасывает кэши пользователя по его ID и
+                email.
+            on_gap (Callable): Сбрасывает все кэши процесса.
+            connect_timeout (float): Время ожидания подключения в секундах.
+            min_backoff (float): Задержка перед первой попыткой переподключения.
+            max_backoff (float): Максимальная задержка между попытками.
+            keepalive_seconds (float): Интервал проверки соединения.
+        """
+
+        # asyncpg принимает DSN без указания драйвера SQLAlchemy
+        self.dsn = make_url(url).set(drivername="postgresql")
+        self.on_message = on_message
+        self.on_gap = on_gap
+        self.connect_timeout = connect_timeout
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.keepalive_seconds = keepalive_seconds
+
+        self._task: asyncio.Task | None = None
+        self._backoff = min_backoff
+
+    def start(self) -> None:
+        """Запускает прослушивание канала в фоновой задаче."""
+
+        if self._task is None:
+            self._task = asyncio.create_task(self._run(), name="invalidation-listener")
+
+    async def stop(self) -> None:
+        """Останавливает прослушивание и закрывает соединение."""
+
+        if self._task is None:
+            return
+
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    async def _run(self) -> None:
+        self._backoff = self.min_backoff
+
+        while True:
+            try:
+                await self._listen()
+            except Exception:
+                logger.warning(
+                    "Соединение для сброса кэшей разорвано, повтор через %.1f с",
+                    self._backoff,
+                    exc_info=True,
+                )
+
+            await self._handle_gap()
+            await asyncio.sleep(self._backoff)
+            self._backoff = min(self._backoff * 2, self.max_backoff)
+
+    async def _listen(self) -> None:
+        connection = await asyncpg.connect(
+            self.dsn.render_as_string(hide_password=False),
+            timeout=self.connect_timeout,
+        )
+        try:
+            await connection.add_listener(INVALIDATION_CHANNEL, self._on_notification)
+            CACHE_INVALIDATION_LISTENER_UP.set(1)
+            self._backoff = self.min_backoff
+            # Уведомления, отправленные до подписки, не будут получены
+            await self._handle_gap()
+
+            while not connection.is_closed():
+                await asyncio.sleep(self.keepalive_seconds)
+                await connection.fetchval("SELECT 1", timeout=self.connect_timeout)
+
+            raise ConnectionError("Соединение закрыто сервером")
+        finally:
+            CACHE_INVALIDATION_LISTENER_UP.set(0)
+            connection.terminate()
+
+    async def _on_notification(
+        self,
+        connection: asyncpg.Connection,
+        pid: int,
+        channel: str,
+        payload: str,
+    ) -> None:
+        # ID состоит из цифр, поэтому email отделяется по первому двоеточию
+        raw_user_id, _, email = payload.partition(":")
+        try:
+            user_id = int(raw_user_id)
+        except ValueError:
+            logger.warning("Некорректное уведомление о сбросе кэша: %r", payload)
+            return
+
+        CACHE_INVALIDATION_MESSAGES.inc()
+        try:
+            await self.on_message(user_id, email or None)
+        except Exception:
+            logger.exception("Ошибка сброса кэшей пользователя %s", user_id)
+
+    async def _handle_gap(self) -> None:
+        CACHE_INVALIDATION_GAPS.inc()
+        try:
+            await self.on_gap()
+        except Exception:
+            logger.exception("Ошибка сброса кэшей процесса")
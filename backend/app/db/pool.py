@@ -0,0 +1,101 @@
+"""Содержит пул соединений с БД, собирающий метрики Prometheus."""
+
+import asyncio
+import time
+
+from sqlalchemy import event
+from sqlalchemy.exc import TimeoutError
+from sqlalchemy.ext.asyncio import AsyncEngine
+from sqlalchemy.pool import AsyncAdaptedQueuePool
+
+from app.core.metrics import (
+    DB_CONNECTION_HOLD_SECONDS,
+    DB_POOL_CHECKED_OUT,
+    DB_POOL_CHECKOUT_SECONDS,
+    DB_POOL_OVERFLOW,
+    DB_POOL_SIZE,
+    DB_POOL_TIMEOUTS,
+)
+
+
+class InstrumentedQueuePool(AsyncAdaptedQueuePool):
+    """
+    Пул соединений, измеряющий время ожидания соединения и считающий запросы,
+    не дождавшиеся соединения. Метрики помечаются именем пула, которое
+    задается параметром `pool_logging_name` движка.
+    """
+
+    def _do_get(self):
+        pool = self.logging_name or "default"
+        started_at = time.perf_counter()
+        try:
+            return super()._do_get()
+        except TimeoutError:
+            DB_POOL_TIMEOUTS.labels(pool=pool).inc()
+            raise
+        finally:
+            DB_POOL_CHECKOUT_SECONDS.labels(pool=pool).observe(
+                time.perf_counter() - started_at
+            )
+
+
+def register_pool_metrics(engine: AsyncEngine, *, name: str) -> None:
+    """
+    Регистрирует метрики пула соединений движка. Значения состояния пула
+    вычисляются при каждом сборе метрик; пул берется из движка в момент сбора,
+    поэтому метрики остаются верными после пересоздания пула (`dispose`).
+    Время удержания соединений измеряется по событиям пула.
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+        name (str): Имя пула в метриках.
+    """
+
+    DB_POOL_SIZE.labels(pool=name).set_function(lambda: engine.pool.size())
+    DB_POOL_CHECKED_OUT.labels(pool=name).set_function(lambda: engine.pool.checkedout())
+    # До открытия первого соединения overflow() отрицателен
+    DB_POOL_OVERFLOW.labels(pool=name).set_function(
+        lambda: max(engine.pool.overflow(), 0)
+    )
+
+    # Время удержания соединения показывает, как долго запросы держат
+    # соединение: оно должно возвращаться в пул до сериализации ответа
+    hold_seconds = DB_CONNECTION_HOLD_SECONDS.labels(pool=name)
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def on_checkout(dbapi_connection, connection_record, connection_proxy):
+        connection_record.info["checked_out_at"] = time.perf_counter()
+
+    @event.listens_for(engine.sync_engine, "checkin")
+    def on_checkin(dbapi_connection, connection_record):
+        checked_out_at = connection_record.info.pop("checked_out_at", None)
+        if checked_out_at is not None:
+            hold_seconds.observe(time.perf_counter() - checked_out_at)
+
+
+async def warmup_pool(engine: AsyncEngine, *, connections: int) -> None:
+    """
+    Заранее открывает соединения с БД и возвращает их в пул, чтобы первые
+    запросы после запуска приложения не ждали установки соединений.
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+        connections (int): Количество открываемых соединений; ограничивается
+            размером пула, так как соединения сверх него при возврате в пул
+            закрываются.
+    """
+
+    size = min(connections, engine.pool.size())
+    async_connections = [engine.connect() for _ in range(size)]
+    try:
+        # Соединения открываются одновременно, иначе каждое следующее
+        # соединение просто брало бы из пула предыдущее
+        await asyncio.gather(*(connection.start() for connection in async_connections))
+    finally:
+        await asyncio.gather(
+            *(
+                connection.close()
+                for connection in async_connections
+                if connection.sync_connection is not None
+            )
+        )
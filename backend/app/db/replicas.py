@@ -0,0 +1,137 @@
+"""Содержит сессии только для чтения и балансировку чтений между репликами БД."""
+
+import logging
+from time import monotonic
+from typing import Sequence
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from app.core.metrics import DB_REPLICA_EJECTIONS
+
+logger = logging.getLogger(__name__)
+
+
+def make_read_session_maker(
+    engine: AsyncEngine,
+    *,
+    streaming: bool = False,
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Создает фабрику сессий только для чтения. Сессии помечаются
+    `info["read_only"]`, что позволяет вернуть их соединение в пул сразу после
+    последнего запроса (см. `release_connection`).
+
+    Обычные сессии работают в режиме автокоммита: запросы выполняются без
+    BEGIN и ROLLBACK, что экономит два обращения к БД на запрос. Серверным
+    курсорам PostgreSQL нужна транзакция, поэтому сессии для потокового чтения
+    (`streaming=True`) открывают транзакцию только для чтения (BEGIN READ ONLY).
+
+    Args:
+        engine (AsyncEngine): Движок БД.
+        streaming (bool): Создавать сессии для чтения через серверный курсор.
+    Returns:
+        async_sessionmaker[AsyncSession]: Фабрика сессий.
+    """
+
+    if streaming:
+        bind = engine.execution_options(postgresql_readonly=True)
+    else:
+        bind = engine.execution_options(isolation_level="AUTOCOMMIT")
+
+    return async_sessionmaker(
+        bind=bind,
+        autoflush=False,
+        expire_on_commit=False,
+        class_=AsyncSession,
+        info={"read_only": True},
+    )
+
+
+class ReplicaRouter:
+    """
+    Распределяет сессии для чтения между репликами по кругу. Реплика, к которой
+    не удалось подключиться, исключается из балансировки на `eject_seconds`.
+
+    Балансировщик используется из одного event loop, поэтому блокировки не нужны.
+    """
+
+    def __init__(
+        self,
+        engines: Sequence[AsyncEngine],
+        *,
+        eject_seconds: float,
+    ):
+        self.engines = list(engines)
+        self.eject_seconds = eject_seconds
+        self._session_makers = [
+            make_read_session_maker(engine) for engine in self.engines
+        ]
+        self._streaming_session_makers = [
+            make_read_session_maker(engine, streaming=True) for engine in self.engines
+        ]
+        self._next = 0
+        self._ejected_until: dict[int, float] = {}
+
+    def __len__(self) -> int:
+        return len(self.engines)
+
+    def next_index(self) -> int | None:
+        """Возвращает номер следующей доступной реплики или None, если доступных нет."""
+
+        now = monotonic()
+        for _ in range(len(self.engines)):
+            index = self._next
+            self._next = (self._next + 1) % len(self.engines)
+            if self._ejected_until.get(index, 0) <= now:
+                return index
+        return None
+
+    def streaming_session_maker(self) -> async_sessionmaker[AsyncSession] | None:
+        """
+        Возвращает фабрику сессий для потокового чтения со следующей доступной
+        реплики без проверки соединения или None, если доступных реплик нет.
+        """
+
+        index = self.next_index()
+        return None if index is None else self._streaming_session_makers[index]
+
+    async def open_session(self) -> AsyncSession | None:
+        """
+        Открывает сессию на следующей доступной реплике. Соединение берется
+        сразу, чтобы недоступная реплика была обнаружена и исключена до
+        выполнения запросов, а сессия открыта на следующей реплике.
+
+        Returns:
+            AsyncSession | None: Сессия или None, если доступных реплик нет.
+        """
+
+        while (index := self.next_index()) is not None:
+            session = self._session_makers[index]()
+            try:
+                await session.connection()
+                return session
+            except Exception:
+                # Ошибки подключения asyncpg не оборачиваются в DBAPIError,
+                # поэтому любая ошибка получения соединения считается
+                # недоступностью реплики
+                logger.warning("Ошибка подключения к реплике", exc_info=True)
+                await session.close()
+                self.eject(index)
+
+        return None
+
+    def eject(self, index: int) -> None:
+        """Исключает реплику из балансировки на `eject_seconds`."""
+
+        pool = self.engines[index].pool.logging_name
+        logger.warning(
+            "Реплика %s недоступна и исключена на %s с", pool, self.eject_seconds
+        )
+        DB_REPLICA_EJECTIONS.labels(pool=pool).inc()
+        self._ejected_until[index] = monotonic() + self.eject_seconds
+
+    async def dispose(self) -> None:
+        """Закрывает соединения всех реплик."""
+
+        for engine in self.engines:
+            await engine.dispose()
@@ -1,13 +1,75 @@
 from typing import AsyncGenerator
 
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from sqlalchemy import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from app.core.config import settings
+from app.core.constants import (
+    RECENT_WRITERS_CACHE_MAX_SIZE,
+    SLOW_QUERY_EXPLAIN_MAX_CONCURRENCY,
+    SLOW_QUERY_PLANS_MAX_SIZE,
+)
+from app.core.metrics import DB_READ_SESSIONS
+from app.db.instrumentation import register_query_instrumentation
+from app.db.pool import InstrumentedQueuePool, register_pool_metrics
+from app.db.replicas import ReplicaRouter, make_read_session_maker
+from app.db.slow_queries import SlowQueryLog
+from app.utils.cache import TTLCache
 
-engine = create_async_engine(
-    url=str(settings.ASYNC_POSTGRES_URI),
+# Журнал медленных запросов, общий для основной БД и реплик
+slow_query_log = SlowQueryLog(
+    threshold_seconds=settings.SLOW_QUERY_THRESHOLD_SECONDS,
+    explain_sample_rate=settings.SLOW_QUERY_EXPLAIN_SAMPLE_RATE,
+    explain_timeout_seconds=settings.SLOW_QUERY_EXPLAIN_TIMEOUT_SECONDS,
+    max_plans=SLOW_QUERY_PLANS_MAX_SIZE,
+    max_concurrent_explains=SLOW_QUERY_EXPLAIN_MAX_CONCURRENCY,
 )
 
+
+def create_db_engine(url: str, *, name: str) -> AsyncEngine:
+    """
+    Создает движок БД с пулом соединений, настроенным по параметрам из
+    `Settings`, и регистрирует метрики пула.
+
+    Args:
+        url (str): DSN для подключения к БД.
+        name (str): Имя пула в метриках и логах.
+    Returns:
+        AsyncEngine: Движок БД.
+    """
+
+    connect_args = {}
+    if make_url(url).get_driver_name() == "asyncpg":
+        connect_args = {
+            "statement_cache_size": settings.DB_STATEMENT_CACHE_SIZE,
+            "prepared_statement_cache_size": settings.DB_PREPARED_STATEMENT_CACHE_SIZE,
+            "timeout": settings.DB_CONNECT_TIMEOUT_SECONDS,
+        }
+
+    engine = create_async_engine(
+        url=url,
+        poolclass=InstrumentedQueuePool,
+        pool_logging_name=name,
+        pool_size=settings.DB_POOL_SIZE,
+        max_overflow=settings.DB_POOL_MAX_OVERFLOW,
+        pool_timeout=settings.DB_POOL_TIMEOUT_SECONDS,
+        pool_recycle=settings.DB_POOL_RECYCLE_SECONDS,
+        pool_pre_ping=settings.DB_POOL_PRE_PING,
+        connect_args=connect_args,
+    )
+    register_pool_metrics(engine, name=name)
+    register_query_instrumentation(engine, slow_query_log=slow_query_log)
+
+    return engine
+
+
+engine = create_db_engine(str(settings.ASYNC_POSTGRES_URI), name="primary")
+
 SessionLocal = async_sessionmaker(
     bind=engine,
     autocommit=False,
@@ -16,6 +78,120 @@ SessionLocal = async_sessionmaker(
     class_=AsyncSession,
 )
 
+ReadSessionLocal = make_read_session_maker(engine)
+StreamingReadSessionLocal = make_read_session_maker(engine, streaming=True)
+
+replica_router = ReplicaRouter(
+    [
+        create_db_engine(url, name=f"replica{index}")
+        for index, url in enumerate(settings.ASYNC_POSTGRES_REPLICA_URIS)
+    ],
+    eject_seconds=settings.DB_REPLICA_EJECT_SECONDS,
+)
+
+# Пользователи, недавно изменявшие данные. Кэш хранится в памяти процесса,
+# поэтому гарантия чтения своих записей действует в пределах одного процесса.
+recent_writers: TTLCache[int, bool] = TTLCache(
+    name="recent_writers",
+    maxsize=RECENT_WRITERS_CACHE_MAX_SIZE,
+    ttl=settings.DB_READ_YOUR_WRITES_SECONDS,
+)
+
+
+def mark_user_write(user_id: int) -> None:
+    """
+    Отмечает, что пользователь изменил данные: в течение
+    `DB_READ_YOUR_WRITES_SECONDS` его чтения выполняются на основной БД.
+    """
+
+    recent_writers.set(user_id, True)
+
+
+def _use_replica(user_id: int | None) -> bool:
+    # Пользователь без идентификатора (токен старого формата) всегда читает
+    # с основной БД, так как его записи нельзя сопоставить с чтениями
+    return (
+        len(replica_router) > 0
+        and user_id is not None
+        and recent_writers.get(user_id) is None
+    )
+
+
+async def open_read_session(*, user_id: int | None) -> AsyncSession:
+    """
+    Открывает сессию только для чтения данных пользователя: на одной из
+    реплик, если они настроены и доступны, и пользователь недавно не изменял
+    данные, иначе на основной БД.
+
+    Args:
+        user_id (int | None): Идентификатор пользователя, чьи данные читаются.
+    Returns:
+        AsyncSession: Сессия БД.
+    """
+
+    if _use_replica(user_id):
+        session = await replica_router.open_session()
+        if session is not None:
+            DB_READ_SESSIONS.labels(target="replica").inc()
+            return session
+
+    DB_READ_SESSIONS.labels(target="primary").inc()
+    return ReadSessionLocal()
+
+
+def select_read_session_maker(
+    *, user_id: int | None
+) -> async_sessionmaker[AsyncSession]:
+    """
+    Возвращает фабрику сессий для потокового чтения (см.
+    `make_read_session_maker`), выбранную по тем же правилам, что и в
+    `open_read_session`, но без проверки соединения. Используется там, где
+    сессия открывается позже, например при потоковой отдаче ответа.
+    """
+
+    if _use_replica(user_id):
+        session_maker = replica_router.streaming_session_maker()
+        if session_maker is not None:
+            DB_READ_SESSIONS.labels(target="replica").inc()
+            return session_maker
+
+    DB_READ_SESSIONS.labels(target="primary").inc()
+    return StreamingReadSessionLocal
+
+
+async def release_connection(session: AsyncSession) -> None:
+    """
+    Возвращает соединение сессии только для чтения в пул, не дожидаясь конца
+    обработки запроса. Вызывается после последнего запроса к БД, чтобы
+    соединение не удерживалось, пока сериализуется ответ. Загруженные объекты
+    остаются доступными; при следующем запросе сессия возьмет соединение
+    из пула снова.
+
+    Для остальных сессий ничего не делает: их транзакцию завершает владелец.
+
+    Args:
+        session (AsyncSession): Сессия БД.
+    """
+
+    if session.info.get("read_only"):
+        await session.close()
+
+
+def get_slow_query_log() -> SlowQueryLog:
+    """Возвращает журнал медленных запросов к БД."""
+
+    return slow_query_log
+
+
+def get_session_maker() -> async_sessionmaker[AsyncSession]:
+    """
+    Возвращает фабрику сессий. Используется обработчиками, работа которых
+    продолжается после возврата из них (например, при потоковой отдаче ответа):
+    сессия из `get_session` к этому моменту уже закрыта.
+    """
+
+    return SessionLocal
+
 
 async def get_session() -> AsyncGenerator[AsyncSession, None]:
     async with SessionLocal() as session:
@@ -0,0 +1,242 @@
+"""
+Содержит журнал медленных запросов к БД.
+
+Запросы, выполнявшиеся дольше порога, записываются в лог в нормализованном
+виде: литералы и параметры заменены на `?`, вместо значений параметров
+указаны их типы. Для части медленных запросов на чтение план выполнения
+снимается командой `EXPLAIN (ANALYZE, BUFFERS)` в фоновой задаче на
+отдельном соединении из пула; последние планы хранятся в памяти процесса.
+"""
+
+import asyncio
+import json
+import logging
+import random
+import re
+from collections import deque
+from dataclasses import dataclass, replace
+from datetime import datetime, timezone
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine
+
+from app.core.metrics import DB_SLOW_QUERIES
+
+logger = logging.getLogger(__name__)
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w$.])\d+(?:\.\d+)?(?![\w.])")
+_PLACEHOLDER = re.compile(r"\$\d+|\?")
+_PLACEHOLDER_LIST = re.compile(r"\?(?:\s*,\s*\?)+")
+_WHITESPACE = re.compile(r"\s+")
+
+# Запросы, для которых снимается план. Запрос с `WITH` может изменять данные
+# в CTE, но такой запрос завершится ошибкой в транзакции только для чтения
+_EXPLAINED_STATEMENTS = ("SELECT", "WITH")
+
+
+def normalize_statement(statement: str) -> str:
+    """
+    Приводит текст запроса к виду, одинаковому для запросов, отличающихся
+    только значениями: литералы и параметры заменяются на `?`, списки
+    параметров (например, в `IN`) сворачиваются, пробелы схлопываются.
+
+    Args:
+        statement (str): Текст запроса.
+    Returns:
+        str: Нормализованный текст запроса.
+    """
+
+    statement = _STRING_LITERAL.sub("?", statement)
+    statement = _NUMBER_LITERAL.sub("?", statement)
+    statement = _PLACEHOLDER.sub("?", statement)
+    statement = _PLACEHOLDER_LIST.sub("?, ...", statement)
+    return _WHITESPACE.sub(" ", statement).strip()
+
+
+def _value_shape(value: Any) -> str:
+    if isinstance(value, (list, tuple)):
+        return f"{type(value).__name__}[{len(value)}]"
+    return type(value).__name__
+
+
+def describe_parameters(parameters: Any, *, executemany: bool = False) -> str:
+    """
+    Описывает параметры запроса без значений: типы параметров, для
+    коллекций - длину, для `executemany` - количество наборов параметров.
+
+    Args:
+        parameters (Any): Параметры запроса в формате драйвера.
+        executemany (bool): Передан ли список наборов параметров.
+    Returns:
+        str: Описание параметров, например `(int, str, datetime)`.
+    """
+
+    if executemany:
+        rows = list(parameters)
+        first = describe_parameters(rows[0]) if rows else "()"
+        return f"{len(rows)} x {first}"
+
+    if isinstance(parameters, dict):
+        shapes = [f"{key}: {_value_shape(value)}" for key, value in parameters.items()]
+    else:
+        shapes = [_value_shape(value) for value in parameters or ()]
+    return f"({', '.join(shapes)})"
+
+
+@dataclass(frozen=True)
+class SlowQueryPlan:
+    """План выполнения медленного запроса."""
+
+    statement: str
+    parameters: str
+    seconds: float
+    route: str | None
+    captured_at: datetime
+    plan: Any
+
+
+class SlowQueryLog:
+    """
+    Записывает в лог запросы, выполнявшиеся не меньше `threshold_seconds`,
+    и снимает планы части из них.
+
+    План снимается только для запросов `SELECT` и `WITH` на движке asyncpg:
+    `EXPLAIN ANALYZE` выполняет запрос повторно, поэтому он выполняется в
+    транзакции только для чтения с ограничением времени и без учета в статистике
+    запросов HTTP-запроса. Одновременно снимается не больше
+    `max_concurrent_explains` планов, остальные запросы пропускаются.
+    """
+
+    def __init__(
+        self,
+        *,
+        threshold_seconds: float,
+        explain_sample_rate: float,
+        explain_timeout_seconds: float,
+        max_plans: int,
+        max_concurrent_explains: int,
+    ):
+        """
+        Args:
+            threshold_seconds (float): Порог времени запроса; 0 отключает журнал.
+            explain_sample_rate (float): Доля медленных запросов, для которых
+                снимается план; 0 отключает снятие планов.
+            explain_timeout_seconds (float): Ограничение времени `EXPLAIN`.
+            max_plans (int): Количество хранимых планов.
+            max_concurrent_explains (int): Количество одновременно
+                снимаемых планов.
+        """
+
+        self.threshold_seconds = threshold_seconds
+        self.explain_sample_rate = explain_sample_rate
+        self.explain_timeout_seconds = explain_timeout_seconds
+        self.max_concurrent_explains = max_concurrent_explains
+        self.plans: deque[SlowQueryPlan] = deque(maxlen=max_plans)
+        self._explains: set[asyncio.Task] = set()
+
+    def observe(
+        self,
+        engine: AsyncEngine,
+        *,
+        statement: str,
+        parameters: Any,
+        executemany: bool,
+        seconds: float,
+        route: str | None,
+    ) -> None:
+        """
+        Учитывает выполненный запрос. Вызывается из обработчика события
+        движка в потоке цикла событий, поэтому план снимается в задаче,
+        созданной в этом цикле.
+
+        Args:
+            engine (AsyncEngine): Движок, на котором выполнен запрос.
+            statement (str): Текст запроса.
+            parameters (Any): Параметры запроса в формате драйвера.
+            executemany (bool): Передан ли список наборов параметров.
+            seconds (float): Время выполнения запроса.
+            route (str | None): Шаблон пути маршрута HTTP-запроса.
+        """
+
+        if self.threshold_seconds <= 0 or seconds < self.threshold_seconds:
+            return
+
+        DB_SLOW_QUERIES.inc()
+        normalized = normalize_statement(statement)
+        shapes = describe_parameters(parameters, executemany=executemany)
+        logger.warning(
+            "Медленный запрос к БД: %.3f с, маршрут %s: %s; параметры: %s",
+            seconds,
+            route,
+            normalized,
+            shapes,
+        )
+
+        if (
+            executemany
+            or engine.dialect.driver != "asyncpg"
+            or not normalized.upper().startswith(_EXPLAINED_STATEMENTS)
+            or len(self._explains) >= self.max_concurrent_explains
+            or random.random() >= self.explain_sample_rate
+        ):
+            return
+
+        task = asyncio.get_running_loop().create_task(
+            self._explain(
+                engine,
+                statement=statement,
+                parameters=parameters,
+                entry=SlowQueryPlan(
+                    statement=normalized,
+                    parameters=shapes,
+                    seconds=seconds,
+                    route=route,
+                    captured_at=datetime.now(timezone.utc),
+                    plan=None,
+                ),
+            )
+        )
+        self._explains.add(task)
+        task.add_done_callback(self._explains.discard)
+
+    async def _explain(
+        self,
+        engine: AsyncEngine,
+        *,
+        statement: str,
+        parameters: Any,
+        entry: SlowQueryPlan,
+    ) -> None:
+        # Запрос выполняется через драйвер, минуя события движка, поэтому
+        # не учитывается в статистике и не попадает в журнал повторно
+        try:
+            async with engine.connect() as connection:
+                raw_connection = await connection.get_raw_connection()
+                driver_connection = raw_connection.driver_connection
+                async with driver_connection.transaction(readonly=True):
+                    await driver_connection.execute(
+                        "SET LOCAL statement_timeout = "
+                        f"{int(self.explain_timeout_seconds * 1000)}"
+                    )
+                    plan = await driver_connection.fetchval(
+                        f"EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) {statement}",
+                        *parameters,
+                    )
+        except Exception:
+            logger.warning("Не удалось получить план медленного запроса", exc_info=True)
+            return
+
+        self.plans.append(
+            replace(entry, plan=json.loads(plan) if isinstance(plan, str) else plan)
+        )
+
+    async def close(self) -> None:
+        """Отменяет снятие планов, которое еще не завершилось."""
+
+        for task in list(self._explains):
+            task.cancel()
+        await asyncio.gather(*self._explains, return_exceptions=True)
+
+    def clear(self) -> None:
+        self.plans.clear()
@@ -1,5 +1,12 @@
+from typing import Any, Sequence
+
+from sqlalchemy import RowMapping, func, literal, or_, select, true
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute
+
+from app.core.constants import TASKS_SEARCH_CONFIG
 from app.db.base_dao import BaseDAO
-from app.models import TaskModel
+from app.models import TaskModel, UserModel
 from app.schemas import TaskCreateSchema, TaskUpdateSchema
 
 
@@ -7,3 +14,160 @@ class TaskDAO(BaseDAO[TaskModel, TaskCreateSchema, TaskUpdateSchema]):
     """Класс для работы с задачами в базе данных."""
 
     model = TaskModel
+
+    @classmethod
+    async def find_owner_page(
+        cls,
+        session: AsyncSession,
+        user_id: int,
+        *filter,
+        columns: Sequence[InstrumentedAttribute],
+        order_by: Sequence[InstrumentedAttribute],
+        descending: bool = False,
+        after: Sequence[Any] | None = None,
+        limit: int,
+    ) -> Sequence[RowMapping]:
+        """Одним запросом находит версию списка задач пользователя и страницу
+        его задач (см. `find_all`).
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            user_id: Идентификатор пользователя-владельца задач
+            filter: Условия фильтрации задач
+            columns: Загружаемые столбцы задач
+            order_by: Столбцы, задающие порядок сортировки
+            descending: Сортировать по убыванию ключа сортировки
+            after: Значения ключа сортировки последней задачи предыдущей страницы
+            limit: Ограничение количества задач
+
+        Returns:
+            Строки со столбцом `owner_tasks_version` и столбцами задачи. Если
+            пользователь не найден, список пуст; если на странице нет задач,
+            возвращается одна строка, в которой столбцы задачи равны None.
+        """
+
+        owner = (
+            select(UserModel.tasks_version).where(UserModel.id == user_id).cte("owner")
+        )
+
+        page = cls._paginate(
+            select(*columns).where(cls.model.user_id == user_id, *filter),
+            offset=None,
+            limit=limit,
+            order_by=order_by,
+            descending=descending,
+            after=after,
+        ).cte("page")
+
+        page_order_by = [page.c[column.key] for column in order_by]
+        stmt = (
+            select(owner.c.tasks_version.label("owner_tasks_version"), *page.c)
+            .select_from(owner)
+            .outerjoin(page, true())
+            .order_by(
+                *(column.desc() if descending else column for column in page_order_by)
+            )
+        )
+
+        result = await session.execute(stmt)
+        return result.mappings().all()
+
+    @classmethod
+    async def search(
+        cls,
+        session: AsyncSession,
+        text: str,
+        *,
+        columns: Sequence[InstrumentedAttribute],
+        after: Sequence[Any] | None = None,
+        limit: int,
+        **filter_by,
+    ) -> Sequence[RowMapping]:
+        """Находит задачи по поисковому запросу в синтаксисе веб-поиска
+        (`websearch_to_tsquery`) и сортирует их по релевантности (`ts_rank`),
+        а при равной релевантности - по убыванию ID.
+
+        Условия по `user_id` и `search_vector` выполняются вместе по
+        GIN-индексу ix_tasks_user_id_search_vector, поэтому читаются только
+        совпадения в задачах пользователя; ранг вычисляется только для
+        найденных задач.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            text: Поисковый запрос
+            columns: Загружаемые столбцы задач
+            after: Ранг и ID последней задачи предыдущей страницы
+            limit: Ограничение количества задач
+            filter_by: Именованные условия фильтрации
+
+        Returns:
+            Строки с загружаемыми столбцами и рангом задачи (`rank`)
+        """
+
+        query = func.websearch_to_tsquery(TASKS_SEARCH_CONFIG, text)
+        rank = func.ts_rank(cls.model.search_vector, query)
+
+        stmt = cls.build_select(
+            cls.model.search_vector.bool_op("@@")(query),
+            columns=(*columns, rank.label("rank")),
+            order_by=(rank, cls.model.id),
+            descending=True,
+            after=after,
+            limit=limit,
+            **filter_by,
+        )
+
+        result = await session.execute(stmt)
+        return result.mappings().all()
+
+    @classmethod
+    async def autocomplete(
+        cls,
+        session: AsyncSession,
+        text: str,
+        *,
+        columns: Sequence[InstrumentedAttribute],
+        limit: int,
+        **filter_by,
+    ) -> Sequence[RowMapping]:
+        """Находит задачи, заголовок которых содержит `text` как подстроку без
+        учета регистра или содержит слово, похожее на `text` (с опечаткой
+        или недописанное, см. оператор `<%` расширения pg_trgm). Задачи
+        упорядочены по убыванию сходства (`word_similarity`), а при равном
+        сходстве - по убыванию ID.
+
+        Каждое из условий выполняется вместе с условием по `user_id` по
+        GIN-индексу ix_tasks_user_id_title_trgm, поэтому читаются только
+        совпадения в задачах пользователя.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            text: Набранный пользователем текст
+            columns: Загружаемые столбцы задач
+            limit: Ограничение количества задач
+            filter_by: Именованные условия фильтрации
+
+        Returns:
+            Строки с загружаемыми столбцами и сходством задачи (`similarity`)
+        """
+
+        # Символы шаблона LIKE в тексте ищутся как обычные символы
+        pattern = "%{}%".format(
+            text.replace("/", "//").replace("%", "/%").replace("_", "/_")
+        )
+        similarity = func.word_similarity(text, cls.model.title)
+
+        stmt = cls.build_select(
+            or_(
+                cls.model.title.ilike(pattern, escape="/"),
+                literal(text).bool_op("<%")(cls.model.title),
+            ),
+            columns=(*columns, similarity.label("similarity")),
+            order_by=(similarity, cls.model.id),
+            descending=True,
+            limit=limit,
+            **filter_by,
+        )
+
+        result = await session.execute(stmt)
+        return result.mappings().all()
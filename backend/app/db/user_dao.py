@@ -1,3 +1,6 @@
+from sqlalchemy import select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
 from app.db.base_dao import BaseDAO
 from app.models import UserModel
 from app.schemas import UserCreateSchema, UserUpdateSchema
@@ -7,3 +10,41 @@ class UserDAO(BaseDAO[UserModel, UserCreateSchema, UserUpdateSchema]):
     """Класс для работы с пользователями в базе данных."""
 
     model = UserModel
+
+    @classmethod
+    async def get_tasks_version(cls, session: AsyncSession, user_id: int) -> int | None:
+        """Возвращает версию списка задач пользователя.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            user_id: Идентификатор пользователя
+
+        Returns:
+            Версия списка задач или None, если пользователь не найден
+        """
+
+        stmt = select(cls.model.tasks_version).where(cls.model.id == user_id)
+        result = await session.execute(stmt)
+        return result.scalar_one_or_none()
+
+    @classmethod
+    async def increment_tasks_version(cls, session: AsyncSession, user_id: int) -> None:
+        """Увеличивает версию списка задач пользователя.
+
+        Время изменения пользователя сохраняется: изменение задач не меняет
+        данные самого пользователя и его ETag.
+
+        Args:
+            session: Асинхронная сессия SQLAlchemy
+            user_id: Идентификатор пользователя
+        """
+
+        stmt = (
+            update(cls.model)
+            .where(cls.model.id == user_id)
+            .values(
+                tasks_version=cls.model.tasks_version + 1,
+                updated_at=cls.model.updated_at,
+            )
+        )
+        await session.execute(stmt)
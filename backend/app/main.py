@@ -1,18 +1,72 @@
+import logging
+from contextlib import asynccontextmanager
+
 import logfire
 from fastapi import FastAPI, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import HTMLResponse
 from prometheus_fastapi_instrumentator import Instrumentator
 
+from app.api.middleware import QueryStatsMiddleware
+from app.api.v1.admin import router as admin_router
 from app.api.v1.auth import router as auth_router
 from app.api.v1.tasks import router as tasks_router
 from app.core.config import settings
+from app.core.constants import (
+    INVALIDATION_KEEPALIVE_SECONDS,
+    INVALIDATION_RECONNECT_MAX_SECONDS,
+    INVALIDATION_RECONNECT_MIN_SECONDS,
+)
+from app.db import InvalidationListener
+from app.db.pool import warmup_pool
+from app.db.session import engine, replica_router, slow_query_log
 from app.schemas import HealthcheckResponseSchema
+from app.services import evict_user_caches, flush_local_caches, tasks_cache
+from app.utils.security import shutdown_password_hasher
+
+logger = logging.getLogger(__name__)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    for db_engine in [engine, *replica_router.engines]:
+        try:
+            await warmup_pool(
+                db_engine,
+                connections=settings.DB_POOL_WARMUP_CONNECTIONS,
+            )
+        except Exception:
+            # Недоступность БД при запуске не должна мешать запуску приложения:
+            # соединения будут открыты при первых запросах
+            logger.exception("Не удалось открыть соединения с БД при запуске")
+
+    invalidation_listener = InvalidationListener(
+        url=str(settings.ASYNC_POSTGRES_URI),
+        on_message=evict_user_caches,
+        on_gap=flush_local_caches,
+        connect_timeout=settings.DB_CONNECT_TIMEOUT_SECONDS,
+        min_backoff=INVALIDATION_RECONNECT_MIN_SECONDS,
+        max_backoff=INVALIDATION_RECONNECT_MAX_SECONDS,
+        keepalive_seconds=INVALIDATION_KEEPALIVE_SECONDS,
+    )
+    if settings.CACHE_INVALIDATION_ENABLED:
+        invalidation_listener.start()
+
+    yield
+
+    await invalidation_listener.stop()
+    await slow_query_log.close()
+    shutdown_password_hasher()
+    await engine.dispose()
+    await replica_router.dispose()
+    await tasks_cache.close()
+
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.APP_VERSION,
     docs_url="/docs",
+    lifespan=lifespan,
 )
 
 # TODO: при подготовке к запуску приложения в production
@@ -31,9 +85,15 @@ app.add_middleware(
     ],
 )
 
+app.add_middleware(
+    QueryStatsMiddleware,
+    server_timing=settings.SERVER_TIMING_ENABLED,
+)
+
 for router in [
     auth_router,
     tasks_router,
+    admin_router,
 ]:
     app.include_router(router=router, prefix="/api/v1")
 
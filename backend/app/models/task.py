@@ -1,9 +1,10 @@
 from datetime import datetime
 
 import sqlalchemy as sa
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.orm import Mapped, mapped_column, relationship
 
-from app.core.constants import CURRENT_TIMESTAMP_UTC
+from app.core.constants import CURRENT_TIMESTAMP_UTC, TASKS_SEARCH_CONFIG
 from app.models import BaseModel
 
 
@@ -11,6 +12,44 @@ class TaskModel(BaseModel):
     """Модель задачи."""
 
     __tablename__ = "tasks"
+    __table_args__ = (
+        # Ключи keyset-пагинации списка задач пользователя
+        sa.Index("ix_tasks_user_id_created_at_id", "user_id", "created_at", "id"),
+        sa.Index(
+            "ix_tasks_user_id_is_completed_created_at_id",
+            "user_id",
+            "is_completed",
+            "created_at",
+            "id",
+        ),
+        # Частичный индекс по невыполненным задачам: самый частый фильтр,
+        # индекс заметно меньше полного и лучше держится в кэше
+        sa.Index(
+            "ix_tasks_user_id_created_at_id_pending",
+            "user_id",
+            "created_at",
+            "id",
+            postgresql_where=sa.text("NOT is_completed"),
+        ),
+        # Полнотекстовый поиск по задачам пользователя. user_id входит в
+        # индекс (класс операторов из расширения btree_gin), чтобы поиск
+        # читал только совпадения в задачах пользователя
+        sa.Index(
+            "ix_tasks_user_id_search_vector",
+            "user_id",
+            "search_vector",
+            postgresql_using="gin",
+        ),
+        # Поиск подстрок и похожих слов в заголовках задач пользователя
+        # (автодополнение); user_id - класс операторов из btree_gin
+        sa.Index(
+            "ix_tasks_user_id_title_trgm",
+            "user_id",
+            "title",
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+        ),
+    )
 
     id: Mapped[int] = mapped_column(
         primary_key=True,
@@ -46,5 +85,18 @@ class TaskModel(BaseModel):
         onupdate=CURRENT_TIMESTAMP_UTC,
         comment="Дата и время изменения задачи",
     )
+    # Вычисляется БД при каждой записи задачи. Не загружается вместе с
+    # задачей: нужен только в условиях поиска
+    search_vector: Mapped[str] = mapped_column(
+        TSVECTOR,
+        sa.Computed(
+            f"setweight(to_tsvector('{TASKS_SEARCH_CONFIG}', title), 'A') || "
+            f"setweight(to_tsvector('{TASKS_SEARCH_CONFIG}', "
+            "coalesce(description, '')), 'B')",
+            persisted=True,
+        ),
+        deferred=True,
+        comment="Поисковый вектор заголовка (вес A) и описания (вес B) задачи",
+    )
 
     user = relationship("UserModel", back_populates="tasks")
@@ -28,6 +28,16 @@ class UserModel(BaseModel):
         nullable=False,
         comment="Хэш пароля пользователя",
     )
+    token_version: Mapped[int] = mapped_column(
+        default=0,
+        server_default="0",
+        comment="Версия токенов пользователя; увеличивается при отзыве токенов",
+    )
+    tasks_version: Mapped[int] = mapped_column(
+        default=0,
+        server_default="0",
+        comment="Версия списка задач пользователя; увеличивается при изменении задач",
+    )
     created_at: Mapped[datetime] = mapped_column(
         sa.TIMESTAMP(timezone=True),
         server_default=CURRENT_TIMESTAMP_UTC,
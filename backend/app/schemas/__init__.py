@@ -1,14 +1,28 @@
+from app.schemas.admin import SlowQueryListResponseSchema, SlowQueryPlanSchema
 from app.schemas.auth import (
     LoginRequestSchema,
     LoginResponseSchema,
+    PrincipalSchema,
     SignupRequestSchema,
     SignupResponseSchema,
 )
 from app.schemas.healthcheck import HealthcheckResponseSchema
 from app.schemas.task import (
+    SortOrder,
+    TaskBatchCreateResponseSchema,
+    TaskBatchCreateSchema,
+    TaskBatchErrorSchema,
+    TaskBulkResultSchema,
+    TaskBulkUpdateSchema,
     TaskCreateSchema,
+    TaskFileFormat,
+    TaskImportResponseSchema,
     TaskListResponseSchema,
     TaskResponseSchema,
+    TaskSortField,
+    TaskStatusFilter,
+    TaskSuggestionListResponseSchema,
+    TaskSuggestionSchema,
     TaskUpdateSchema,
 )
 from app.schemas.user import UserCreateSchema, UserResponseSchema, UserUpdateSchema
@@ -22,8 +36,23 @@ __all__ = [
     "SignupResponseSchema",
     "LoginRequestSchema",
     "LoginResponseSchema",
+    "PrincipalSchema",
     "TaskCreateSchema",
     "TaskResponseSchema",
     "TaskUpdateSchema",
     "TaskListResponseSchema",
+    "TaskSuggestionSchema",
+    "TaskSuggestionListResponseSchema",
+    "TaskBatchCreateSchema",
+    "TaskBatchCreateResponseSchema",
+    "TaskBatchErrorSchema",
+    "TaskBulkUpdateSchema",
+    "TaskBulkResultSchema",
+    "TaskImportResponseSchema",
+    "TaskStatusFilter",
+    "TaskSortField",
+    "TaskFileFormat",
+    "SortOrder",
+    "SlowQueryPlanSchema",
+    "SlowQueryListResponseSchema",
 ]
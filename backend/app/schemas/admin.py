@@ -0,0 +1,40 @@
+from datetime import datetime
+from typing import Any
+
+from pydantic import BaseModel, ConfigDict, Field
+
+
+class SlowQueryPlanSchema(BaseModel):
+    """Схема плана выполнения медленного запроса к БД."""
+
+    model_config = ConfigDict(from_attributes=True)
+
+    statement: str = Field(
+        description="Нормализованный текст запроса.",
+        examples=["SELECT tasks.id FROM tasks WHERE tasks.user_id = ? LIMIT ?"],
+    )
+    parameters: str = Field(
+        description="Типы параметров запроса.",
+        examples=["(int, int)"],
+    )
+    seconds: float = Field(
+        description="Время выполнения запроса в секундах.",
+    )
+    route: str | None = Field(
+        description="Шаблон пути маршрута, при обработке которого выполнен запрос.",
+        examples=["/api/v1/tasks"],
+    )
+    captured_at: datetime = Field(
+        description="Время выполнения запроса.",
+    )
+    plan: Any = Field(
+        description="План EXPLAIN (ANALYZE, BUFFERS) в формате JSON.",
+    )
+
+
+class SlowQueryListResponseSchema(BaseModel):
+    """Схема ответа со списком планов медленных запросов."""
+
+    queries: list[SlowQueryPlanSchema] = Field(
+        description="Планы медленных запросов, от новых к старым.",
+    )
@@ -1,6 +1,6 @@
 import re
 
-from pydantic import BaseModel, EmailStr, Field, field_validator
+from pydantic import BaseModel, ConfigDict, EmailStr, Field, field_validator
 
 from app.schemas.user import UserResponseSchema
 
@@ -74,3 +74,23 @@ class LoginResponseSchema(BaseModel):
         default="Bearer",
         description="Тип токена, обычно 'Bearer'.",
     )
+
+
+class PrincipalSchema(BaseModel):
+    """
+    Схема с минимальными данными аутентифицированного пользователя, нужными
+    для авторизации запроса.
+    """
+
+    id: int = Field(
+        description="Уникальный идентификатор пользователя.",
+    )
+    email: str = Field(
+        description="Email, принадлежащий пользователю.",
+    )
+    token_version: int = Field(
+        description="Текущая версия токенов пользователя.",
+    )
+
+    # Объекты хранятся в общем кэше и не должны изменяться
+    model_config = ConfigDict(from_attributes=True, frozen=True)
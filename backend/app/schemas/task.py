@@ -1,7 +1,40 @@
 from datetime import datetime
+from enum import StrEnum
+from typing import Any
 
 from pydantic import BaseModel, ConfigDict, Field, model_validator
 
+from app.core.constants import TASKS_BATCH_MAX_SIZE, TASKS_IMPORT_MAX_ERRORS
+
+
+class TaskStatusFilter(StrEnum):
+    """Фильтр списка задач по статусу выполнения."""
+
+    ALL = "all"
+    PENDING = "pending"
+    COMPLETED = "completed"
+
+
+class TaskSortField(StrEnum):
+    """Поле, по которому сортируется список задач."""
+
+    CREATED_AT = "created_at"
+    STATUS = "status"
+
+
+class SortOrder(StrEnum):
+    """Направление сортировки."""
+
+    ASC = "asc"
+    DESC = "desc"
+
+
+class TaskFileFormat(StrEnum):
+    """Формат файла со списком задач для выгрузки и загрузки."""
+
+    NDJSON = "ndjson"
+    CSV = "csv"
+
 
 class TaskCreateSchema(BaseModel):
     """Схема для создания задачи."""
@@ -79,8 +112,126 @@ class TaskListResponseSchema(BaseModel):
     """Схема для ответа со списком задач."""
 
     tasks: list[TaskResponseSchema] = Field(
-        description="Список задач текущего пользователя",
+        description="Страница списка задач текущего пользователя",
     )
     total: int = Field(
-        description="Общее количество задач текущего пользователя",
+        description="Количество задач на текущей странице",
+    )
+    next_cursor: str | None = Field(
+        default=None,
+        description=(
+            "Курсор для получения следующей страницы (параметр `after`). "
+            "Равен null, если страница последняя."
+        ),
+    )
+
+
+class TaskSuggestionSchema(BaseModel):
+    """Схема задачи в подсказках автодополнения."""
+
+    id: int = Field(
+        description="Уникальный идентификатор задачи",
+    )
+    title: str = Field(
+        description="Заголовок задачи",
+    )
+    is_completed: bool = Field(
+        description="Статус выполнения задачи",
+    )
+
+
+class TaskSuggestionListResponseSchema(BaseModel):
+    """Схема для ответа с подсказками автодополнения."""
+
+    tasks: list[TaskSuggestionSchema] = Field(
+        description="Задачи текущего пользователя, подходящие к набранному тексту",
+    )
+
+
+class TaskBatchCreateSchema(BaseModel):
+    """Схема для пакетного создания задач."""
+
+    tasks: list[dict[str, Any]] = Field(
+        min_length=1,
+        max_length=TASKS_BATCH_MAX_SIZE,
+        description=(
+            "Данные создаваемых задач в формате TaskCreateSchema. Каждый элемент "
+            "проверяется отдельно: ошибка в одном элементе не отменяет создание "
+            "остальных."
+        ),
+    )
+
+
+class TaskBatchErrorSchema(BaseModel):
+    """Схема с ошибками валидации одного элемента пакета задач."""
+
+    index: int = Field(
+        description="Индекс элемента в исходном пакете",
+    )
+    errors: list[dict[str, Any]] = Field(
+        description="Ошибки валидации элемента",
+    )
+
+
+class TaskBatchCreateResponseSchema(BaseModel):
+    """Схема для ответа на пакетное создание задач."""
+
+    tasks: list[TaskResponseSchema] = Field(
+        description="Созданные задачи в порядке следования в исходном пакете",
+    )
+    errors: list[TaskBatchErrorSchema] = Field(
+        description="Элементы пакета, не прошедшие валидацию",
+    )
+
+
+class TaskImportResponseSchema(BaseModel):
+    """Схема для ответа на загрузку задач из файла."""
+
+    imported: int = Field(
+        description="Количество загруженных задач",
+    )
+    rejected: int = Field(
+        description="Количество записей, не прошедших валидацию",
+    )
+    errors: list[TaskBatchErrorSchema] = Field(
+        description=(
+            "Ошибки валидации отклоненных записей (не больше "
+            f"{TASKS_IMPORT_MAX_ERRORS}); индекс — номер записи в файле без "
+            "учета заголовка и пустых строк, начиная с 0"
+        ),
+    )
+
+
+class TaskBulkUpdateSchema(BaseModel):
+    """Схема для массового обновления задач."""
+
+    ids: list[int] | None = Field(
+        default=None,
+        min_length=1,
+        max_length=TASKS_BATCH_MAX_SIZE,
+        description="Идентификаторы обновляемых задач",
+    )
+    status: TaskStatusFilter | None = Field(
+        default=None,
+        description="Обновить задачи с указанным статусом выполнения",
+    )
+    changes: TaskUpdateSchema = Field(
+        description="Данные для обновления задач",
+    )
+
+    @model_validator(mode="after")
+    def check_selector(self):
+        if self.ids is None and self.status in (None, TaskStatusFilter.ALL):
+            raise ValueError("Необходимо указать ids или status, отличный от all")
+        return self
+
+
+class TaskBulkResultSchema(BaseModel):
+    """Схема для ответа на массовое изменение задач."""
+
+    ids: list[int] = Field(
+        description="Идентификаторы затронутых задач",
+    )
+    count: int = Field(
+        description="Количество затронутых задач",
     )
@@ -1,32 +1,76 @@
-from app.services.auth import authenticate_user, create_user_token
+from app.services.auth import (
+    authenticate_user,
+    create_user_token,
+    get_principal,
+    invalidate_principal,
+    principal_cache,
+    revoke_user_tokens,
+)
 from app.services.exceptions import (
     EmailAlreadyExistsException,
+    InvalidCursorException,
+    TaskAutocompleteSupersededException,
     TaskCreateException,
     TaskDeleteException,
+    TaskImportException,
     TaskNotFoundException,
     TaskUpdateException,
 )
+from app.services.invalidation import evict_user_caches, flush_local_caches
 from app.services.task import (
+    autocomplete_user_tasks,
     create_task,
+    create_tasks,
     delete_task,
+    delete_tasks,
+    export_user_tasks,
     get_task_by_id,
     get_user_tasks,
+    get_user_tasks_etag,
+    get_user_tasks_json,
+    get_user_tasks_with_etag,
+    import_tasks,
+    search_user_tasks,
+    tasks_autocomplete_debouncer,
+    tasks_cache,
     update_task,
+    update_tasks,
 )
 from app.services.user import create_user
 
 __all__ = [
     "create_user",
     "EmailAlreadyExistsException",
+    "InvalidCursorException",
     "TaskCreateException",
     "TaskUpdateException",
     "TaskDeleteException",
+    "TaskImportException",
+    "TaskAutocompleteSupersededException",
     "TaskNotFoundException",
     "authenticate_user",
     "create_user_token",
+    "get_principal",
+    "invalidate_principal",
+    "principal_cache",
+    "revoke_user_tokens",
+    "evict_user_caches",
+    "flush_local_caches",
     "create_task",
+    "create_tasks",
     "get_user_tasks",
+    "get_user_tasks_etag",
+    "get_user_tasks_with_etag",
+    "search_user_tasks",
+    "autocomplete_user_tasks",
+    "tasks_autocomplete_debouncer",
+    "get_user_tasks_json",
+    "tasks_cache",
+    "export_user_tasks",
+    "import_tasks",
     "get_task_by_id",
     "update_task",
+    "update_tasks",
     "delete_task",
+    "delete_tasks",
 ]
@@ -2,9 +2,23 @@
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import UserDAO
+from app.core.config import settings
+from app.db import UserDAO, mark_user_write, publish_invalidation
 from app.models import UserModel
-from app.utils.security import create_access_token, verify_password
+from app.schemas import PrincipalSchema
+from app.utils.cache import TTLCache
+from app.utils.security import create_access_token, verify_password_async
+
+# Кэш аутентифицированных пользователей. Ключ - id пользователя для токенов
+# с claim `uid` или email для старых токенов, содержащих только `sub`.
+# Позволяет не обращаться к таблице users при каждом запросе; изменения
+# пользователя (в т.ч. отзыв токенов) становятся видны не позже, чем через
+# PRINCIPAL_CACHE_TTL_SECONDS, либо сразу после вызова invalidate_principal.
+principal_cache: TTLCache[int | str, PrincipalSchema] = TTLCache(
+    name="principal",
+    maxsize=settings.PRINCIPAL_CACHE_MAX_SIZE,
+    ttl=settings.PRINCIPAL_CACHE_TTL_SECONDS,
+)
 
 
 async def authenticate_user(
@@ -23,6 +37,8 @@ async def authenticate_user(
 
     Returns:
         UserModel | None: Пользователь, если найден, иначе None.
+    Raises:
+        ServiceOverloadedException: Если пул проверки паролей перегружен.
     """
 
     user = await UserDAO.find_one_or_none(
@@ -30,7 +46,7 @@ async def authenticate_user(
         email=email,
     )
 
-    if user and verify_password(
+    if user and await verify_password_async(
         plain_password=password,
         hashed=user.password_hash,
     ):
@@ -39,6 +55,50 @@ async def authenticate_user(
     return None
 
 
+async def get_principal(
+    *,
+    session: AsyncSession,
+    user_id: int | None = None,
+    email: str | None = None,
+) -> PrincipalSchema | None:
+    """
+    Возвращает данные пользователя, необходимые для авторизации запроса.
+    Сначала ищет их в кэше `principal_cache`, затем - в базе данных.
+
+    Найденные данные сохраняются в кэш, поэтому сессия должна быть открыта на
+    основной БД: данные с отстающей реплики сделали бы отзыв токенов
+    недействующим на время жизни записи кэша.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+        user_id (int | None): ID пользователя из claim `uid` токена.
+        email (str | None): Email пользователя из claim `sub`; используется,
+            если `user_id` не указан (токены, выпущенные до появления `uid`).
+
+    Returns:
+        PrincipalSchema | None: Данные пользователя, если он найден, иначе None.
+    """
+
+    key = user_id if user_id is not None else email
+
+    principal = principal_cache.get(key)
+    if principal is not None:
+        return principal
+
+    if user_id is not None:
+        user = await UserDAO.find_one_or_none(session=session, id=user_id)
+    else:
+        user = await UserDAO.find_one_or_none(session=session, email=email)
+
+    if user is None:
+        return None
+
+    principal = PrincipalSchema.model_validate(user)
+    principal_cache.set(key, principal)
+
+    return principal
+
+
 def create_user_token(
     *,
     user: UserModel,
@@ -53,4 +113,63 @@ def create_user_token(
         str: Закодированный JWT токен.
     """
 
-    return create_access_token(email=user.email)
+    return create_access_token(
+        email=user.email,
+        user_id=user.id,
+        token_version=user.token_version,
+    )
+
+
+async def revoke_user_tokens(
+    *,
+    session: AsyncSession,
+    user_id: int,
+) -> None:
+    """
+    Отзывает все выданные пользователю токены, увеличивая версию токенов.
+
+    Args:
+        session (AsyncSession): Асинхронная сессия базы данных.
+        user_id (int): ID пользователя.
+    """
+
+    user = await UserDAO.update(
+        session,
+        UserDAO.model.id == user_id,
+        obj_in={"token_version": UserDAO.model.token_version + 1},
+    )
+    # Остальные процессы приложения удалят пользователя из своих кэшей
+    # по уведомлению, доставляемому при фиксации транзакции
+    await publish_invalidation(
+        session,
+        user_id=user_id,
+        email=user.email if user is not None else None,
+    )
+    await session.commit()
+
+    # Чтения пользователя в этом процессе не должны видеть прежнюю версию
+    # токенов на отстающей реплике
+    mark_user_write(user_id)
+    if user is not None:
+        invalidate_principal(user_id=user.id, email=user.email)
+
+
+def invalidate_principal(
+    *,
+    user_id: int | None = None,
+    email: str | None = None,
+) -> None:
+    """
+    Удаляет пользователя из кэша аутентифицированных пользователей. Вызывается
+    при изменении или удалении пользователя.
+
+    Args:
+        user_id (int | None): ID пользователя.
+        email (str | None): Email пользователя.
+    """
+
+    if user_id is not None:
+        principal_cache.invalidate(user_id)
+
+    if email is not None:
+        principal_cache.invalidate(email)
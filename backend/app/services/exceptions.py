@@ -56,3 +56,36 @@ class TaskDeleteException(CustomException):
         msg: str = "Произошла ошибка при удалении задачи",
     ):
         super().__init__(msg=msg)
+
+
+class InvalidCursorException(CustomException):
+    """Некорректный курсор пагинации."""
+
+    def __init__(
+        self,
+        *,
+        msg: str = "Некорректный курсор пагинации",
+    ):
+        super().__init__(msg=msg)
+
+
+class TaskImportException(CustomException):
+    """Ошибка при загрузке задач из файла."""
+
+    def __init__(
+        self,
+        *,
+        msg: str = "Произошла ошибка при загрузке задач",
+    ):
+        super().__init__(msg=msg)
+
+
+class TaskAutocompleteSupersededException(CustomException):
+    """Запрос автодополнения вытеснен более новым запросом пользователя."""
+
+    def __init__(
+        self,
+        *,
+        msg: str = "Запрос вытеснен более новым запросом автодополнения",
+    ):
+        super().__init__(msg=msg)
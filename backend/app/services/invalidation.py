@@ -0,0 +1,33 @@
+"""Содержит сброс кэшей процесса по уведомлениям об изменении данных пользователей."""
+
+from app.db import mark_user_write
+from app.services.auth import invalidate_principal, principal_cache
+from app.services.task import clear_tasks_cache, evict_user_tasks_cache
+
+
+async def evict_user_caches(user_id: int, email: str | None = None) -> None:
+    """
+    Сбрасывает кэши процесса, относящиеся к пользователю, данные которого
+    изменены в другом процессе.
+
+    Args:
+        user_id (int): ID пользователя.
+        email (str | None): Email пользователя, если данные для токенов без
+            `uid` закэшированы по нему.
+    """
+
+    invalidate_principal(user_id=user_id, email=email)
+    await evict_user_tasks_cache(user_id)
+    # Следующие чтения пользователя в этом процессе тоже должны видеть его
+    # изменения, поэтому выполняются на основной БД
+    mark_user_write(user_id)
+
+
+async def flush_local_caches() -> None:
+    """
+    Удаляет все записи кэшей процесса. Вызывается, когда уведомления об
+    изменениях могли быть пропущены.
+    """
+
+    principal_cache.clear()
+    clear_tasks_cache()
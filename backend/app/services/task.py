@@ -1,16 +1,126 @@
 """Содержит бизнес-логику для работы с задачами."""
 
-from pydantic import ValidationError
+import csv
+import io
+import logging
+from datetime import datetime
+from typing import Any, AsyncIterable, AsyncIterator, Iterable, Mapping, Sequence
+
+from pydantic import TypeAdapter, ValidationError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import TaskDAO
-from app.schemas import TaskCreateSchema, TaskResponseSchema, TaskUpdateSchema
+from app.core.config import settings
+from app.core.constants import (
+    TASKS_AUTOCOMPLETE_DEBOUNCE_MAX_USERS,
+    TASKS_EXPORT_CHUNK_SIZE,
+    TASKS_IMPORT_CHUNK_SIZE,
+    TASKS_IMPORT_MAX_ERRORS,
+    TASKS_IMPORT_MAX_LINE_SIZE,
+)
+from app.db import TaskDAO, UserDAO, mark_user_write, publish_invalidation
+from app.schemas import (
+    SortOrder,
+    TaskBatchCreateResponseSchema,
+    TaskBatchErrorSchema,
+    TaskBulkResultSchema,
+    TaskCreateSchema,
+    TaskFileFormat,
+    TaskImportResponseSchema,
+    TaskListResponseSchema,
+    TaskResponseSchema,
+    TaskSortField,
+    TaskStatusFilter,
+    TaskSuggestionListResponseSchema,
+    TaskSuggestionSchema,
+    TaskUpdateSchema,
+)
 from app.services.exceptions import (
+    InvalidCursorException,
+    TaskAutocompleteSupersededException,
     TaskCreateException,
     TaskDeleteException,
+    TaskImportException,
     TaskNotFoundException,
     TaskUpdateException,
 )
+from app.utils.cache import create_cache_backend
+from app.utils.debounce import Debouncer
+from app.utils.http import etag_matches, make_etag
+from app.utils.pagination import decode_cursor, encode_cursor
+from app.utils.streams import iter_csv_rows, iter_lines
+
+logger = logging.getLogger(__name__)
+
+# Кэш сериализованных страниц списка задач. Ключи страниц пользователя
+# содержат версию его списка, которая меняется после каждой записи задач
+# пользователя (см. `_commit_tasks_write`), поэтому устаревшие страницы не
+# удаляются, а перестают читаться и вытесняются по TTL или размеру кэша.
+tasks_cache = create_cache_backend(
+    name="tasks",
+    url=settings.TASKS_CACHE_URL,
+    ttl=settings.TASKS_CACHE_TTL_SECONDS,
+    maxsize=settings.TASKS_CACHE_MAX_SIZE,
+    maxbytes=settings.TASKS_CACHE_MAX_BYTES,
+    timeout=settings.TASKS_CACHE_TIMEOUT_SECONDS,
+    pool_size=settings.TASKS_CACHE_POOL_SIZE,
+)
+
+# Столбцы, загружаемые из БД для ответа со списком задач
+_TASK_RESPONSE_COLUMNS = tuple(
+    getattr(TaskDAO.model, name) for name in TaskResponseSchema.model_fields
+)
+
+# Запросы автодополнения пользователя, вытесненные его более новым запросом
+# за время задержки, завершаются без обращения к БД. Ключ - id пользователя
+tasks_autocomplete_debouncer: Debouncer[int] = Debouncer(
+    name="tasks_autocomplete",
+    delay=settings.TASKS_AUTOCOMPLETE_DEBOUNCE_SECONDS,
+    maxsize=TASKS_AUTOCOMPLETE_DEBOUNCE_MAX_USERS,
+)
+
+# Столбцы, загружаемые из БД для подсказок автодополнения
+_TASK_SUGGESTION_COLUMNS = tuple(
+    getattr(TaskDAO.model, name) for name in TaskSuggestionSchema.model_fields
+)
+
+# Столбцы, загружаемые командой COPY при импорте задач
+_TASK_IMPORT_COLUMNS = ("user_id", "title", "description", "is_completed")
+
+# Ключи сортировки списка задач. Вместе с user_id в условии отбора они
+# покрываются индексами ix_tasks_user_id_created_at_id и
+# ix_tasks_user_id_is_completed_created_at_id соответственно.
+_TASKS_ORDER_BY = {
+    TaskSortField.CREATED_AT: (TaskDAO.model.created_at, TaskDAO.model.id),
+    TaskSortField.STATUS: (
+        TaskDAO.model.is_completed,
+        TaskDAO.model.created_at,
+        TaskDAO.model.id,
+    ),
+}
+
+# Курсор содержит поле и направление сортировки, чтобы курсор, полученный при
+# одних параметрах, нельзя было применить к списку с другой сортировкой.
+_TASKS_CURSOR_ADAPTERS = {
+    TaskSortField.CREATED_AT: TypeAdapter(
+        tuple[TaskSortField, SortOrder, datetime, int],
+    ),
+    TaskSortField.STATUS: TypeAdapter(
+        tuple[TaskSortField, SortOrder, bool, datetime, int],
+    ),
+}
+
+# Курсор поиска содержит хэш поискового запроса, чтобы его нельзя было
+# применить к результатам другого запроса
+_TASKS_SEARCH_CURSOR_ADAPTER = TypeAdapter(tuple[str, float, int])
+
+_BULK_SELECTOR_REQUIRED_MSG = "Необходимо указать ids или status, отличный от all"
+
+_TASKS_STATUS_FILTERS = {
+    TaskStatusFilter.ALL: (),
+    # Условие совпадает с предикатом частичного индекса ..._pending
+    TaskStatusFilter.PENDING: (~TaskDAO.model.is_completed,),
+    TaskStatusFilter.COMPLETED: (TaskDAO.model.is_completed,),
+}
 
 
 # MARK: Create
@@ -47,34 +157,582 @@ async def create_task(
     except ValidationError as e:
         raise TaskCreateException from e
 
-    await session.commit()
+    await _commit_tasks_write(session=session, user_id=user_id)
     return response_data
 
 
+async def create_tasks(
+    *,
+    session: AsyncSession,
+    tasks_data: list[dict[str, Any]],
+    user_id: int,
+) -> TaskBatchCreateResponseSchema:
+    """
+    Создает несколько задач одним запросом INSERT в одной транзакции.
+    Элементы, не прошедшие валидацию, пропускаются и возвращаются в списке ошибок.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        tasks_data (list[dict]): Данные задач в формате TaskCreateSchema
+        user_id (int): Идентификатор пользователя, создающего задачи
+    Returns:
+        Созданные задачи в порядке следования в пакете и ошибки валидации
+    Raises:
+        TaskCreateException: Если задачи не были созданы
+    """
+    valid_tasks = []
+    errors = []
+
+    for index, item in enumerate(tasks_data):
+        try:
+            valid_tasks.append(TaskCreateSchema.model_validate(item))
+        except ValidationError as e:
+            errors.append(
+                TaskBatchErrorSchema(
+                    index=index,
+                    errors=e.errors(include_url=False, include_context=False),
+                ),
+            )
+
+    # Все строки содержат одинаковый набор полей, чтобы они ушли в БД одним
+    # многострочным INSERT
+    db_tasks = await TaskDAO.add_many(
+        session,
+        [{**task.model_dump(), "user_id": user_id} for task in valid_tasks],
+    )
+    if len(db_tasks) != len(valid_tasks):
+        raise TaskCreateException
+
+    try:
+        created_tasks = [TaskResponseSchema.model_validate(task) for task in db_tasks]
+    except ValidationError as e:
+        raise TaskCreateException from e
+
+    if created_tasks:
+        await _commit_tasks_write(session=session, user_id=user_id)
+
+    return TaskBatchCreateResponseSchema(
+        tasks=created_tasks,
+        errors=errors,
+    )
+
+
+async def import_tasks(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    chunks: AsyncIterable[bytes],
+    import_format: TaskFileFormat,
+) -> TaskImportResponseSchema:
+    """
+    Загружает задачи пользователя из файла в формате NDJSON (по одной задаче
+    в строке) или CSV (с заголовком). Файл разбирается и проверяется по мере
+    поступления, а корректные записи загружаются в БД командой COPY пачками по
+    `TASKS_IMPORT_CHUNK_SIZE`, поэтому файл никогда не хранится в памяти
+    целиком.
+
+    Записи, не прошедшие валидацию, пропускаются. Все остальные загружаются в
+    одной транзакции: если разобрать файл не удалось, не загружается ни одна
+    задача.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя, загружающего задачи
+        chunks (AsyncIterable[bytes]): Содержимое файла
+        import_format (TaskFileFormat): Формат файла
+    Returns:
+        Количество загруженных и отклоненных записей и ошибки валидации
+    Raises:
+        TaskImportException: Если файл не удалось разобрать
+    """
+    imported = 0
+    rejected = 0
+    errors = []
+    records = []
+
+    async def flush():
+        nonlocal imported
+        await TaskDAO.copy_records(session, records, columns=_TASK_IMPORT_COLUMNS)
+        imported += len(records)
+        records.clear()
+        logger.info(
+            "Импорт задач пользователя %s: загружено %s, отклонено %s",
+            user_id,
+            imported,
+            rejected,
+        )
+
+    try:
+        async for index, item in _iter_import_items(chunks, import_format):
+            try:
+                if isinstance(item, str):
+                    task = TaskCreateSchema.model_validate_json(item)
+                else:
+                    task = TaskCreateSchema.model_validate(item)
+            except ValidationError as e:
+                rejected += 1
+                if len(errors) < TASKS_IMPORT_MAX_ERRORS:
+                    errors.append(
+                        TaskBatchErrorSchema(
+                            index=index,
+                            errors=e.errors(include_url=False, include_context=False),
+                        ),
+                    )
+                continue
+
+            records.append((user_id, task.title, task.description, False))
+            if len(records) >= TASKS_IMPORT_CHUNK_SIZE:
+                await flush()
+
+        if records:
+            await flush()
+    except ValueError as e:
+        raise TaskImportException(msg=f"Не удалось разобрать файл: {e}") from e
+
+    if imported:
+        await _commit_tasks_write(session=session, user_id=user_id)
+
+    return TaskImportResponseSchema(
+        imported=imported,
+        rejected=rejected,
+        errors=errors,
+    )
+
+
+async def _iter_import_items(
+    chunks: AsyncIterable[bytes],
+    import_format: TaskFileFormat,
+) -> AsyncIterator[tuple[int, str | dict[str, str]]]:
+    """
+    Разбирает файл с задачами на записи: строки JSON для NDJSON и словари
+    «поле — значение» для CSV. Пустые строки пропускаются.
+    """
+    index = 0
+
+    if import_format == TaskFileFormat.NDJSON:
+        async for line in iter_lines(chunks, max_line_size=TASKS_IMPORT_MAX_LINE_SIZE):
+            if line.strip():
+                yield index, line
+                index += 1
+        return
+
+    header = None
+    async for row in iter_csv_rows(chunks, max_line_size=TASKS_IMPORT_MAX_LINE_SIZE):
+        if not row:
+            continue
+        if header is None:
+            header = row
+            if "title" not in header:
+                raise ValueError("заголовок CSV должен содержать поле title")
+            continue
+
+        # Пустые значения не передаются, чтобы к ним применились значения
+        # по умолчанию
+        yield index, {name: value for name, value in zip(header, row) if value}
+        index += 1
+
+
 # MARK: Read
 async def get_user_tasks(
     *,
     session: AsyncSession,
     user_id: int,
-) -> list[TaskResponseSchema]:
+    limit: int,
+    after: str | None = None,
+    status: TaskStatusFilter = TaskStatusFilter.ALL,
+    sort: TaskSortField = TaskSortField.CREATED_AT,
+    order: SortOrder = SortOrder.ASC,
+) -> TaskListResponseSchema:
     """
-    Получает все задачи пользователя.
+    Получает страницу задач пользователя с фильтрацией и сортировкой на стороне БД.
 
     Args:
         session: Асинхронная сессия SQLAlchemy
         user_id (int): Идентификатор пользователя
+        limit (int): Максимальное количество задач на странице
+        after (str | None): Курсор, полученный вместе с предыдущей страницей
+        status (TaskStatusFilter): Фильтр по статусу выполнения
+        sort (TaskSortField): Поле сортировки
+        order (SortOrder): Направление сортировки
     Returns:
-        Список задач пользователя
+        Страница задач пользователя и курсор для получения следующей страницы
+    Raises:
+        InvalidCursorException: Если передан некорректный курсор
     """
-    db_tasks = await TaskDAO.find_all(
-        session=session,
+    # Запрашиваем на одну задачу больше, чтобы узнать, есть ли следующая страница,
+    # не выполняя отдельный COUNT
+    rows = await TaskDAO.find_all_mappings(
+        session,
+        *_TASKS_STATUS_FILTERS[status],
+        columns=_TASK_RESPONSE_COLUMNS,
+        order_by=_TASKS_ORDER_BY[sort],
+        descending=order == SortOrder.DESC,
+        after=_decode_tasks_cursor(after=after, sort=sort, order=order),
+        limit=limit + 1,
         user_id=user_id,
     )
 
-    if not db_tasks:
-        return []
+    return _make_tasks_page(rows=rows, limit=limit, sort=sort, order=order)
+
+
+async def get_user_tasks_with_etag(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    limit: int,
+    after: str | None = None,
+    status: TaskStatusFilter = TaskStatusFilter.ALL,
+    sort: TaskSortField = TaskSortField.CREATED_AT,
+    order: SortOrder = SortOrder.ASC,
+    query: tuple[Any, ...] = (),
+) -> tuple[str, TaskListResponseSchema]:
+    """
+    Одним запросом к БД получает страницу задач пользователя вместе с ETag
+    списка (см. `get_user_tasks` и `get_user_tasks_etag`). Используется для
+    самого частого запроса - списка задач, - чтобы ETag и страница не
+    требовали двух последовательных обращений к БД.
+
+    Пользователь должен быть заранее авторизован по данным основной БД:
+    сессия может быть открыта на реплике, данные пользователя на которой
+    могут отставать.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя
+        limit (int): Максимальное количество задач на странице
+        after (str | None): Курсор, полученный вместе с предыдущей страницей
+        status (TaskStatusFilter): Фильтр по статусу выполнения
+        sort (TaskSortField): Поле сортировки
+        order (SortOrder): Направление сортировки
+        query (tuple): Параметры запроса страницы для вычисления ETag
+    Returns:
+        ETag и страница задач
+    Raises:
+        InvalidCursorException: Если передан некорректный курсор
+    """
+    rows = await TaskDAO.find_owner_page(
+        session,
+        user_id,
+        *_TASKS_STATUS_FILTERS[status],
+        columns=_TASK_RESPONSE_COLUMNS,
+        order_by=_TASKS_ORDER_BY[sort],
+        descending=order == SortOrder.DESC,
+        after=_decode_tasks_cursor(after=after, sort=sort, order=order),
+        limit=limit + 1,
+    )
+
+    # Пользователь, только что созданный на основной БД, может еще не
+    # появиться на реплике: у него нет задач
+    tasks_version = rows[0]["owner_tasks_version"] if rows else 0
+    task_rows = [
+        {column.key: row[column.key] for column in _TASK_RESPONSE_COLUMNS}
+        for row in rows
+        if row["id"] is not None
+    ]
+
+    return (
+        make_etag(user_id, tasks_version, *query),
+        _make_tasks_page(rows=task_rows, limit=limit, sort=sort, order=order),
+    )
 
-    return [TaskResponseSchema.model_validate(task) for task in db_tasks]
+
+async def get_user_tasks_etag(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    query: tuple[Any, ...] = (),
+) -> str:
+    """
+    Вычисляет ETag списка задач пользователя без загрузки самих задач.
+
+    ETag строится по версии списка задач пользователя и параметрам запроса,
+    от которых зависит содержимое страницы. Версия увеличивается при каждой
+    записи задач пользователя (см. `_commit_tasks_write`), поэтому ETag
+    вычисляется чтением одной строки пользователя по первичному ключу, а не
+    просмотром всех его задач.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя
+        query (tuple): Параметры запроса страницы (лимит, курсор, фильтр, сортировка)
+    Returns:
+        str: ETag для заголовка ответа
+    """
+    tasks_version = await UserDAO.get_tasks_version(session, user_id)
+    return make_etag(user_id, tasks_version or 0, *query)
+
+
+async def get_user_tasks_json(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    limit: int,
+    after: str | None = None,
+    status: TaskStatusFilter = TaskStatusFilter.ALL,
+    sort: TaskSortField = TaskSortField.CREATED_AT,
+    order: SortOrder = SortOrder.ASC,
+    query: tuple[Any, ...] = (),
+    if_none_match: str | None = None,
+) -> tuple[str, bytes | None]:
+    """
+    Возвращает ETag и сериализованную в JSON страницу задач пользователя.
+    Страница берется из кэша `tasks_cache`, а при его отсутствии загружается
+    из БД вместе с ETag одним запросом и сохраняется в кэш.
+
+    При условном запросе сначала проверяется ETag (см. `get_user_tasks_etag`):
+    при его совпадении страница не загружается ни из кэша, ни из БД, а при
+    промахе кэша загружается только страница.
+
+    Версия кэша читается до обращения к БД: если задачи изменятся во время
+    загрузки, страница сохранится под уже устаревшей версией и не будет
+    прочитана.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя
+        limit (int): Максимальное количество задач на странице
+        after (str | None): Курсор, полученный вместе с предыдущей страницей
+        status (TaskStatusFilter): Фильтр по статусу выполнения
+        sort (TaskSortField): Поле сортировки
+        order (SortOrder): Направление сортировки
+        query (tuple): Параметры запроса страницы, от которых зависит ее
+            содержимое
+        if_none_match (str | None): Значение заголовка `If-None-Match`
+    Returns:
+        ETag и тело ответа в формате JSON; вместо тела None, если ETag
+        совпал с `if_none_match`
+    Raises:
+        InvalidCursorException: Если передан некорректный курсор
+    """
+    version = None
+    if settings.TASKS_CACHE_ENABLED:
+        version = await tasks_cache.get_version(_tasks_version_key(user_id))
+
+    etag = None
+    if if_none_match is not None:
+        etag = await get_user_tasks_etag(session=session, user_id=user_id, query=query)
+        if etag_matches(etag=etag, if_none_match=if_none_match):
+            return etag, None
+
+    if version is not None:
+        key = _tasks_page_key(user_id=user_id, version=version, query=query)
+        cached = await tasks_cache.get(key)
+        if cached is not None:
+            cached_etag, _, body = cached.partition(b"\n")
+            return cached_etag.decode(), body
+
+    if etag is None:
+        etag, tasks = await get_user_tasks_with_etag(
+            session=session,
+            user_id=user_id,
+            limit=limit,
+            after=after,
+            status=status,
+            sort=sort,
+            order=order,
+            query=query,
+        )
+    else:
+        tasks = await get_user_tasks(
+            session=session,
+            user_id=user_id,
+            limit=limit,
+            after=after,
+            status=status,
+            sort=sort,
+            order=order,
+        )
+    body = tasks.__pydantic_serializer__.to_json(tasks)
+
+    if version is not None:
+        await tasks_cache.set(key, etag.encode() + b"\n" + body)
+
+    return etag, body
+
+
+def _tasks_version_key(user_id: int) -> str:
+    return f"tasks:{user_id}:version"
+
+
+def _tasks_page_key(*, user_id: int, version: int, query: tuple[Any, ...]) -> str:
+    # Хэш параметров запроса вместо них самих ограничивает длину ключа
+    query_hash = make_etag(*query).strip('"')
+    return f"tasks:{user_id}:{version}:{query_hash}"
+
+
+def _decode_tasks_cursor(
+    *,
+    after: str | None,
+    sort: TaskSortField,
+    order: SortOrder,
+) -> list[Any] | None:
+    """Возвращает значения ключа сортировки из курсора страницы задач."""
+    if after is None:
+        return None
+
+    try:
+        cursor_sort, cursor_order, *after_values = decode_cursor(
+            cursor=after,
+            adapter=_TASKS_CURSOR_ADAPTERS[sort],
+        )
+    except ValueError as e:
+        raise InvalidCursorException from e
+
+    if (cursor_sort, cursor_order) != (sort, order):
+        raise InvalidCursorException
+
+    return after_values
+
+
+def _make_tasks_page(
+    *,
+    rows: Sequence[Mapping[str, Any]],
+    limit: int,
+    sort: TaskSortField,
+    order: SortOrder,
+) -> TaskListResponseSchema:
+    """
+    Создает страницу задач из строк БД, запрошенных с лимитом `limit + 1`:
+    лишняя строка означает, что есть следующая страница.
+    """
+    # Строки получены из нашей же БД и уже соответствуют схеме, поэтому
+    # схемы ответа создаются без повторной валидации
+    tasks = [TaskResponseSchema.model_construct(**row) for row in rows[:limit]]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last_task = tasks[-1]
+        next_cursor = encode_cursor(
+            values=(
+                sort,
+                order,
+                *(getattr(last_task, column.key) for column in _TASKS_ORDER_BY[sort]),
+            ),
+        )
+
+    return TaskListResponseSchema.model_construct(
+        tasks=tasks,
+        total=len(tasks),
+        next_cursor=next_cursor,
+    )
+
+
+async def search_user_tasks(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    text: str,
+    limit: int,
+    after: str | None = None,
+) -> TaskListResponseSchema:
+    """
+    Ищет задачи пользователя по заголовку и описанию полнотекстовым поиском.
+    Задачи упорядочены по релевантности: совпадения в заголовке весят
+    больше совпадений в описании.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя
+        text (str): Поисковый запрос в синтаксисе веб-поиска: слова, фразы в
+            кавычках, `or` и исключение слов с `-`
+        limit (int): Максимальное количество задач на странице
+        after (str | None): Курсор, полученный вместе с предыдущей страницей
+    Returns:
+        Страница найденных задач и курсор для получения следующей страницы
+    Raises:
+        InvalidCursorException: Если передан некорректный курсор
+    """
+    text_hash = make_etag(text).strip('"')
+
+    after_values = None
+    if after is not None:
+        try:
+            cursor_hash, *after_values = decode_cursor(
+                cursor=after,
+                adapter=_TASKS_SEARCH_CURSOR_ADAPTER,
+            )
+        except ValueError as e:
+            raise InvalidCursorException from e
+
+        if cursor_hash != text_hash:
+            raise InvalidCursorException
+
+    rows = await TaskDAO.search(
+        session,
+        text,
+        columns=_TASK_RESPONSE_COLUMNS,
+        after=after_values,
+        limit=limit + 1,
+        user_id=user_id,
+    )
+
+    tasks = [
+        TaskResponseSchema.model_construct(
+            **{column.key: row[column.key] for column in _TASK_RESPONSE_COLUMNS}
+        )
+        for row in rows[:limit]
+    ]
+
+    next_cursor = None
+    if len(rows) > limit:
+        last_row = rows[limit - 1]
+        next_cursor = encode_cursor(
+            values=(text_hash, last_row["rank"], last_row["id"]),
+        )
+
+    return TaskListResponseSchema.model_construct(
+        tasks=tasks,
+        total=len(tasks),
+        next_cursor=next_cursor,
+    )
+
+
+async def autocomplete_user_tasks(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    text: str,
+    limit: int,
+) -> TaskSuggestionListResponseSchema:
+    """
+    Подбирает задачи пользователя, заголовок которых содержит набранный
+    текст или похожее на него слово (с опечаткой или недописанное).
+
+    Первый запрос серии выполняется сразу. Запрос, отправленный быстрее
+    `TASKS_AUTOCOMPLETE_DEBOUNCE_SECONDS` после предыдущего, выполняется
+    после такой же задержки; если за это время пользователь отправил новый
+    запрос, текущий завершается сразу и без обращения к БД.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя
+        text (str): Набранный пользователем текст
+        limit (int): Максимальное количество подсказок
+    Returns:
+        Подсказки, упорядоченные по убыванию сходства с текстом
+    Raises:
+        TaskAutocompleteSupersededException: Если пользователь отправил
+            более новый запрос
+    """
+    if not await tasks_autocomplete_debouncer.settle(user_id):
+        raise TaskAutocompleteSupersededException
+
+    rows = await TaskDAO.autocomplete(
+        session,
+        text,
+        columns=_TASK_SUGGESTION_COLUMNS,
+        limit=limit,
+        user_id=user_id,
+    )
+
+    return TaskSuggestionListResponseSchema.model_construct(
+        tasks=[
+            TaskSuggestionSchema.model_construct(
+                **{column.key: row[column.key] for column in _TASK_SUGGESTION_COLUMNS}
+            )
+            for row in rows
+        ]
+    )
 
 
 async def get_task_by_id(
@@ -112,6 +770,54 @@ async def get_task_by_id(
         raise TaskNotFoundException from e
 
 
+async def export_user_tasks(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    export_format: TaskFileFormat,
+) -> AsyncIterator[bytes]:
+    """
+    Выгружает все задачи пользователя в порядке создания, отдавая результат по
+    частям. Задачи читаются из БД через серверный курсор пачками по
+    `TASKS_EXPORT_CHUNK_SIZE`, поэтому потребление памяти не зависит от
+    количества задач.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя
+        export_format (TaskFileFormat): Формат выгрузки
+    Yields:
+        bytes: Очередная часть выгрузки в кодировке UTF-8
+    """
+    serializer = TaskResponseSchema.__pydantic_serializer__
+
+    if export_format == TaskFileFormat.CSV:
+        yield _to_csv([list(TaskResponseSchema.model_fields)])
+
+    async for rows in TaskDAO.stream_mappings(
+        session,
+        columns=_TASK_RESPONSE_COLUMNS,
+        order_by=_TASKS_ORDER_BY[TaskSortField.CREATED_AT],
+        chunk_size=TASKS_EXPORT_CHUNK_SIZE,
+        user_id=user_id,
+    ):
+        tasks = (TaskResponseSchema.model_construct(**row) for row in rows)
+
+        if export_format == TaskFileFormat.NDJSON:
+            yield b"".join(serializer.to_json(task) + b"\n" for task in tasks)
+        else:
+            # Значения приводятся к тому же виду, что и в JSON-ответах API
+            yield _to_csv(
+                serializer.to_python(task, mode="json").values() for task in tasks
+            )
+
+
+def _to_csv(rows: Iterable[Iterable[Any]]) -> bytes:
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(rows)
+    return buffer.getvalue().encode()
+
+
 # MARK: Update
 async def update_task(
     *,
@@ -154,10 +860,59 @@ async def update_task(
     except ValidationError as e:
         raise TaskUpdateException from e
 
-    await session.commit()
+    await _commit_tasks_write(session=session, user_id=user_id)
     return response_data
 
 
+async def update_tasks(
+    *,
+    session: AsyncSession,
+    task_data: TaskUpdateSchema,
+    user_id: int,
+    ids: list[int] | None = None,
+    status: TaskStatusFilter | None = None,
+) -> TaskBulkResultSchema:
+    """
+    Обновляет задачи пользователя, выбранные по идентификаторам и/или статусу,
+    одним запросом UPDATE.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        task_data (TaskUpdateSchema): Данные для обновления задач
+        user_id (int): Идентификатор пользователя, обновляющего задачи
+        ids (list[int] | None): Идентификаторы обновляемых задач
+        status (TaskStatusFilter | None): Статус выполнения обновляемых задач
+    Returns:
+        Идентификаторы и количество обновленных задач
+    Raises:
+        TaskUpdateException: Если не указаны условия выбора задач или данные
+            для обновления
+    """
+    # Без явно указанных ids или status массовая операция не выполняется, чтобы
+    # случайный запрос без параметров не затронул все задачи пользователя
+    if not _has_bulk_selector(ids=ids, status=status):
+        raise TaskUpdateException(msg=_BULK_SELECTOR_REQUIRED_MSG)
+
+    update_data = task_data.model_dump(
+        exclude_unset=True,
+        exclude_none=True,
+    )
+    if not update_data:
+        raise TaskUpdateException(msg="Не указаны данные для обновления задач")
+
+    task_ids = await TaskDAO.update_many(
+        session,
+        *_bulk_tasks_filter(user_id=user_id, ids=ids, status=status),
+        obj_in=update_data,
+    )
+
+    # Если задачи не выбраны, список не изменился: версия списка и кэши
+    # других процессов остаются действительными
+    if task_ids:
+        await _commit_tasks_write(session=session, user_id=user_id)
+    return TaskBulkResultSchema(ids=task_ids, count=len(task_ids))
+
+
 # MARK: Delete
 async def delete_task(
     *,
@@ -187,4 +942,103 @@ async def delete_task(
     if row_count != 1:
         raise TaskDeleteException
 
+    await _commit_tasks_write(session=session, user_id=user_id)
+
+
+async def delete_tasks(
+    *,
+    session: AsyncSession,
+    user_id: int,
+    ids: list[int] | None = None,
+    status: TaskStatusFilter | None = None,
+) -> TaskBulkResultSchema:
+    """
+    Удаляет задачи пользователя, выбранные по идентификаторам и/или статусу,
+    одним запросом DELETE.
+
+    Args:
+        session: Асинхронная сессия SQLAlchemy
+        user_id (int): Идентификатор пользователя, удаляющего задачи
+        ids (list[int] | None): Идентификаторы удаляемых задач
+        status (TaskStatusFilter | None): Статус выполнения удаляемых задач
+    Returns:
+        Идентификаторы и количество удаленных задач
+    Raises:
+        TaskDeleteException: Если не указаны условия выбора задач
+    """
+    if not _has_bulk_selector(ids=ids, status=status):
+        raise TaskDeleteException(msg=_BULK_SELECTOR_REQUIRED_MSG)
+
+    task_ids = await TaskDAO.delete_many(
+        session,
+        *_bulk_tasks_filter(user_id=user_id, ids=ids, status=status),
+    )
+
+    if task_ids:
+        await _commit_tasks_write(session=session, user_id=user_id)
+    return TaskBulkResultSchema(ids=task_ids, count=len(task_ids))
+
+
+async def _commit_tasks_write(*, session: AsyncSession, user_id: int) -> None:
+    """
+    Фиксирует изменения задач пользователя вместе с увеличением версии его
+    списка задач и сбрасывает зависящие от них кэши: в текущем процессе сразу,
+    а в остальных - по уведомлению, которое доставляется вместе с фиксацией
+    транзакции.
+    """
+    await UserDAO.increment_tasks_version(session, user_id)
+    await publish_invalidation(session, user_id=user_id)
     await session.commit()
+
+    mark_user_write(user_id)
+    if settings.TASKS_CACHE_ENABLED:
+        await tasks_cache.bump_version(_tasks_version_key(user_id))
+
+
+async def evict_user_tasks_cache(user_id: int) -> None:
+    """
+    Сбрасывает страницы списка задач пользователя, если кэш хранится в памяти
+    процесса. Общее хранилище уже сброшено процессом, изменившим задачи.
+
+    Args:
+        user_id (int): Идентификатор пользователя
+    """
+    if tasks_cache.local:
+        await tasks_cache.bump_version(_tasks_version_key(user_id))
+
+
+def clear_tasks_cache() -> None:
+    """Удаляет все страницы списка задач, если кэш хранится в памяти процесса."""
+    if tasks_cache.local:
+        tasks_cache.clear()
+
+
+def _has_bulk_selector(
+    *,
+    ids: list[int] | None,
+    status: TaskStatusFilter | None,
+) -> bool:
+    """
+    Проверяет, что массовая операция выбирает задачи явно: по идентификаторам
+    или по статусу. Статус `all` выбирает все задачи пользователя, поэтому
+    условием выбора не считается.
+    """
+    return ids is not None or status not in (None, TaskStatusFilter.ALL)
+
+
+def _bulk_tasks_filter(
+    *,
+    user_id: int,
+    ids: list[int] | None,
+    status: TaskStatusFilter | None,
+) -> tuple:
+    """Возвращает условия выбора задач пользователя для массовых операций."""
+    conditions = [TaskDAO.model.user_id == user_id]
+
+    if ids is not None:
+        conditions.append(TaskDAO.model.id.in_(ids))
+
+    if status is not None:
+        conditions.extend(_TASKS_STATUS_FILTERS[status])
+
+    return tuple(conditions)
@@ -3,10 +3,11 @@
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db import UserDAO
+from app.db import UserDAO, mark_user_write
 from app.schemas import UserCreateSchema, UserResponseSchema
+from app.services.auth import invalidate_principal
 from app.services.exceptions import EmailAlreadyExistsException
-from app.utils import hash_password
+from app.utils import hash_password_async
 
 
 async def create_user(
@@ -24,18 +25,30 @@ async def create_user(
         UserResponseSchema: Ответ с данными созданного пользователя.
     Raises:
         EmailAlreadyExistsException: Если пользователь с таким email уже существует.
+        ServiceOverloadedException: Если пул хэширования паролей перегружен.
     """
 
+    # Хэш вычисляем до обращения к БД, чтобы не держать соединение во время
+    # ожидания в очереди пула хэширования
+    password_hash = await hash_password_async(plaintext=user_data.password)
+
     try:
         db_user = await UserDAO.add(
             session=session,
             obj_in={
                 **user_data.model_dump(exclude=("password",)),
-                "password_hash": hash_password(plaintext=user_data.password),
+                "password_hash": password_hash,
             },
         )
         await session.commit()
     except IntegrityError as ex:
         raise EmailAlreadyExistsException from ex
 
+    # Сбрасываем запись, которая могла остаться от удалённого пользователя
+    # с тем же email
+    invalidate_principal(user_id=db_user.id, email=db_user.email)
+    # Сразу после регистрации пользователь читает свои данные с основной БД:
+    # реплика может еще не содержать его
+    mark_user_write(db_user.id)
+
     return UserResponseSchema.model_validate(db_user)
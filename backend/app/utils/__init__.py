@@ -1,6 +1,13 @@
-from app.utils.security import hash_password, verify_password
+from app.utils.security import (
+    hash_password,
+    hash_password_async,
+    verify_password,
+    verify_password_async,
+)
 
 __all__ = [
     "hash_password",
+    "hash_password_async",
     "verify_password",
+    "verify_password_async",
 ]
@@ -0,0 +1,351 @@
+"""
+Содержит реализацию ограниченного по размеру кэша с временем жизни записей и
+хранилища кэша для сериализованных данных: в памяти процесса или на сервере,
+поддерживающем протокол Redis.
+"""
+
+import asyncio
+import logging
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from time import monotonic
+from typing import Callable, Generic, Hashable, TypeVar
+
+from app.core.metrics import (
+    CACHE_ENTRIES,
+    CACHE_ERRORS,
+    CACHE_HITS,
+    CACHE_MISSES,
+    CACHE_SIZE_BYTES,
+)
+from app.utils.resp import RespClient, RespError
+
+logger = logging.getLogger(__name__)
+
+K = TypeVar("K", bound=Hashable)
+V = TypeVar("V")
+
+
+class TTLCache(Generic[K, V]):
+    """
+    Кэш в памяти процесса с вытеснением давно не использовавшихся записей (LRU)
+    и ограниченным временем жизни записей (TTL).
+
+    Кэш используется из одного event loop, поэтому блокировки не нужны.
+    Попадания и промахи учитываются в метриках Prometheus с меткой `name`.
+    Кэш с `ttl <= 0` или `maxsize <= 0` отключён: ничего не хранит и всегда
+    возвращает промах.
+
+    Если указана функция `weigher`, кроме количества записей ограничивается
+    и их суммарный размер: записи вытесняются, пока сумма `weigher(value)`
+    превышает `maxweight`.
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        maxsize: int,
+        ttl: float,
+        weigher: Callable[[V], int] | None = None,
+        maxweight: int = 0,
+    ):
+        self.name = name
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.weigher = weigher
+        self.maxweight = maxweight
+        self.weight = 0
+        self._data: OrderedDict[K, tuple[float, V]] = OrderedDict()
+
+        self._hits = CACHE_HITS.labels(cache=name)
+        self._misses = CACHE_MISSES.labels(cache=name)
+        CACHE_ENTRIES.labels(cache=name).set_function(lambda: len(self._data))
+        if weigher is not None:
+            CACHE_SIZE_BYTES.labels(cache=name).set_function(lambda: self.weight)
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl > 0 and self.maxsize > 0
+
+    def get(self, key: K) -> V | None:
+        """Возвращает значение по ключу или None, если записи нет или она устарела."""
+
+        item = self._data.get(key)
+        if item is None:
+            self._misses.inc()
+            return None
+
+        expires_at, value = item
+        if expires_at <= monotonic():
+            self._pop(key)
+            self._misses.inc()
+            return None
+
+        self._data.move_to_end(key)
+        self._hits.inc()
+        return value
+
+    def set(self, key: K, value: V) -> None:
+        """Сохраняет значение, при переполнении вытесняя самые старые записи."""
+
+        if not self.enabled:
+            return
+
+        self._pop(key)
+        if self.weigher is not None:
+            weight = self.weigher(value)
+            if weight > self.maxweight:
+                # Запись больше всего кэша: сохранять её бессмысленно
+                return
+            self.weight += weight
+
+        self._data[key] = (monotonic() + self.ttl, value)
+
+        while len(self._data) > self.maxsize or (
+            self.weigher is not None and self.weight > self.maxweight
+        ):
+            self._pop(next(iter(self._data)))
+
+    def invalidate(self, key: K) -> None:
+        """Удаляет запись по ключу, если она есть."""
+
+        self._pop(key)
+
+    def clear(self) -> None:
+        """Удаляет все записи."""
+
+        self._data.clear()
+        self.weight = 0
+
+    def _pop(self, key: K) -> None:
+        item = self._data.pop(key, None)
+        if item is not None and self.weigher is not None:
+            self.weight -= self.weigher(item[1])
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+# MARK: Backends
+
+
+class CacheBackend(ABC):
+    """
+    Хранилище кэша сериализованных данных с версионированием ключей.
+
+    Вместо удаления устаревших записей увеличивается версия группы записей
+    (например, всех страниц списка задач пользователя), которая входит в их
+    ключи: записи со старой версией больше не читаются и вытесняются сами.
+
+    Ошибки хранилища не должны приводить к ошибкам запросов: при недоступности
+    хранилища `get` и `get_version` возвращают None, а запись пропускается.
+
+    Атрибут `local` означает, что данные хранятся в памяти процесса и изменения
+    версий не видны другим процессам приложения.
+    """
+
+    local: bool = False
+
+    def __init__(self, *, name: str, ttl: float):
+        self.name = name
+        self.ttl = ttl
+
+    @abstractmethod
+    async def get(self, key: str) -> bytes | None:
+        """Возвращает значение по ключу или None, если его нет."""
+
+    @abstractmethod
+    async def set(self, key: str, value: bytes) -> None:
+        """Сохраняет значение на время `ttl`."""
+
+    @abstractmethod
+    async def get_version(self, key: str) -> int | None:
+        """
+        Возвращает текущую версию по ключу, создавая её при отсутствии, или
+        None, если хранилище недоступно.
+        """
+
+    @abstractmethod
+    async def bump_version(self, key: str) -> None:
+        """Меняет версию по ключу, делая недоступными записи старой версии."""
+
+    async def close(self) -> None:
+        """Освобождает ресурсы хранилища."""
+
+    @staticmethod
+    def _new_version() -> int:
+        # Версии не увеличиваются на единицу, а берутся из текущего времени:
+        # если ключ версии вытеснен или истёк, новая версия не совпадёт ни с
+        # одной из прежних и не вернёт к жизни записи, оставшиеся от них
+        return time.time_ns()
+
+
+class MemoryCacheBackend(CacheBackend):
+    """
+    Хранилище в памяти процесса с вытеснением давно не использовавшихся
+    записей при превышении количества записей или их суммарного размера.
+
+    Изменения версий видны только в текущем процессе, поэтому хранилище
+    подходит для запуска приложения в одном процессе, либо вместе с шиной
+    сброса кэшей между процессами (см. `app.db.invalidation`).
+    """
+
+    local = True
+
+    def __init__(self, *, name: str, ttl: float, maxsize: int, maxbytes: int):
+        super().__init__(name=name, ttl=ttl)
+        self._entries: TTLCache[str, bytes] = TTLCache(
+            name=name,
+            maxsize=maxsize,
+            ttl=ttl,
+            weigher=len,
+            maxweight=maxbytes,
+        )
+        # Версия живёт не меньше записей, созданных при ней
+        self._versions: TTLCache[str, int] = TTLCache(
+            name=f"{name}_versions",
+            maxsize=maxsize,
+            ttl=ttl,
+        )
+
+    async def get(self, key: str) -> bytes | None:
+        return self._entries.get(key)
+
+    async def set(self, key: str, value: bytes) -> None:
+        self._entries.set(key, value)
+
+    async def get_version(self, key: str) -> int | None:
+        version = self._versions.get(key)
+        if version is None:
+            version = self._new_version()
+            self._versions.set(key, version)
+        return version
+
+    async def bump_version(self, key: str) -> None:
+        self._versions.set(key, self._new_version())
+
+    def clear(self) -> None:
+        """Удаляет все записи и версии."""
+
+        self._entries.clear()
+        self._versions.clear()
+
+
+class RedisCacheBackend(CacheBackend):
+    """
+    Хранилище на сервере, поддерживающем протокол Redis (Redis, Valkey,
+    KeyDB и т.п.). Версии общие для всех процессов приложения.
+
+    Время жизни записей задаётся сервером, а ограничение памяти и политика
+    вытеснения - его настройками (`maxmemory`, `maxmemory-policy allkeys-lru`).
+    """
+
+    def __init__(
+        self,
+        *,
+        name: str,
+        ttl: float,
+        url: str,
+        timeout: float,
+        pool_size: int,
+    ):
+        super().__init__(name=name, ttl=ttl)
+        self._client = RespClient(url, timeout=timeout, pool_size=pool_size)
+        self._ttl_ms = str(int(ttl * 1000))
+        self._hits = CACHE_HITS.labels(cache=name)
+        self._misses = CACHE_MISSES.labels(cache=name)
+        self._errors = CACHE_ERRORS.labels(cache=name)
+
+    async def get(self, key: str) -> bytes | None:
+        value = await self._execute("GET", key)
+        if value is None:
+            self._misses.inc()
+        else:
+            self._hits.inc()
+        return value
+
+    async def set(self, key: str, value: bytes) -> None:
+        await self._execute("SET", key, value, "PX", self._ttl_ms)
+
+    async def get_version(self, key: str) -> int | None:
+        version = await self._execute("GET", key)
+        if version is None:
+            # Версию могли создать параллельно в другом процессе: NX сохраняет
+            # только первую, поэтому после записи версия читается повторно
+            await self._execute(
+                "SET", key, str(self._new_version()), "NX", "PX", self._ttl_ms
+            )
+            version = await self._execute("GET", key)
+        if version is None:
+            return None
+
+        try:
+            return int(version)
+        except ValueError:
+            self._errors.inc()
+            logger.warning("Некорректная версия в кэше %s: %r", self.name, version)
+            return None
+
+    async def bump_version(self, key: str) -> None:
+        await self._execute("SET", key, str(self._new_version()), "PX", self._ttl_ms)
+
+    async def close(self) -> None:
+        await self._client.close()
+
+    async def _execute(self, *args: str | bytes) -> bytes | None:
+        try:
+            return await self._client.execute(*args)
+        except (OSError, EOFError, asyncio.TimeoutError, RespError, ValueError):
+            self._errors.inc()
+            logger.warning("Ошибка хранилища кэша %s", self.name, exc_info=True)
+            return None
+
+
+def create_cache_backend(
+    *,
+    name: str,
+    url: str,
+    ttl: float,
+    maxsize: int,
+    maxbytes: int,
+    timeout: float,
+    pool_size: int,
+) -> CacheBackend:
+    """
+    Создаёт хранилище кэша по URL: `memory://` - в памяти процесса,
+    `redis://[[user]:password@]host[:port][/db]` - на сервере Redis.
+
+    Args:
+        name (str): Имя кэша для метрик.
+        url (str): URL хранилища.
+        ttl (float): Время жизни записей в секундах.
+        maxsize (int): Максимальное количество записей в памяти процесса.
+        maxbytes (int): Максимальный суммарный размер записей в памяти процесса.
+        timeout (float): Время ожидания ответа сервера в секундах.
+        pool_size (int): Максимальное количество соединений с сервером.
+    Returns:
+        CacheBackend: Хранилище кэша.
+    Raises:
+        ValueError: Если схема URL не поддерживается.
+    """
+
+    if url.startswith("memory://"):
+        return MemoryCacheBackend(
+            name=name,
+            ttl=ttl,
+            maxsize=maxsize,
+            maxbytes=maxbytes,
+        )
+
+    if url.startswith("redis://"):
+        return RedisCacheBackend(
+            name=name,
+            ttl=ttl,
+            url=url,
+            timeout=timeout,
+            pool_size=pool_size,
+        )
+
+    raise ValueError(f"Неподдерживаемое хранилище кэша: {url}")
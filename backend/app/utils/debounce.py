@@ -0,0 +1,77 @@
+"""Содержит подавление устаревших операций, повторяемых с тем же ключом."""
+
+import asyncio
+from typing import Generic, Hashable, TypeVar
+
+from app.core.metrics import DEBOUNCED_CALLS
+from app.utils.cache import TTLCache
+
+K = TypeVar("K", bound=Hashable)
+
+
+class Debouncer(Generic[K]):
+    """
+    Пропускает операции, вместо которых вскоре запрошена более новая
+    операция с тем же ключом (например, запросы автодополнения одного
+    пользователя при наборе текста).
+
+    Операция, перед которой `delay` секунд не было операций с тем же ключом,
+    выполняется сразу, без задержки. Операции, следующие за ней быстрее,
+    ждут `delay` секунд: если за это время запрошена более новая операция,
+    ожидающая завершается сразу и пропускается.
+
+    Состояние хранится в памяти процесса и используется из одного event loop,
+    поэтому операции с одним ключом, обработанные разными процессами, друг
+    друга не вытесняют. Время последних операций хранится не больше чем для
+    `maxsize` ключей. Пропущенные операции учитываются в метрике с меткой
+    `name`.
+    """
+
+    def __init__(self, *, name: str, delay: float, maxsize: int):
+        self.name = name
+        self.delay = delay
+        self._recent: TTLCache[K, bool] = TTLCache(
+            name=f"{name}_recent",
+            maxsize=maxsize,
+            ttl=delay,
+        )
+        self._pending: dict[K, asyncio.Event] = {}
+        self._debounced = DEBOUNCED_CALLS.labels(name=name)
+
+    async def settle(self, key: K) -> bool:
+        """
+        Определяет, нужно ли выполнять операцию с ключом `key`, при
+        необходимости дожидаясь, пока она не станет последней за `delay`
+        секунд.
+
+        Args:
+            key (K): Ключ операции.
+        Returns:
+            bool: True, если операцию нужно выполнить, False, если за время
+            ожидания запрошена более новая операция с тем же ключом.
+        """
+
+        if self.delay <= 0:
+            return True
+
+        recent = self._recent.get(key) is not None
+        self._recent.set(key, True)
+
+        previous = self._pending.get(key)
+        if previous is not None:
+            previous.set()
+        elif not recent:
+            return True
+
+        superseded = self._pending[key] = asyncio.Event()
+        try:
+            async with asyncio.timeout(self.delay):
+                await superseded.wait()
+        except TimeoutError:
+            return True
+        finally:
+            if self._pending.get(key) is superseded:
+                del self._pending[key]
+
+        self._debounced.inc()
+        return False
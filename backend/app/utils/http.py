@@ -0,0 +1,95 @@
+"""Содержит вспомогательные функции для условных HTTP-запросов."""
+
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime
+from typing import Any
+
+from fastapi import Response, status
+from pydantic import BaseModel
+
+
+def make_etag(*parts: Any) -> str:
+    """
+    Создаёт сильный ETag из значений, однозначно определяющих версию ресурса.
+
+    Args:
+        parts: Значения, от которых зависит содержимое ресурса.
+    Returns:
+        str: ETag в кавычках, готовый для заголовка ответа.
+    """
+
+    digest = hashlib.blake2b(repr(parts).encode(), digest_size=16).hexdigest()
+    return f'"{digest}"'
+
+
+def etag_matches(
+    *,
+    etag: str,
+    if_none_match: str | None,
+) -> bool:
+    """
+    Проверяет, совпадает ли ETag ресурса с одним из ETag из заголовка
+    `If-None-Match`. Для `If-None-Match` используется слабое сравнение
+    (RFC 9110, 13.1.2), поэтому префикс `W/` игнорируется.
+
+    Args:
+        etag (str): Текущий ETag ресурса.
+        if_none_match (str | None): Значение заголовка `If-None-Match`.
+    Returns:
+        bool: True, если клиент уже располагает актуальной версией ресурса.
+    """
+
+    if not if_none_match:
+        return False
+
+    if if_none_match.strip() == "*":
+        return True
+
+    return any(
+        candidate.strip().removeprefix("W/") == etag
+        for candidate in if_none_match.split(",")
+    )
+
+
+def format_http_date(value: datetime) -> str:
+    """Форматирует дату для заголовков `Last-Modified` и `Expires`."""
+
+    return format_datetime(value.astimezone(timezone.utc), usegmt=True)
+
+
+def json_response(
+    content: BaseModel | bytes,
+    *,
+    status_code: int = status.HTTP_200_OK,
+    headers: dict[str, str] | None = None,
+) -> Response:
+    """
+    Сериализует схему в JSON скомпилированным сериализатором pydantic-core и
+    возвращает готовый ответ.
+
+    Если обработчик маршрута возвращает схему, FastAPI повторно валидирует её
+    по `response_model` и только затем сериализует. Для схем, собранных из
+    данных нашей БД через `model_construct`, эта валидация избыточна, а на
+    больших списках занимает большую часть времени обработки запроса.
+    `response_model` при этом стоит оставить в декораторе маршрута — он
+    по-прежнему используется для документации OpenAPI.
+
+    Args:
+        content (BaseModel | bytes): Схема ответа или уже сериализованный
+            JSON, например, из кэша.
+        status_code (int): Статус-код ответа.
+        headers (dict[str, str] | None): Дополнительные заголовки ответа.
+    Returns:
+        Response: Ответ с телом в формате JSON.
+    """
+
+    if isinstance(content, BaseModel):
+        content = content.__pydantic_serializer__.to_json(content)
+
+    return Response(
+        content=content,
+        status_code=status_code,
+        headers=headers,
+        media_type="application/json",
+    )
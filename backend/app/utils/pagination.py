@@ -0,0 +1,55 @@
+"""Содержит функции для работы с курсорами keyset-пагинации."""
+
+from base64 import urlsafe_b64decode, urlsafe_b64encode
+from typing import Any, Sequence, TypeVar
+
+from pydantic import TypeAdapter
+
+T = TypeVar("T")
+
+_cursor_adapter = TypeAdapter(list[Any])
+
+
+def encode_cursor(
+    *,
+    values: Sequence[Any],
+) -> str:
+    """
+    Кодирует значения ключа сортировки в непрозрачный для клиента курсор.
+
+    Args:
+        values (Sequence[Any]): Значения ключа сортировки последнего объекта
+            на странице.
+    Returns:
+        str: Курсор в виде строки, безопасной для использования в URL.
+    """
+
+    raw = _cursor_adapter.dump_json(list(values))
+    return urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(
+    *,
+    cursor: str,
+    adapter: TypeAdapter[T],
+) -> T:
+    """
+    Декодирует курсор, полученный от клиента, и проверяет типы значений.
+
+    Args:
+        cursor (str): Курсор, ранее созданный функцией `encode_cursor`.
+        adapter (TypeAdapter): Адаптер, описывающий ожидаемый ключ сортировки.
+    Returns:
+        Значения ключа сортировки.
+    Raises:
+        ValueError: Если курсор повреждён или не соответствует ключу сортировки.
+    """
+
+    padding = "=" * (-len(cursor) % 4)
+
+    try:
+        raw = urlsafe_b64decode(cursor + padding)
+        return adapter.validate_json(raw)
+    except ValueError as ex:
+        # binascii.Error и ValidationError являются подклассами ValueError
+        raise ValueError("Некорректный курсор пагинации") from ex
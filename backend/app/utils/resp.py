@@ -0,0 +1,172 @@
+"""
+Содержит минимальный асинхронный клиент протокола Redis (RESP2) для
+хранилища кэша.
+
+Клиент поддерживает только то, что нужно кэшу: выполнение команд на
+небольшом пуле соединений и разбор ответов. На каждом соединении команды
+выполняются последовательно, поэтому клиент рассчитан на короткие команды
+вроде GET/SET.
+"""
+
+import asyncio
+from typing import Any
+from urllib.parse import unquote, urlsplit
+
+
+class RespError(Exception):
+    """Ошибка, возвращённая сервером в ответ на команду."""
+
+
+class RespClient:
+    """
+    Клиент сервера, поддерживающего протокол Redis.
+
+    Команда выполняется на свободном соединении пула, поэтому команды
+    параллельных запросов не ждут друг друга; одновременно открыто не больше
+    `pool_size` соединений, а остальные команды ждут освобождения соединения.
+    Соединения открываются по мере необходимости. Если команда завершилась
+    ошибкой соединения, некорректным ответом, тайм-аутом или была отменена,
+    её соединение закрывается, так как в нём может остаться непрочитанный
+    ответ.
+    """
+
+    def __init__(self, url: str, *, timeout: float, pool_size: int):
+        """
+        Args:
+            url (str): URL сервера `redis://[[user]:password@]host[:port][/db]`.
+            timeout (float): Время ожидания свободного соединения, подключения
+                и ответа в секундах.
+            pool_size (int): Максимальное количество соединений.
+        Raises:
+            ValueError: Если URL некорректен.
+        """
+
+        parsed = urlsplit(url)
+        if parsed.scheme != "redis":
+            raise ValueError(f"Неподдерживаемая схема URL: {parsed.scheme}")
+
+        self.host = parsed.hostname or "localhost"
+        self.port = parsed.port or 6379
+        self.username = unquote(parsed.username) if parsed.username else None
+        self.password = unquote(parsed.password) if parsed.password else None
+        self.db = int(parsed.path.lstrip("/") or 0)
+        self.timeout = timeout
+
+        self._idle: list[_RespConnection] = []
+        self._slots = asyncio.Semaphore(pool_size)
+
+    async def execute(self, *args: str | bytes) -> Any:
+        """
+        Выполняет команду и возвращает ответ сервера.
+
+        Args:
+            *args (str | bytes): Команда и её аргументы.
+        Returns:
+            Any: Строка, число, bytes, список или None.
+        Raises:
+            RespError: Если сервер вернул ошибку.
+            OSError: Если не удалось подключиться или соединение разорвано.
+            ValueError: Если ответ сервера некорректен.
+            asyncio.TimeoutError: Если за время ожидания не освободилось
+                соединение или сервер не ответил.
+        """
+
+        async with asyncio.timeout(self.timeout), self._slots:
+            connection = self._idle.pop() if self._idle else await self._connect()
+            try:
+                reply = await connection.send(args)
+            except RespError:
+                self._idle.append(connection)
+                raise
+            except BaseException:
+                connection.close()
+                raise
+
+            self._idle.append(connection)
+            return reply
+
+    async def close(self) -> None:
+        """Закрывает свободные соединения с сервером."""
+
+        idle, self._idle = self._idle, []
+        for connection in idle:
+            connection.close()
+            try:
+                await connection.writer.wait_closed()
+            except OSError:
+                pass
+
+    async def _connect(self) -> "_RespConnection":
+        reader, writer = await asyncio.open_connection(self.host, self.port)
+        connection = _RespConnection(reader, writer)
+        try:
+            if self.password is not None:
+                if self.username is not None:
+                    await connection.send(("AUTH", self.username, self.password))
+                else:
+                    await connection.send(("AUTH", self.password))
+            if self.db:
+                await connection.send(("SELECT", str(self.db)))
+        except BaseException:
+            # Неаутентифицированное соединение нельзя оставлять для
+            # следующих команд
+            connection.close()
+            raise
+        return connection
+
+
+class _RespConnection:
+    """Соединение с сервером, на котором команды выполняются по одной."""
+
+    def __init__(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        self.reader = reader
+        self.writer = writer
+
+    def close(self) -> None:
+        self.writer.close()
+
+    async def send(self, args: tuple[str | bytes, ...]) -> Any:
+        self.writer.write(encode_command(args))
+        await self.writer.drain()
+        return await self._read_reply()
+
+    async def _read_reply(self) -> Any:
+        line = await self.reader.readuntil(b"\r\n")
+        prefix, data = line[:1], line[1:-2]
+
+        if prefix == b"+":
+            return data.decode()
+        if prefix == b"-":
+            raise RespError(data.decode(errors="replace"))
+        if prefix == b":":
+            return int(data)
+        if prefix == b"$":
+            length = int(data)
+            if length < 0:
+                return None
+            return (await self.reader.readexactly(length + 2))[:-2]
+        if prefix == b"*":
+            length = int(data)
+            if length < 0:
+                return None
+            return [await self._read_reply() for _ in range(length)]
+
+        # Ответ не разобран до конца: соединение придётся закрыть
+        raise ConnectionError(f"Неизвестный тип ответа: {prefix!r}")
+
+
+def encode_command(args: tuple[str | bytes, ...]) -> bytes:
+    """
+    Кодирует команду в формат протокола: массив bulk-строк.
+
+    Args:
+        args (tuple[str | bytes, ...]): Команда и её аргументы.
+    Returns:
+        bytes: Закодированная команда.
+    """
+
+    parts = [b"*%d\r\n" % len(args)]
+    for arg in args:
+        value = arg.encode() if isinstance(arg, str) else arg
+        parts.append(b"$%d\r\n%s\r\n" % (len(value), value))
+    return b"".join(parts)
@@ -1,15 +1,37 @@
 """Содержит функции для работы с хэшами паролей."""
 
+import asyncio
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
+from time import perf_counter
+from typing import Callable, TypeVar
 
 import jwt
 from passlib.context import CryptContext
 
 from app.core.config import settings
 from app.core.constants import AUTH_ALGORITHM
+from app.core.exceptions import ServiceOverloadedException
+from app.core.metrics import (
+    PASSWORD_HASH_PENDING,
+    PASSWORD_HASH_REJECTED,
+    PASSWORD_HASH_SECONDS,
+    PASSWORD_HASH_WAIT_SECONDS,
+)
+
+T = TypeVar("T")
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt освобождает GIL на время вычисления хэша, поэтому для вынесения
+# хэширования из event loop достаточно пула потоков.
+_hash_executor: ThreadPoolExecutor | None = None
+# Количество операций в работе и в очереди пула. Уменьшается из потока пула,
+# поэтому изменяется под блокировкой
+_hash_pending: int = 0
+_hash_pending_lock = threading.Lock()
+
 
 def verify_password(
     *,
@@ -49,12 +71,20 @@ def hash_password(
 def create_access_token(
     *,
     email: str,
+    user_id: int | None = None,
+    token_version: int = 0,
 ) -> str:
     """
     Создаёт токен аутентификации (JWT) для пользователя с указанным email.
 
+    Токен содержит ID пользователя (`uid`) и версию токенов (`ver`), что
+    позволяет авторизовать запрос без поиска пользователя по email. Без
+    `user_id` создаётся токен старого формата, содержащий только `sub`.
+
     Args:
         email (str): Email пользователя, для которого создаётся токен.
+        user_id (int | None): ID пользователя.
+        token_version (int): Текущая версия токенов пользователя.
     Returns:
         str: Закодированный JWT токен.
     """
@@ -66,6 +96,10 @@ def create_access_token(
         "exp": int(exp.timestamp()),
     }
 
+    if user_id is not None:
+        data["uid"] = user_id
+        data["ver"] = token_version
+
     encoded_jwt = jwt.encode(
         data,
         settings.AUTH_SECRET_KEY,
@@ -73,3 +107,117 @@ def create_access_token(
     )
 
     return encoded_jwt
+
+
+async def verify_password_async(
+    *,
+    plain_password: str,
+    hashed: str,
+) -> bool:
+    """
+    Асинхронная версия `verify_password`: проверка выполняется в пуле потоков
+    и не блокирует event loop.
+
+    Args:
+        plain_password (str): Обычный пароль, который нужно проверить.
+        hashed (str): Хэшированный пароль, с которым нужно сравнить.
+    Returns:
+        bool: True, если пароли совпадают, иначе False.
+    Raises:
+        ServiceOverloadedException: Если очередь пула потоков переполнена.
+    """
+
+    return await _run_in_hash_executor(
+        "verify",
+        lambda: verify_password(plain_password=plain_password, hashed=hashed),
+    )
+
+
+async def hash_password_async(
+    *,
+    plaintext: str,
+) -> str:
+    """
+    Асинхронная версия `hash_password`: хэш вычисляется в пуле потоков
+    и не блокирует event loop.
+
+    Args:
+        plaintext (str): Строка, которую нужно захэшировать.
+    Returns:
+        str: Хэшированная строка.
+    Raises:
+        ServiceOverloadedException: Если очередь пула потоков переполнена.
+    """
+
+    return await _run_in_hash_executor(
+        "hash",
+        lambda: hash_password(plaintext=plaintext),
+    )
+
+
+def shutdown_password_hasher() -> None:
+    """Останавливает пул потоков для хэширования паролей."""
+
+    global _hash_executor
+
+    if _hash_executor is not None:
+        _hash_executor.shutdown(wait=False, cancel_futures=True)
+        _hash_executor = None
+
+
+async def _run_in_hash_executor(
+    operation: str,
+    func: Callable[[], T],
+) -> T:
+    """
+    Выполняет `func` в пуле потоков для хэширования паролей. Если операций в
+    работе и в очереди уже PASSWORD_HASH_MAX_PENDING, новая операция сразу
+    отклоняется: при всплеске входов лучше быстро ответить 503, чем копить
+    запросы, которые всё равно не уложатся в таймауты клиентов.
+
+    Операция считается до завершения в пуле, а не до завершения ожидающего
+    ее запроса: отмененный запрос не освобождает место, пока его операция
+    еще в очереди или выполняется.
+    """
+
+    global _hash_executor, _hash_pending
+
+    if _hash_pending >= settings.PASSWORD_HASH_MAX_PENDING:
+        PASSWORD_HASH_REJECTED.inc()
+        raise ServiceOverloadedException
+
+    if _hash_executor is None:
+        _hash_executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS,
+            thread_name_prefix="password-hash",
+        )
+
+    submitted_at = perf_counter()
+
+    def timed() -> T:
+        started_at = perf_counter()
+        PASSWORD_HASH_WAIT_SECONDS.observe(started_at - submitted_at)
+        try:
+            return func()
+        finally:
+            PASSWORD_HASH_SECONDS.labels(operation=operation).observe(
+                perf_counter() - started_at
+            )
+
+    future = _hash_executor.submit(timed)
+    with _hash_pending_lock:
+        _hash_pending += 1
+    PASSWORD_HASH_PENDING.inc()
+    future.add_done_callback(_release_hash_slot)
+
+    return await asyncio.wrap_future(future)
+
+
+def _release_hash_slot(future: Future) -> None:
+    # Вызывается из потока пула после выполнения операции или из потока,
+    # отменившего операцию, которая еще не начала выполняться
+    global _hash_pending
+
+    with _hash_pending_lock:
+        _hash_pending -= 1
+    PASSWORD_HASH_PENDING.dec()
@@ -0,0 +1,85 @@
+"""Содержит функции для построчного разбора потоковых данных."""
+
+import codecs
+import csv
+from typing import AsyncIterable, AsyncIterator
+
+
+async def iter_lines(
+    chunks: AsyncIterable[bytes],
+    *,
+    max_line_size: int,
+) -> AsyncIterator[str]:
+    """
+    Разбивает поток байтов в кодировке UTF-8 на строки по мере его поступления,
+    не накапливая поток целиком.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Поток байтов.
+        max_line_size (int): Максимальная длина строки в символах.
+    Yields:
+        str: Очередная строка без символов перевода строки.
+    Raises:
+        ValueError: Если поток не в кодировке UTF-8 или строка слишком длинная.
+    """
+
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    pending = ""
+
+    def check_size(line: str) -> str:
+        if len(line) > max_line_size:
+            raise ValueError(f"Длина строки превышает {max_line_size} символов")
+        return line
+
+    async for chunk in chunks:
+        *lines, pending = (pending + decoder.decode(chunk)).split("\n")
+        for line in lines:
+            yield check_size(line.removesuffix("\r"))
+
+        # Незавершенная строка проверяется сразу, чтобы не накапливать в
+        # памяти слишком длинную строку до ее конца
+        check_size(pending)
+
+    pending += decoder.decode(b"", final=True)
+    if pending:
+        yield check_size(pending.removesuffix("\r"))
+
+
+async def iter_csv_rows(
+    chunks: AsyncIterable[bytes],
+    *,
+    max_line_size: int,
+) -> AsyncIterator[list[str]]:
+    """
+    Разбирает поток CSV в кодировке UTF-8 на записи по мере его поступления.
+    Поддерживает значения в кавычках, содержащие переводы строк.
+
+    Args:
+        chunks (AsyncIterable[bytes]): Поток байтов.
+        max_line_size (int): Максимальная длина записи в символах.
+    Yields:
+        list[str]: Значения полей очередной записи.
+    Raises:
+        ValueError: Если поток содержит некорректный CSV или слишком длинную запись.
+    """
+
+    record = None
+
+    async for line in iter_lines(chunks, max_line_size=max_line_size):
+        record = line if record is None else f"{record}\n{line}"
+
+        # Нечетное количество кавычек означает, что значение в кавычках
+        # продолжается на следующей строке
+        if record.count('"') % 2:
+            if len(record) > max_line_size:
+                raise ValueError(f"Длина записи превышает {max_line_size} символов")
+            continue
+
+        try:
+            yield next(csv.reader([record]), [])
+        except csv.Error as e:
+            raise ValueError(f"Некорректная запись CSV: {e}") from e
+        record = None
+
+    if record is not None:
+        raise ValueError("Незакрытая кавычка в последней записи CSV")
@@ -0,0 +1,676 @@
+"""
+Нагрузочный тест HTTP API: пропускная способность и задержки всех маршрутов.
+
+Перед замером создаются `--users` пользователей с `--tasks` задачами каждый
+(через API, поэтому нужна только запущенная БД приложения). Затем каждый
+маршрут вызывается `--requests` раз с `--concurrency` одновременными
+запросами. Маршруты, изменяющие данные, выполняются после читающих, а
+`/auth/logout` - последним и не больше одного раза на пользователя, так как
+отзывает его токены.
+
+Без `--url` приложение запускается в текущем процессе и запросы передаются
+ему через `httpx.ASGITransport`, минуя сеть; с `--url` запросы отправляются
+запущенному серверу (например, `uvicorn app.main:app --workers 4`).
+
+Отчет в формате JSON содержит для каждого маршрута RPS и задержки p50, p95,
+p99. Режим `compare` сравнивает отчет с сохраненным базовым и завершается с
+кодом 1, если какой-либо маршрут стал медленнее больше чем на `--threshold`.
+
+Запуск (из каталога backend):
+
+    uv run python -m benchmarks.api run [--url http://localhost:8000]
+        [--users 10] [--tasks 1000] [--requests 500] [--concurrency 16]
+        [--routes "GET /api/v1/tasks" ...] [--output report.json]
+    uv run python -m benchmarks.api compare baseline.json report.json
+        [--threshold 0.1]
+"""
+
+import argparse
+import asyncio
+import json
+import math
+import platform
+import sys
+import time
+import uuid
+from collections import Counter
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Awaitable, Callable
+
+import httpx
+
+API_PREFIX = "/api/v1"
+PASSWORD = "Bench-password-1"
+# Регистрация и вход упираются в пул хэширования паролей, который отклоняет
+# запросы сверх своей очереди, поэтому пользователи создаются небольшими
+# группами
+SEED_CONCURRENCY = 4
+BULK_SIZE = 10
+IMPORT_SIZE = 100
+# Тексты задач, создаваемых `_ndjson_tasks`, содержат эти слова
+SEARCH_QUERIES = ("задача", "нагрузочный тест", "задача 7")
+# Набор слова «задача» по буквам и с опечаткой
+AUTOCOMPLETE_QUERIES = ("зад", "зада", "задач", "задача", "задча")
+LATENCY_METRICS = ("p50", "p95", "p99")
+
+
+# MARK: Seed
+
+
+@dataclass
+class BenchUser:
+    email: str
+    token: str
+    task_ids: list[int]
+    etag: str | None = None
+
+    @property
+    def headers(self) -> dict[str, str]:
+        return {"Authorization": f"Bearer {self.token}"}
+
+
+@dataclass
+class BenchContext:
+    run_id: str
+    users: list[BenchUser]
+
+    def user(self, index: int) -> BenchUser:
+        return self.users[index % len(self.users)]
+
+    def pop_task_ids(self, index: int, count: int) -> list[int]:
+        """Забирает у пользователя `count` задач для удаления."""
+
+        user = self.user(index)
+        ids = user.task_ids[-count:]
+        del user.task_ids[-count:]
+        return ids
+
+
+def _check(response: httpx.Response, expected_status: int) -> httpx.Response:
+    if response.status_code != expected_status:
+        raise RuntimeError(
+            f"{response.request.method} {response.request.url.path}: "
+            f"{response.status_code} {response.text[:200]}"
+        )
+    return response
+
+
+def _ndjson_tasks(count: int, prefix: str) -> bytes:
+    return b"\n".join(
+        json.dumps(
+            {
+                "title": f"{prefix} {i}",
+                "description": "Задача для нагрузочного теста",
+                "is_completed": i % 3 == 0,
+            },
+            ensure_ascii=False,
+        ).encode()
+        for i in range(count)
+    )
+
+
+async def seed(
+    client: httpx.AsyncClient,
+    *,
+    users: int,
+    tasks: int,
+) -> BenchContext:
+    """
+    Создает пользователей с задачами через API и загружает идентификаторы их
+    задач.
+
+    Args:
+        client (httpx.AsyncClient): Клиент API.
+        users (int): Количество пользователей.
+        tasks (int): Количество задач у каждого пользователя.
+    Returns:
+        BenchContext: Созданные пользователи и их токены.
+    Raises:
+        RuntimeError: Если API вернул неожиданный ответ.
+    """
+
+    run_id = uuid.uuid4().hex[:8]
+    semaphore = asyncio.Semaphore(SEED_CONCURRENCY)
+
+    async def seed_user(index: int) -> BenchUser:
+        email = f"bench-{run_id}-{index}@example.com"
+        credentials = {"email": email, "password": PASSWORD}
+
+        async with semaphore:
+            _check(
+                await client.post(f"{API_PREFIX}/auth/signup", json=credentials),
+                201,
+            )
+            response = _check(
+                await client.post(f"{API_PREFIX}/auth/login", json=credentials),
+                200,
+            )
+        user = BenchUser(
+            email=email, token=response.json()["access_token"], task_ids=[]
+        )
+
+        if tasks:
+            _check(
+                await client.post(
+                    f"{API_PREFIX}/tasks/import",
+                    content=_ndjson_tasks(tasks, "Задача"),
+                    headers=user.headers,
+                ),
+                201,
+            )
+            response = _check(
+                await client.get(f"{API_PREFIX}/tasks/export", headers=user.headers),
+                200,
+            )
+            user.task_ids = [
+                json.loads(line)["id"] for line in response.text.splitlines()
+            ]
+
+        return user
+
+    return BenchContext(
+        run_id=run_id,
+        users=list(await asyncio.gather(*(seed_user(i) for i in range(users)))),
+    )
+
+
+# MARK: Scenarios
+
+
+@dataclass
+class Scenario:
+    """
+    Нагрузка на один маршрут.
+
+    `send` отправляет i-й запрос, `limit` ограничивает количество запросов
+    для маршрутов, расходующих данные (например, удаляющих задачи), а
+    `prepare` выполняется перед замером. Ответы со статусами из
+    `also_expected` тоже не считаются ошибками.
+    """
+
+    name: str
+    expected_status: int
+    send: Callable[[httpx.AsyncClient, BenchContext, int], Awaitable[httpx.Response]]
+    limit: Callable[[BenchContext], int] | None = None
+    prepare: Callable[[httpx.AsyncClient, BenchContext], Awaitable[None]] | None = None
+    also_expected: tuple[int, ...] = ()
+
+
+async def _healthcheck(client, ctx, i):
+    return await client.get("/healthcheck")
+
+
+async def _signup(client, ctx, i):
+    return await client.post(
+        f"{API_PREFIX}/auth/signup",
+        json={
+            "email": f"bench-{ctx.run_id}-signup-{i}@example.com",
+            "password": PASSWORD,
+        },
+    )
+
+
+async def _login(client, ctx, i):
+    return await client.post(
+        f"{API_PREFIX}/auth/login",
+        json={"email": ctx.user(i).email, "password": PASSWORD},
+    )
+
+
+async def _me(client, ctx, i):
+    return await client.get(f"{API_PREFIX}/auth/me", headers=ctx.user(i).headers)
+
+
+async def _list_tasks(client, ctx, i):
+    return await client.get(f"{API_PREFIX}/tasks", headers=ctx.user(i).headers)
+
+
+async def _prepare_etags(client, ctx):
+    for user in ctx.users:
+        response = _check(
+            await client.get(f"{API_PREFIX}/tasks", headers=user.headers), 200
+        )
+        user.etag = response.headers["ETag"]
+
+
+async def _list_tasks_not_modified(client, ctx, i):
+    user = ctx.user(i)
+    return await client.get(
+        f"{API_PREFIX}/tasks",
+        headers={**user.headers, "If-None-Match": user.etag},
+    )
+
+
+async def _search_tasks(client, ctx, i):
+    return await client.get(
+        f"{API_PREFIX}/tasks/search",
+        params={"q": SEARCH_QUERIES[i % len(SEARCH_QUERIES)]},
+        headers=ctx.user(i).headers,
+    )
+
+
+async def _autocomplete_tasks(client, ctx, i):
+    return await client.get(
+        f"{API_PREFIX}/tasks/autocomplete",
+        params={"q": AUTOCOMPLETE_QUERIES[i % len(AUTOCOMPLETE_QUERIES)]},
+        headers=ctx.user(i).headers,
+    )
+
+
+async def _export_tasks(client, ctx, i):
+    return await client.get(f"{API_PREFIX}/tasks/export", headers=ctx.user(i).headers)
+
+
+async def _create_task(client, ctx, i):
+    return await client.post(
+        f"{API_PREFIX}/tasks",
+        json={"title": f"Новая задача {i}", "description": "Описание"},
+        headers=ctx.user(i).headers,
+    )
+
+
+async def _create_tasks_batch(client, ctx, i):
+    return await client.post(
+        f"{API_PREFIX}/tasks/batch",
+        json={
+            "tasks": [{"title": f"Пакетная задача {i}.{j}"} for j in range(BULK_SIZE)]
+        },
+        headers=ctx.user(i).headers,
+    )
+
+
+async def _import_tasks(client, ctx, i):
+    return await client.post(
+        f"{API_PREFIX}/tasks/import",
+        content=_ndjson_tasks(IMPORT_SIZE, f"Загруженная задача {i}"),
+        headers=ctx.user(i).headers,
+    )
+
+
+async def _update_task(client, ctx, i):
+    user = ctx.user(i)
+    task_id = user.task_ids[i % len(user.task_ids)]
+    return await client.patch(
+        f"{API_PREFIX}/tasks/{task_id}",
+        json={"is_completed": i % 2 == 0},
+        headers=user.headers,
+    )
+
+
+async def _update_tasks(client, ctx, i):
+    user = ctx.user(i)
+    start = i * BULK_SIZE % len(user.task_ids)
+    return await client.patch(
+        f"{API_PREFIX}/tasks",
+        json={
+            "ids": user.task_ids[start : start + BULK_SIZE],
+            "changes": {"is_completed": i % 2 == 0},
+        },
+        headers=user.headers,
+    )
+
+
+async def _delete_task(client, ctx, i):
+    (task_id,) = ctx.pop_task_ids(i, 1)
+    return await client.delete(
+        f"{API_PREFIX}/tasks/{task_id}", headers=ctx.user(i).headers
+    )
+
+
+async def _delete_tasks(client, ctx, i):
+    ids = ctx.pop_task_ids(i, BULK_SIZE)
+    return await client.delete(
+        f"{API_PREFIX}/tasks",
+        params={"ids": ids},
+        headers=ctx.user(i).headers,
+    )
+
+
+async def _logout(client, ctx, i):
+    return await client.post(f"{API_PREFIX}/auth/logout", headers=ctx.user(i).headers)
+
+
+def _min_tasks_per_user(ctx: BenchContext) -> int:
+    return min(len(user.task_ids) for user in ctx.users)
+
+
+def _unless_no_tasks(ctx: BenchContext) -> int:
+    # Маршрутам, изменяющим существующие задачи, нужны задачи у каждого
+    # пользователя; без них маршрут пропускается
+    return sys.maxsize if _min_tasks_per_user(ctx) else 0
+
+
+SCENARIOS = [
+    Scenario("GET /healthcheck", 200, _healthcheck),
+    Scenario("POST /api/v1/auth/signup", 201, _signup),
+    Scenario("POST /api/v1/auth/login", 200, _login),
+    Scenario("GET /api/v1/auth/me", 200, _me),
+    Scenario("GET /api/v1/tasks", 200, _list_tasks),
+    Scenario(
+        "GET /api/v1/tasks (If-None-Match)",
+        304,
+        _list_tasks_not_modified,
+        prepare=_prepare_etags,
+    ),
+    Scenario("GET /api/v1/tasks/search", 200, _search_tasks),
+    Scenario(
+        "GET /api/v1/tasks/autocomplete",
+        200,
+        _autocomplete_tasks,
+        # Запросы одного пользователя следуют друг за другом быстрее задержки
+        # подавления, поэтому часть из них вытесняется более новыми
+        also_expected=(204,),
+    ),
+    Scenario("GET /api/v1/tasks/export", 200, _export_tasks),
+    Scenario("POST /api/v1/tasks", 201, _create_task),
+    Scenario("POST /api/v1/tasks/batch", 201, _create_tasks_batch),
+    Scenario("POST /api/v1/tasks/import", 201, _import_tasks),
+    Scenario(
+        "PATCH /api/v1/tasks/{task_id}",
+        200,
+        _update_task,
+        limit=_unless_no_tasks,
+    ),
+    Scenario(
+        "PATCH /api/v1/tasks",
+        200,
+        _update_tasks,
+        limit=_unless_no_tasks,
+    ),
+    Scenario(
+        "DELETE /api/v1/tasks/{task_id}",
+        204,
+        _delete_task,
+        # Каждый запрос удаляет задачу, поэтому половина задач остается для
+        # массового удаления
+        limit=lambda ctx: _min_tasks_per_user(ctx) // 2 * len(ctx.users),
+    ),
+    Scenario(
+        "DELETE /api/v1/tasks",
+        200,
+        _delete_tasks,
+        limit=lambda ctx: _min_tasks_per_user(ctx) // BULK_SIZE * len(ctx.users),
+    ),
+    Scenario(
+        "POST /api/v1/auth/logout",
+        204,
+        _logout,
+        limit=lambda ctx: len(ctx.users),
+    ),
+]
+
+
+# MARK: Run
+
+
+def percentile(values: list[float], q: float) -> float:
+    """Возвращает перцентиль `q` отсортированного списка (метод ближайшего ранга)."""
+
+    rank = math.ceil(q / 100 * len(values))
+    return values[min(max(rank, 1), len(values)) - 1]
+
+
+def summarize(
+    latencies: list[float],
+    *,
+    errors: int,
+    elapsed: float,
+    statuses: Counter,
+) -> dict[str, Any]:
+    """Сводит результаты замера маршрута в словарь отчета."""
+
+    values = sorted(latencies)
+    return {
+        "requests": len(values),
+        "errors": errors,
+        "statuses": dict(statuses),
+        "duration_s": round(elapsed, 3),
+        "rps": round(len(values) / elapsed, 1),
+        "latency_ms": {
+            "mean": round(sum(values) / len(values) * 1000, 3),
+            "p50": round(percentile(values, 50) * 1000, 3),
+            "p95": round(percentile(values, 95) * 1000, 3),
+            "p99": round(percentile(values, 99) * 1000, 3),
+            "max": round(values[-1] * 1000, 3),
+        },
+    }
+
+
+async def run_scenario(
+    client: httpx.AsyncClient,
+    ctx: BenchContext,
+    scenario: Scenario,
+    *,
+    requests: int,
+    concurrency: int,
+) -> dict[str, Any] | None:
+    """
+    Выполняет `requests` запросов к маршруту с `concurrency` одновременными
+    запросами и возвращает сводку или None, если маршрут пропущен.
+    """
+
+    if scenario.limit is not None:
+        requests = min(requests, scenario.limit(ctx))
+    if requests <= 0:
+        return None
+
+    if scenario.prepare is not None:
+        await scenario.prepare(client, ctx)
+
+    indexes = iter(range(requests))
+    latencies: list[float] = []
+    statuses: Counter = Counter()
+    errors = 0
+
+    async def worker() -> None:
+        nonlocal errors
+        for index in indexes:
+            started_at = time.perf_counter()
+            try:
+                response = await scenario.send(client, ctx, index)
+                # Тело читается целиком, как это сделал бы клиент
+                await response.aread()
+            except httpx.HTTPError as ex:
+                statuses[type(ex).__name__] += 1
+                errors += 1
+            else:
+                statuses[str(response.status_code)] += 1
+                if response.status_code not in (
+                    scenario.expected_status,
+                    *scenario.also_expected,
+                ):
+                    errors += 1
+            latencies.append(time.perf_counter() - started_at)
+
+    started_at = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(min(concurrency, requests))))
+
+    return summarize(
+        latencies,
+        errors=errors,
+        elapsed=time.perf_counter() - started_at,
+        statuses=statuses,
+    )
+
+
+@asynccontextmanager
+async def open_client(
+    url: str | None, *, concurrency: int
+) -> AsyncIterator[httpx.AsyncClient]:
+    """Открывает клиент к запущенному серверу или к приложению в этом процессе."""
+
+    timeout = httpx.Timeout(60)
+    if url is not None:
+        limits = httpx.Limits(
+            max_connections=concurrency,
+            max_keepalive_connections=concurrency,
+        )
+        async with httpx.AsyncClient(
+            base_url=url, timeout=timeout, limits=limits
+        ) as client:
+            yield client
+        return
+
+    from app.main import app
+
+    # ASGITransport не выполняет lifespan: пулы соединений прогреваются и
+    # шина сброса кэшей запускается так же, как при запуске сервера
+    async with app.router.lifespan_context(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(
+            transport=transport,
+            base_url="http://bench",
+            timeout=timeout,
+        ) as client:
+            yield client
+
+
+async def run(args: argparse.Namespace) -> dict[str, Any]:
+    scenarios = [
+        scenario
+        for scenario in SCENARIOS
+        if not args.routes or scenario.name in args.routes
+    ]
+
+    async with open_client(args.url, concurrency=args.concurrency) as client:
+        print(
+            f"Создание {args.users} пользователей по {args.tasks} задач...",
+            file=sys.stderr,
+        )
+        ctx = await seed(client, users=args.users, tasks=args.tasks)
+
+        routes = {}
+        for scenario in scenarios:
+            summary = await run_scenario(
+                client,
+                ctx,
+                scenario,
+                requests=args.requests,
+                concurrency=args.concurrency,
+            )
+            if summary is None:
+                print(f"{scenario.name}: пропущен", file=sys.stderr)
+                continue
+            routes[scenario.name] = summary
+            print(_format_summary(scenario.name, summary), file=sys.stderr)
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "target": args.url or "asgi",
+            "users": args.users,
+            "tasks": args.tasks,
+            "requests": args.requests,
+            "concurrency": args.concurrency,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "routes": routes,
+    }
+
+
+def _format_summary(name: str, summary: dict[str, Any]) -> str:
+    latency = summary["latency_ms"]
+    return (
+        f"{name:<40} {summary['rps']:>9.1f} rps  "
+        f"p50 {latency['p50']:>8.2f}  p95 {latency['p95']:>8.2f}  "
+        f"p99 {latency['p99']:>8.2f} мс  ошибок {summary['errors']}"
+    )
+
+
+# MARK: Compare
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float,
+    min_delta_ms: float,
+) -> list[str]:
+    """
+    Сравнивает отчет с базовым и возвращает описания регрессий: рост задержек
+    больше чем на `threshold` (и не меньше чем на `min_delta_ms`, чтобы шум на
+    быстрых маршрутах не считался регрессией), падение RPS больше чем на
+    `threshold` или появление ошибок.
+    """
+
+    regressions = []
+    for name, base in baseline["routes"].items():
+        cur = current["routes"].get(name)
+        if cur is None:
+            print(f"{name}: нет в текущем отчете", file=sys.stderr)
+            continue
+
+        for metric in LATENCY_METRICS:
+            before, after = base["latency_ms"][metric], cur["latency_ms"][metric]
+            if after > before * (1 + threshold) and after - before >= min_delta_ms:
+                regressions.append(
+                    f"{name}: {metric} {before:.2f} -> {after:.2f} мс "
+                    f"({after / before - 1:+.0%})"
+                )
+
+        if cur["rps"] < base["rps"] * (1 - threshold):
+            regressions.append(
+                f"{name}: rps {base['rps']:.1f} -> {cur['rps']:.1f} "
+                f"({cur['rps'] / base['rps'] - 1:+.0%})"
+            )
+
+        if cur["errors"] > base["errors"]:
+            regressions.append(f"{name}: ошибок {base['errors']} -> {cur['errors']}")
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Выполнить замер")
+    run_parser.add_argument("--url", help="Адрес сервера; по умолчанию ASGI")
+    run_parser.add_argument("--users", type=int, default=10)
+    run_parser.add_argument("--tasks", type=int, default=1000)
+    run_parser.add_argument("--requests", type=int, default=500)
+    run_parser.add_argument("--concurrency", type=int, default=16)
+    run_parser.add_argument("--routes", nargs="+", help="Замерить только эти маршруты")
+    run_parser.add_argument("--output", help="Файл отчета; по умолчанию stdout")
+
+    compare_parser = subparsers.add_parser("compare", help="Сравнить с базовым отчетом")
+    compare_parser.add_argument("baseline")
+    compare_parser.add_argument("current")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+    compare_parser.add_argument("--min-delta-ms", type=float, default=1.0)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = json.dumps(asyncio.run(run(args)), ensure_ascii=False, indent=2)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as file:
+                file.write(report + "\n")
+        else:
+            print(report)
+        return
+
+    with open(args.baseline, encoding="utf-8") as file:
+        baseline = json.load(file)
+    with open(args.current, encoding="utf-8") as file:
+        current = json.load(file)
+
+    regressions = compare(
+        baseline,
+        current,
+        threshold=args.threshold,
+        min_delta_ms=args.min_delta_ms,
+    )
+    for regression in regressions:
+        print(regression)
+    if regressions:
+        sys.exit(1)
+    print("Регрессий не найдено")
+
+
+if __name__ == "__main__":
+    main()
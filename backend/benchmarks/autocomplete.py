@@ -0,0 +1,129 @@
+"""
+Замеряет задержку автодополнения задач (`autocomplete_user_tasks`) на БД,
+заполненной `app.tools.seed`, и выводит план запроса автодополнения.
+
+Запросы имитируют набор текста пользователями с наибольшим количеством
+задач: каждое слово из текстов задач набирается по буквам, начиная с
+`TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH` символов, а затем набирается с
+опечаткой. Замеряется время запроса к БД: задержка подавления устаревших
+запросов отключается.
+
+Запуск (из каталога backend):
+
+    uv run python -m app.tools.seed --users 10000 --tasks 1000000
+    uv run python -m benchmarks.autocomplete [--words 100] [--users 20]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+
+from app.core.constants import TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH
+from app.db.session import SessionLocal, engine
+from app.services import autocomplete_user_tasks, tasks_autocomplete_debouncer
+from app.tools.seed import WORDS
+from benchmarks.api import percentile
+from benchmarks.search import explain, heaviest_users
+
+
+def keystrokes(word: str, rng: random.Random) -> list[str]:
+    """Возвращает тексты, отправляемые при наборе слова, и слово с опечаткой."""
+
+    typed = [
+        word[:length]
+        for length in range(TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH, len(word) + 1)
+    ]
+    position = rng.randrange(1, len(word))
+    typo = word[:position] + rng.choice("абвгдеклмнопрст") + word[position + 1 :]
+    return typed + [typo]
+
+
+async def measure(
+    *,
+    users: list[int],
+    words: int,
+    limit: int,
+    rng: random.Random,
+) -> dict[str, float]:
+    """Возвращает количество запросов и перцентили их задержки в миллисекундах."""
+
+    candidates = [
+        word
+        for word in sorted(set(WORDS))
+        if len(word) >= TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH
+    ]
+    latencies = []
+    for _ in range(words):
+        user_id = rng.choice(users)
+        for text in keystrokes(rng.choice(candidates), rng):
+            async with SessionLocal() as session:
+                started_at = time.perf_counter()
+                await autocomplete_user_tasks(
+                    session=session,
+                    user_id=user_id,
+                    text=text,
+                    limit=limit,
+                )
+                latencies.append((time.perf_counter() - started_at) * 1000)
+
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    tasks_autocomplete_debouncer.delay = 0
+
+    rng = random.Random(args.seed)
+    users = await heaviest_users(args.users)
+    if not users:
+        sys.exit("В БД нет задач: заполните ее командой python -m app.tools.seed")
+
+    # Прогрев пула соединений и кэша страниц БД
+    await measure(users=users, words=5, limit=args.limit, rng=rng)
+    report = await measure(users=users, words=args.words, limit=args.limit, rng=rng)
+    print(json.dumps(report, indent=2))
+
+    print(
+        await explain(
+            lambda session: autocomplete_user_tasks(
+                session=session,
+                user_id=users[0],
+                text=WORDS[0][:TASKS_AUTOCOMPLETE_QUERY_MIN_LENGTH],
+                limit=args.limit,
+            )
+        ),
+        file=sys.stderr,
+    )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--words",
+        type=int,
+        default=100,
+        help="Количество набираемых слов",
+    )
+    parser.add_argument(
+        "--users",
+        type=int,
+        default=20,
+        help="Количество пользователей с наибольшим количеством задач",
+    )
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
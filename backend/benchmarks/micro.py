@@ -0,0 +1,271 @@
+"""
+Микробенчмарки отдельных слоев приложения: построение запросов в `BaseDAO`,
+валидация и сериализация схем, создание и проверка токенов.
+
+Каждый замер повторяется `--repeat` раз; в каждом повторе операция
+выполняется столько раз, чтобы повтор длился не меньше 0.2 с. В отчет
+попадает время одной операции: минимальное, медиана и среднее по повторам.
+
+С `--save` результаты сохраняются в `benchmarks/results/micro/` с датой и
+коммитом в имени файла. Режим `compare` сравнивает два сохраненных результата
+(по умолчанию - два последних) и завершается с кодом 1, если медиана
+какого-либо замера выросла больше чем на `--threshold`.
+
+БД не требуется: строки и модели создаются в памяти.
+
+Запуск (из каталога backend):
+
+    uv run python -m benchmarks.micro run [-k to_json] [--save]
+    uv run python -m benchmarks.micro compare [BASELINE CURRENT] [--threshold 0.1]
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import subprocess
+import sys
+import timeit
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Callable
+
+import jwt
+from pydantic import ValidationError
+from sqlalchemy.dialects import postgresql
+
+from app.core.config import settings
+from app.core.constants import AUTH_ALGORITHM
+from app.db import TaskDAO
+from app.models import TaskModel
+from app.schemas import TaskListResponseSchema, TaskResponseSchema, TaskUpdateSchema
+from app.utils.security import create_access_token
+from benchmarks.serialization import make_rows
+
+RESULTS_DIR = Path(__file__).parent / "results" / "micro"
+SIZES = (10, 100, 1_000, 10_000)
+
+
+# MARK: Cases
+
+
+def _dao_cases() -> dict[str, Callable[[], Any]]:
+    after = (datetime(2025, 1, 1, tzinfo=timezone.utc), 100)
+    dialect = postgresql.asyncpg.dialect()
+
+    def build_select():
+        return TaskDAO.build_select(
+            TaskModel.is_completed.is_(False),
+            order_by=(TaskModel.created_at, TaskModel.id),
+            after=after,
+            limit=101,
+            user_id=1,
+        )
+
+    def build_update():
+        return TaskDAO.build_update(
+            TaskModel.id == 1,
+            TaskModel.user_id == 1,
+            obj_in=TaskUpdateSchema(is_completed=True),
+        ).returning(TaskModel)
+
+    return {
+        "dao.find_all.build": build_select,
+        # Без кэша скомпилированных запросов, которым пользуется сессия
+        "dao.find_all.compile": lambda: build_select().compile(dialect=dialect),
+        "dao.update.build": build_update,
+        "dao.update.compile": lambda: build_update().compile(dialect=dialect),
+    }
+
+
+def _schema_cases() -> dict[str, Callable[[], Any]]:
+    cases = {}
+
+    for size in SIZES:
+        rows = make_rows(size)
+        models = [TaskModel(**row) for row in rows]
+        content = TaskListResponseSchema.model_construct(
+            tasks=[TaskResponseSchema.model_construct(**row) for row in rows],
+            total=size,
+            next_cursor=None,
+        )
+
+        cases[f"schema.task.model_validate[{size}]"] = lambda models=models: [
+            TaskResponseSchema.model_validate(task) for task in models
+        ]
+        cases[f"schema.task_list.to_json[{size}]"] = (
+            lambda content=content: content.__pydantic_serializer__.to_json(content)
+        )
+
+    def update_invalid():
+        try:
+            TaskUpdateSchema()
+        except ValidationError:
+            pass
+
+    cases["schema.task_update.check_at_least_one_field[valid]"] = (
+        lambda: TaskUpdateSchema(title="Новое название", is_completed=True)
+    )
+    cases["schema.task_update.check_at_least_one_field[invalid]"] = update_invalid
+    return cases
+
+
+def _security_cases() -> dict[str, Callable[[], Any]]:
+    token = create_access_token(email="user@example.com", user_id=1)
+
+    return {
+        "security.create_access_token": lambda: create_access_token(
+            email="user@example.com",
+            user_id=1,
+        ),
+        "security.jwt_decode": lambda: jwt.decode(
+            token,
+            settings.AUTH_SECRET_KEY,
+            algorithms=[AUTH_ALGORITHM],
+        ),
+    }
+
+
+def collect_cases() -> dict[str, Callable[[], Any]]:
+    return {**_dao_cases(), **_schema_cases(), **_security_cases()}
+
+
+# MARK: Run
+
+
+def measure(func: Callable[[], Any], *, repeat: int) -> dict[str, float]:
+    """Возвращает время одной операции в микросекундах по `repeat` повторам."""
+
+    timer = timeit.Timer(func)
+    # autorange подбирает количество операций так, чтобы повтор длился не
+    # меньше 0.2 с
+    number, _ = timer.autorange()
+    times = [t / number * 1e6 for t in timer.repeat(repeat=repeat, number=number)]
+
+    return {
+        "number": number,
+        "min_us": round(min(times), 3),
+        "median_us": round(statistics.median(times), 3),
+        "mean_us": round(statistics.mean(times), 3),
+        "stdev_us": round(statistics.stdev(times), 3) if repeat > 1 else 0.0,
+    }
+
+
+def _git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run(args: argparse.Namespace) -> dict[str, Any]:
+    results = {}
+    for name, func in collect_cases().items():
+        if args.k and args.k not in name:
+            continue
+        results[name] = measure(func, repeat=args.repeat)
+        print(
+            f"{name:<55} {results[name]['median_us']:>12.2f} мкс "
+            f"(мин. {results[name]['min_us']:.2f})",
+            file=sys.stderr,
+        )
+
+    return {
+        "meta": {
+            "created_at": datetime.now(timezone.utc).isoformat(),
+            "commit": _git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "repeat": args.repeat,
+        },
+        "benchmarks": results,
+    }
+
+
+def save(report: dict[str, Any]) -> Path:
+    """Сохраняет результаты в `RESULTS_DIR` и возвращает путь к файлу."""
+
+    RESULTS_DIR.mkdir(parents=True, exist_ok=True)
+    created_at = datetime.fromisoformat(report["meta"]["created_at"])
+    name = created_at.strftime("%Y%m%d-%H%M%S")
+    if report["meta"]["commit"]:
+        name += f"-{report['meta']['commit']}"
+
+    path = RESULTS_DIR / f"{name}.json"
+    path.write_text(json.dumps(report, ensure_ascii=False, indent=2) + "\n")
+    return path
+
+
+# MARK: Compare
+
+
+def compare(
+    baseline: dict[str, Any],
+    current: dict[str, Any],
+    *,
+    threshold: float,
+) -> list[str]:
+    """Возвращает описания замеров, медиана которых выросла больше чем на `threshold`."""
+
+    regressions = []
+    for name, base in baseline["benchmarks"].items():
+        cur = current["benchmarks"].get(name)
+        if cur is None:
+            continue
+
+        before, after = base["median_us"], cur["median_us"]
+        change = after / before - 1
+        line = f"{name:<55} {before:>12.2f} -> {after:>12.2f} мкс ({change:+.0%})"
+        print(line, file=sys.stderr)
+        if change > threshold:
+            regressions.append(line)
+
+    return regressions
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    subparsers = parser.add_subparsers(dest="command", required=True)
+
+    run_parser = subparsers.add_parser("run", help="Выполнить замеры")
+    run_parser.add_argument("-k", help="Выполнить замеры, в имени которых есть строка")
+    run_parser.add_argument("--repeat", type=int, default=5)
+    run_parser.add_argument("--save", action="store_true", help="Сохранить результаты")
+
+    compare_parser = subparsers.add_parser("compare", help="Сравнить результаты")
+    compare_parser.add_argument("files", nargs="*", metavar="FILE")
+    compare_parser.add_argument("--threshold", type=float, default=0.1)
+
+    args = parser.parse_args()
+
+    if args.command == "run":
+        report = run(args)
+        if args.save:
+            print(f"Результаты сохранены в {save(report)}", file=sys.stderr)
+        else:
+            print(json.dumps(report, ensure_ascii=False, indent=2))
+        return
+
+    files = [Path(file) for file in args.files] or sorted(RESULTS_DIR.glob("*.json"))[
+        -2:
+    ]
+    if len(files) != 2:
+        parser.error("Нужны два файла результатов")
+
+    baseline, current = (json.loads(file.read_text()) for file in files)
+    regressions = compare(baseline, current, threshold=args.threshold)
+    if regressions:
+        print("Регрессии:")
+        for regression in regressions:
+            print(regression)
+        sys.exit(1)
+    print("Регрессий не найдено")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+Замеряет задержку полнотекстового поиска задач (`search_user_tasks`) на БД,
+заполненной `app.tools.seed`, и выводит план поискового запроса.
+
+Поиск выполняется для пользователей с наибольшим количеством задач по
+словам и парам слов, из которых генератор составляет тексты задач, то есть
+для худшего случая: у таких пользователей больше всего совпадений.
+
+Запуск (из каталога backend):
+
+    uv run python -m app.tools.seed --users 10000 --tasks 1000000
+    uv run python -m benchmarks.search [--requests 500] [--users 20]
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from typing import Any, Awaitable, Callable
+
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.db.session import SessionLocal, engine
+from app.models import TaskModel
+from app.services import search_user_tasks
+from app.tools.seed import WORDS
+from benchmarks.api import percentile
+
+
+async def heaviest_users(count: int) -> list[int]:
+    async with SessionLocal() as session:
+        result = await session.execute(
+            select(TaskModel.user_id)
+            .group_by(TaskModel.user_id)
+            .order_by(func.count().desc())
+            .limit(count)
+        )
+        return list(result.scalars())
+
+
+async def measure(
+    *,
+    users: list[int],
+    queries: list[str],
+    requests: int,
+    limit: int,
+    rng: random.Random,
+) -> dict[str, float]:
+    """Возвращает перцентили задержки поиска в миллисекундах."""
+
+    latencies = []
+    for _ in range(requests):
+        user_id, text = rng.choice(users), rng.choice(queries)
+        async with SessionLocal() as session:
+            started_at = time.perf_counter()
+            await search_user_tasks(
+                session=session,
+                user_id=user_id,
+                text=text,
+                limit=limit,
+            )
+            latencies.append((time.perf_counter() - started_at) * 1000)
+
+    latencies.sort()
+    return {
+        "p50_ms": round(percentile(latencies, 50), 2),
+        "p95_ms": round(percentile(latencies, 95), 2),
+        "p99_ms": round(percentile(latencies, 99), 2),
+        "max_ms": round(latencies[-1], 2),
+    }
+
+
+async def explain(call: Callable[[AsyncSession], Awaitable[Any]]) -> str:
+    """
+    Возвращает план `EXPLAIN (ANALYZE, BUFFERS)` последнего запроса,
+    выполненного `call` в переданной сессии.
+    """
+
+    statements = []
+
+    def on_before_execute(conn, cursor, statement, parameters, context, executemany):
+        statements.append((statement, parameters))
+
+    async with SessionLocal() as session:
+        event.listen(engine.sync_engine, "before_cursor_execute", on_before_execute)
+        try:
+            await call(session)
+        finally:
+            event.remove(engine.sync_engine, "before_cursor_execute", on_before_execute)
+
+        statement, parameters = statements[-1]
+        connection = await session.connection()
+        raw_connection = await connection.get_raw_connection()
+        rows = await raw_connection.driver_connection.fetch(
+            f"EXPLAIN (ANALYZE, BUFFERS) {statement}",
+            *parameters,
+        )
+        return "\n".join(row[0] for row in rows)
+
+
+async def main_async(args: argparse.Namespace) -> None:
+    rng = random.Random(args.seed)
+    users = await heaviest_users(args.users)
+    if not users:
+        sys.exit("В БД нет задач: заполните ее командой python -m app.tools.seed")
+
+    queries = sorted(set(WORDS)) + [
+        f"{first} {second}" for first, second in zip(WORDS, WORDS[1:])
+    ]
+    # Прогрев пула соединений и кэша страниц БД
+    await measure(users=users, queries=queries, requests=20, limit=args.limit, rng=rng)
+    report = await measure(
+        users=users,
+        queries=queries,
+        requests=args.requests,
+        limit=args.limit,
+        rng=rng,
+    )
+    print(json.dumps(report, indent=2))
+
+    print(
+        await explain(
+            lambda session: search_user_tasks(
+                session=session,
+                user_id=users[0],
+                text=WORDS[0],
+                limit=args.limit,
+            )
+        ),
+        file=sys.stderr,
+    )
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument(
+        "--users",
+        type=int,
+        default=20,
+        help="Количество пользователей с наибольшим количеством задач",
+    )
+    parser.add_argument("--limit", type=int, default=20)
+    parser.add_argument("--seed", type=int, default=0)
+    asyncio.run(main_async(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
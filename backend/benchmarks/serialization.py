@@ -0,0 +1,108 @@
+"""
+Сравнивает скорость сериализации списка задач до и после перехода на
+быстрый путь без повторной валидации.
+
+- `validate` — прежний путь: `TaskResponseSchema.model_validate` для каждой
+  модели SQLAlchemy, затем валидация и сериализация `TaskListResponseSchema`
+  по `response_model` силами FastAPI и рендеринг `JSONResponse`.
+- `construct` — текущий путь: `model_construct` из строк БД и сериализация
+  в байты скомпилированным сериализатором pydantic-core (`json_response`).
+
+БД не требуется: строки и модели создаются в памяти.
+
+Запуск (из каталога backend):
+
+    uv run python -m benchmarks.serialization [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from fastapi.responses import JSONResponse
+from fastapi.routing import serialize_response
+from fastapi.utils import create_model_field
+
+from app.models import TaskModel
+from app.schemas import TaskListResponseSchema, TaskResponseSchema
+from app.utils.http import json_response
+
+RESPONSE_FIELD = create_model_field(
+    name="Response_get_user_tasks",
+    type_=TaskListResponseSchema,
+)
+
+
+def make_rows(size: int) -> list[dict[str, Any]]:
+    """Создает строки таблицы tasks в том виде, в каком их возвращает БД."""
+
+    created_at = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        {
+            "id": i,
+            "user_id": 1,
+            "title": f"Задача {i}",
+            "description": "Описание задачи " * 4,
+            "is_completed": i % 3 == 0,
+            "created_at": created_at + timedelta(seconds=i),
+            "updated_at": created_at + timedelta(seconds=i, minutes=5),
+        }
+        for i in range(1, size + 1)
+    ]
+
+
+def serialize_validate(models: list[TaskModel]) -> bytes:
+    tasks = [TaskResponseSchema.model_validate(task) for task in models]
+    content = TaskListResponseSchema(tasks=tasks, total=len(tasks))
+    serialized = asyncio.run(
+        serialize_response(field=RESPONSE_FIELD, response_content=content)
+    )
+    return JSONResponse(serialized).body
+
+
+def serialize_construct(rows: list[dict[str, Any]]) -> bytes:
+    tasks = [TaskResponseSchema.model_construct(**row) for row in rows]
+    content = TaskListResponseSchema.model_construct(
+        tasks=tasks,
+        total=len(tasks),
+        next_cursor=None,
+    )
+    return json_response(content).body
+
+
+def measure(func: Callable[[Any], bytes], data: Any, repeat: int) -> float:
+    """Возвращает лучшее время выполнения из `repeat` запусков, в секундах."""
+
+    best = float("inf")
+    for _ in range(repeat):
+        started_at = time.perf_counter()
+        func(data)
+        best = min(best, time.perf_counter() - started_at)
+    return best
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument(
+        "--sizes", nargs="+", type=int, default=[1_000, 10_000, 100_000]
+    )
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    print(f"{'задач':>8} {'validate, мс':>14} {'construct, мс':>14} {'ускорение':>10}")
+    for size in args.sizes:
+        rows = make_rows(size)
+        models = [TaskModel(**row) for row in rows]
+
+        validate = measure(serialize_validate, models, args.repeat)
+        construct = measure(serialize_construct, rows, args.repeat)
+        print(
+            f"{size:>8} {validate * 1000:>14.1f} {construct * 1000:>14.1f} "
+            f"{validate / construct:>9.1f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""Add_tasks_search_vector
+
+Revision ID: 5a2f8c1e9d47
+Revises: c4d7e91a0b36
+Create Date: 2026-10-18 16:27:45.318204
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = "5a2f8c1e9d47"
+down_revision: Union[str, None] = "c4d7e91a0b36"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Добавление вычисляемого столбца перезаписывает таблицу tasks под
+    # эксклюзивной блокировкой: на больших таблицах миграцию нужно выполнять
+    # в окно обслуживания
+    op.add_column(
+        "tasks",
+        sa.Column(
+            "search_vector",
+            postgresql.TSVECTOR(),
+            sa.Computed(
+                "setweight(to_tsvector('russian', title), 'A') || "
+                "setweight(to_tsvector('russian', coalesce(description, '')), 'B')",
+                persisted=True,
+            ),
+            nullable=True,
+            comment="Поисковый вектор заголовка (вес A) и описания (вес B) задачи",
+        ),
+    )
+    # btree_gin добавляет классы операторов GIN для скалярных типов, что
+    # позволяет включить user_id в GIN-индекс вместе с search_vector
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    op.create_index(
+        "ix_tasks_user_id_search_vector",
+        "tasks",
+        ["user_id", "search_vector"],
+        unique=False,
+        postgresql_using="gin",
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Расширение btree_gin не удаляется: его могут использовать другие объекты БД
+    op.drop_index(
+        "ix_tasks_user_id_search_vector",
+        table_name="tasks",
+        postgresql_using="gin",
+    )
+    op.drop_column("tasks", "search_vector")
@@ -0,0 +1,48 @@
+"""Add_tasks_user_id_title_trgm_index
+
+Revision ID: 9e3b6f0d1c28
+Revises: 5a2f8c1e9d47
+Create Date: 2026-10-18 18:05:12.604917
+
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = "9e3b6f0d1c28"
+down_revision: Union[str, None] = "5a2f8c1e9d47"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.execute("CREATE EXTENSION IF NOT EXISTS btree_gin")
+    # Индекс строится без блокировки записи в tasks; CONCURRENTLY нельзя
+    # выполнять в транзакции
+    with op.get_context().autocommit_block():
+        op.create_index(
+            "ix_tasks_user_id_title_trgm",
+            "tasks",
+            ["user_id", "title"],
+            unique=False,
+            postgresql_using="gin",
+            postgresql_ops={"title": "gin_trgm_ops"},
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # Расширения не удаляются: их могут использовать другие объекты БД
+    with op.get_context().autocommit_block():
+        op.drop_index(
+            "ix_tasks_user_id_title_trgm",
+            table_name="tasks",
+            postgresql_using="gin",
+            postgresql_concurrently=True,
+        )
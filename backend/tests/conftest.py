@@ -12,6 +12,9 @@ from sqlalchemy.ext.asyncio import (
 from sqlalchemy.pool import NullPool
 
 from app.core.config import settings
+from app.db.session import recent_writers, slow_query_log
+from app.services import principal_cache
+from app.services.task import clear_tasks_cache
 
 
 @pytest.fixture(scope="session")
@@ -21,6 +24,16 @@ def event_loop():
     loop.close()
 
 
+@pytest.fixture(autouse=True)
+def clear_caches():
+    # Данные каждого теста откатываются, поэтому кэши не должны переживать тест
+    yield
+    principal_cache.clear()
+    recent_writers.clear()
+    clear_tasks_cache()
+    slow_query_log.clear()
+
+
 @pytest_asyncio.fixture(scope="session")
 async def engine() -> AsyncGenerator[AsyncEngine, None]:
     engine = create_async_engine(
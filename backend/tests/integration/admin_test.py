@@ -0,0 +1,62 @@
+from datetime import datetime, timezone
+
+import pytest
+from httpx import AsyncClient
+
+from app.api.v1.admin import router as admin_router
+from app.core.config import settings
+from app.db import SlowQueryPlan
+from app.db.session import slow_query_log
+from app.models import UserModel
+from app.services import create_user_token
+from tests.integration.conftest import BaseTestRouter
+
+
+class TestAdminRouter(BaseTestRouter):
+    router = admin_router
+
+    async def test_slow_queries_forbidden(
+        self,
+        client: AsyncClient,
+        user: UserModel,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Тестирует запрет доступа к планам для обычного пользователя."""
+        monkeypatch.setattr(settings, "ADMIN_EMAILS", ["admin@example.com"])
+
+        response = await client.get(
+            "/admin/slow-queries",
+            headers={"Authorization": f"Bearer {create_user_token(user=user)}"},
+        )
+
+        assert response.status_code == 403
+
+    async def test_slow_queries(
+        self,
+        client: AsyncClient,
+        user: UserModel,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Тестирует получение планов медленных запросов администратором."""
+        monkeypatch.setattr(settings, "ADMIN_EMAILS", [user.email.upper()])
+        for seconds in (1.0, 2.0):
+            slow_query_log.plans.append(
+                SlowQueryPlan(
+                    statement="SELECT tasks.id FROM tasks WHERE tasks.user_id = ?",
+                    parameters="(int)",
+                    seconds=seconds,
+                    route="/api/v1/tasks",
+                    captured_at=datetime.now(timezone.utc),
+                    plan=[{"Plan": {"Node Type": "Index Scan"}}],
+                )
+            )
+
+        response = await client.get(
+            "/admin/slow-queries",
+            headers={"Authorization": f"Bearer {create_user_token(user=user)}"},
+        )
+
+        assert response.status_code == 200
+        queries = response.json()["queries"]
+        assert [query["seconds"] for query in queries] == [2.0, 1.0]
+        assert queries[0]["plan"][0]["Plan"]["Node Type"] == "Index Scan"
@@ -1,9 +1,14 @@
-from httpx import AsyncClient
-from sqlalchemy.ext.asyncio import AsyncSession
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 
+from app.api.dependencies import get_read_session
 from app.api.v1.auth import router as auth_router
+from app.db.session import get_session, recent_writers
 from app.models import UserModel
 from app.schemas import UserCreateSchema
+from app.services import create_user_token
+from app.utils.security import create_access_token
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -142,3 +147,93 @@ class TestAuthRouter(BaseTestRouter):
 
         assert response.status_code == 200
         assert json["email"] == user.email
+
+    async def test_auth_me_not_modified(
+        self,
+        client: AsyncClient,
+        user: UserModel,
+    ):
+        """Тестирует условный запрос данных пользователя по ETag."""
+        headers = {"Authorization": f"Bearer {create_user_token(user=user)}"}
+
+        response = await client.get("/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert "Last-Modified" in response.headers
+
+        response = await client.get(
+            "/auth/me",
+            headers={**headers, "If-None-Match": response.headers["ETag"]},
+        )
+        assert response.status_code == 304
+
+    async def test_auth_me_with_lagging_replica(
+        self,
+        session: AsyncSession,
+        engine: AsyncEngine,
+        user: UserModel,
+    ):
+        """
+        Тестирует чтение пользователя с основной БД, если его еще нет на
+        реплике.
+        """
+
+        async def lagging_read_session():
+            # Сессия на отдельном соединении не видит пользователя, созданного
+            # в незафиксированной транзакции теста
+            async with AsyncSession(engine) as read_session:
+                yield read_session
+
+        app = FastAPI()
+        app.include_router(self.router)
+        app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[get_read_session] = lagging_read_session
+
+        transport = ASGITransport(app=app)
+        async with AsyncClient(transport=transport, base_url="http://test") as client:
+            response = await client.get(
+                "/auth/me",
+                headers={"Authorization": f"Bearer {create_user_token(user=user)}"},
+            )
+
+        assert response.status_code == 200
+        assert response.json()["email"] == user.email
+
+    async def test_auth_me_with_legacy_token(
+        self,
+        client: AsyncClient,
+        user: UserModel,
+    ):
+        """Тестирует аутентификацию токеном старого формата (только email)."""
+        token = create_access_token(email=user.email)
+
+        response = await client.get(
+            "/auth/me",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.json()["email"] == user.email
+
+    async def test_auth_logout_revokes_tokens(
+        self,
+        client: AsyncClient,
+        user: UserModel,
+    ):
+        """Тестирует отзыв всех токенов пользователя."""
+        token = create_user_token(user=user)
+        legacy_token = create_access_token(email=user.email)
+
+        response = await client.post(
+            "/auth/logout",
+            headers={"Authorization": f"Bearer {token}"},
+        )
+        assert response.status_code == 204
+        # Следующие чтения пользователя выполняются на основной БД
+        assert recent_writers.get(user.id)
+
+        for revoked_token in (token, legacy_token):
+            response = await client.get(
+                "/auth/me",
+                headers={"Authorization": f"Bearer {revoked_token}"},
+            )
+            assert response.status_code == 401
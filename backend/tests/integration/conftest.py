@@ -1,20 +1,39 @@
+from contextlib import asynccontextmanager
+
 import pytest
 import pytest_asyncio
 from fastapi import FastAPI
 from httpx import ASGITransport, AsyncClient
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from app.db.session import get_session
+from app.api.dependencies import get_read_session, get_read_session_maker
+from app.db import UserDAO
+from app.db.session import get_session, get_session_maker
 from app.main import app as the_app
 from app.models import UserModel
 from app.schemas import UserCreateSchema
 from app.services import create_user
 
 
+def session_maker_override(session: AsyncSession):
+    """Возвращает фабрику, которая вместо новой сессии отдает тестовую."""
+
+    @asynccontextmanager
+    async def session_maker():
+        yield session
+
+    return lambda: session_maker
+
+
 @pytest_asyncio.fixture(scope="function")
 async def client(session: AsyncSession):
     # Подменяем зависимость get_session на нашу тестовую сессию
     the_app.dependency_overrides[get_session] = lambda: session
+    the_app.dependency_overrides[get_session_maker] = session_maker_override(session)
+    the_app.dependency_overrides[get_read_session] = lambda: session
+    the_app.dependency_overrides[get_read_session_maker] = session_maker_override(
+        session
+    )
     transport = ASGITransport(app=the_app)
     async with AsyncClient(transport=transport, base_url="http://test") as async_client:
         yield async_client
@@ -32,6 +51,11 @@ class BaseTestRouter:
         app.include_router(self.router)
         # Подменяем зависимость get_session на нашу тестовую сессию
         app.dependency_overrides[get_session] = lambda: session
+        app.dependency_overrides[get_session_maker] = session_maker_override(session)
+        app.dependency_overrides[get_read_session] = lambda: session
+        app.dependency_overrides[get_read_session_maker] = session_maker_override(
+            session
+        )
 
         transport = ASGITransport(app=app)
         async with AsyncClient(transport=transport, base_url="http://test") as c:
@@ -51,7 +75,11 @@ async def user(
     session: AsyncSession,
     user_data: UserCreateSchema,
 ) -> UserModel:
-    return await create_user(
+    created_user = await create_user(
         session=session,
         user_data=user_data,
     )
+    return await UserDAO.find_one_or_none(
+        session=session,
+        id=created_user.id,
+    )
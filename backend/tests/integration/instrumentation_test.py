@@ -0,0 +1,68 @@
+import re
+from typing import AsyncGenerator
+
+import pytest_asyncio
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncEngine, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.api.middleware import QueryStatsMiddleware
+from app.core.config import settings
+from app.db.instrumentation import register_query_instrumentation
+
+
+@pytest_asyncio.fixture(scope="function")
+async def instrumented_engine() -> AsyncGenerator[AsyncEngine, None]:
+    engine = create_async_engine(
+        url=str(settings.ASYNC_POSTGRES_URI),
+        poolclass=NullPool,
+    )
+    register_query_instrumentation(engine)
+
+    yield engine
+
+    await engine.dispose()
+
+
+def _sample(name: str, route: str) -> float:
+    return REGISTRY.get_sample_value(name, {"method": "GET", "route": route}) or 0.0
+
+
+async def test_query_stats(instrumented_engine: AsyncEngine):
+    """Тестирует учет запросов к БД и заголовок Server-Timing."""
+    app = FastAPI()
+    app.add_middleware(QueryStatsMiddleware, server_timing=True)
+
+    @app.get("/items/{item_id}")
+    async def get_item(item_id: int):
+        async with instrumented_engine.connect() as connection:
+            for _ in range(item_id):
+                await connection.execute(text("SELECT 1"))
+        return {}
+
+    queries = _sample("db_request_queries_sum", "/items/{item_id}")
+    count = _sample("db_request_queries_count", "/items/{item_id}")
+
+    transport = ASGITransport(app=app)
+    async with AsyncClient(transport=transport, base_url="http://test") as client:
+        response = await client.get("/items/3")
+        # Запросы без маршрута не учитываются в метриках
+        not_found = await client.get("/missing")
+
+    # Кроме запросов обработчика учитываются служебные запросы соединения
+    assert _sample("db_request_queries_sum", "/items/{item_id}") - queries >= 3
+    assert _sample("db_request_queries_count", "/items/{item_id}") == count + 1
+    assert _sample("db_request_seconds_count", "/items/{item_id}") > 0
+
+    server_timing = response.headers["Server-Timing"]
+    match = re.fullmatch(
+        r'db;dur=[\d.]+;desc="(\d+) queries", db-slowest;dur=[\d.]+, app;dur=[\d.]+',
+        server_timing,
+    )
+    assert match is not None
+    assert int(match.group(1)) >= 3
+
+    assert 'desc="0 queries"' in not_found.headers["Server-Timing"]
@@ -0,0 +1,48 @@
+from prometheus_client import REGISTRY
+from sqlalchemy import text
+
+from app.core.config import settings
+from app.db.pool import warmup_pool
+from app.db.replicas import make_read_session_maker
+from app.db.session import create_db_engine, release_connection
+
+
+async def test_pool_warmup_and_metrics():
+    """Тестирует прогрев пула соединений и метрики пула."""
+    engine = create_db_engine(str(settings.ASYNC_POSTGRES_URI), name="test")
+    labels = {"pool": "test"}
+
+    try:
+        await warmup_pool(engine, connections=2)
+
+        assert engine.pool.checkedin() == 2
+        assert REGISTRY.get_sample_value("db_pool_checkout_seconds_count", labels) == 2
+
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+            assert REGISTRY.get_sample_value("db_pool_checked_out", labels) == 1
+
+        assert REGISTRY.get_sample_value("db_pool_checked_out", labels) == 0
+    finally:
+        await engine.dispose()
+
+
+async def test_release_read_session_connection():
+    """Тестирует возврат соединения сессии только для чтения в пул."""
+    engine = create_db_engine(str(settings.ASYNC_POSTGRES_URI), name="test_read")
+    labels = {"pool": "test_read"}
+
+    try:
+        async with make_read_session_maker(engine)() as session:
+            assert (await session.execute(text("SELECT 1"))).scalar() == 1
+            assert engine.pool.checkedout() == 1
+
+            await release_connection(session)
+
+            assert engine.pool.checkedout() == 0
+            assert (
+                REGISTRY.get_sample_value("db_connection_hold_seconds_count", labels)
+                == 1
+            )
+    finally:
+        await engine.dispose()
@@ -0,0 +1,373 @@
+"""
+Проверяет планы запросов к БД, которые выполняют сервисы задач и
+аутентификации, на наборе данных реалистичного размера.
+
+Тесты перехватывают все запросы, выполненные сервисами, и получают их планы
+командой `EXPLAIN (FORMAT JSON)` с теми же параметрами. Тест падает, если в
+плане есть последовательное чтение таблицы `tasks` или `users` или
+стоимость плана превышает `COST_BUDGET`: запросы одного пользователя должны
+читать только его строки по индексам.
+"""
+
+import json
+import random
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from typing import Any, AsyncIterator, Iterator
+
+import pytest_asyncio
+from sqlalchemy import event, text
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
+
+from app.db import TaskDAO, UserDAO
+from app.db.slow_queries import normalize_statement
+from app.models import UserModel
+from app.schemas import (
+    SortOrder,
+    TaskCreateSchema,
+    TaskFileFormat,
+    TaskSortField,
+    TaskStatusFilter,
+    TaskUpdateSchema,
+    UserCreateSchema,
+)
+from app.services import (
+    authenticate_user,
+    autocomplete_user_tasks,
+    create_task,
+    create_tasks,
+    create_user,
+    delete_task,
+    delete_tasks,
+    export_user_tasks,
+    get_principal,
+    get_task_by_id,
+    get_user_tasks,
+    get_user_tasks_etag,
+    get_user_tasks_with_etag,
+    revoke_user_tokens,
+    search_user_tasks,
+    update_task,
+    update_tasks,
+)
+from app.tools.seed import (
+    TASK_COLUMNS,
+    USER_COLUMNS,
+    SeedOptions,
+    generate_tasks,
+    generate_users,
+)
+
+SEED_USERS = 2000
+SEED_TASKS_PER_USER = 50
+# Строки набора данных получают ID из отдельного диапазона, чтобы не
+# пересекаться с ID из последовательностей
+SEED_FIRST_ID = 1_000_000_000
+# У первого пользователя набора данных задач намного больше, чем у
+# остальных: на нем проверяются запросы, план которых зависит от размера
+# списка задач пользователя
+HEAVY_USER_ID = SEED_FIRST_ID
+HEAVY_USER_TASKS = 20_000
+# Стоимость последовательного чтения таблицы tasks набора данных - больше
+# 2000, стоимость запросов по индексам к задачам одного пользователя - сотни
+COST_BUDGET = 1000.0
+SCANNED_TABLES = {"tasks", "users"}
+EXPLAINED_STATEMENTS = ("SELECT", "WITH", "INSERT", "UPDATE", "DELETE")
+
+
+@pytest_asyncio.fixture(scope="function")
+async def dataset(session: AsyncSession, user: UserModel) -> UserModel:
+    """
+    Заполняет БД пользователями и задачами и обновляет статистику
+    планировщика. Возвращает пользователя из фикстуры `user`, у которого
+    столько же задач, сколько у остальных, кроме `HEAVY_USER_ID`.
+    """
+    options = SeedOptions(
+        users=SEED_USERS,
+        tasks=SEED_USERS * SEED_TASKS_PER_USER,
+        distribution="uniform",
+        zipf_alpha=1.1,
+        lognormal_sigma=1.0,
+        completed_ratio=0.3,
+        description_min=0,
+        description_max=200,
+        spread_days=365,
+        until=datetime(2025, 1, 1, tzinfo=timezone.utc),
+        email_domain="seed.example.com",
+        seed=0,
+    )
+    rng = random.Random(options.seed)
+
+    await UserDAO.copy_records(
+        session,
+        list(
+            generate_users(
+                first_id=SEED_FIRST_ID,
+                count=SEED_USERS,
+                password_hash=user.password_hash,
+                options=options,
+                rng=rng,
+            )
+        ),
+        columns=USER_COLUMNS,
+    )
+    owners = [(user.id, SEED_TASKS_PER_USER), (HEAVY_USER_ID, HEAVY_USER_TASKS)] + [
+        (SEED_FIRST_ID + index, SEED_TASKS_PER_USER) for index in range(1, SEED_USERS)
+    ]
+    await TaskDAO.copy_records(
+        session,
+        list(
+            generate_tasks(
+                first_id=SEED_FIRST_ID, owners=owners, options=options, rng=rng
+            )
+        ),
+        columns=TASK_COLUMNS,
+    )
+    # ANALYZE учитывает строки, добавленные в текущей транзакции
+    await session.execute(text("ANALYZE users, tasks"))
+
+    return user
+
+
+@asynccontextmanager
+async def capture_statements(
+    engine: AsyncEngine,
+) -> AsyncIterator[list[tuple[str, Any]]]:
+    """Собирает тексты и параметры запросов, выполненных через движок."""
+    statements: list[tuple[str, Any]] = []
+
+    def on_before_execute(conn, cursor, statement, parameters, context, executemany):
+        if not executemany:
+            statements.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", on_before_execute)
+    try:
+        yield statements
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", on_before_execute)
+
+
+async def explain(session: AsyncSession, statement: str, parameters: Any) -> dict:
+    """Возвращает план запроса без его выполнения."""
+    connection = await session.connection()
+    raw_connection = await connection.get_raw_connection()
+    plan = await raw_connection.driver_connection.fetchval(
+        f"EXPLAIN (FORMAT JSON) {statement}",
+        *(parameters or ()),
+    )
+    return json.loads(plan)[0]["Plan"]
+
+
+def _plan_nodes(plan: dict) -> Iterator[dict]:
+    yield plan
+    for child in plan.get("Plans", ()):
+        yield from _plan_nodes(child)
+
+
+async def assert_plans(session: AsyncSession, statements: list[tuple[str, Any]]):
+    """Проверяет планы запросов и перечисляет все нарушения в ошибке."""
+    assert statements, "Сервисы не выполнили ни одного запроса"
+
+    violations = []
+    for statement, parameters in statements:
+        # У служебных команд нет плана
+        if not statement.lstrip().upper().startswith(EXPLAINED_STATEMENTS):
+            continue
+
+        plan = await explain(session, statement, parameters)
+        problems = [
+            f"Seq Scan on {node['Relation Name']}"
+            for node in _plan_nodes(plan)
+            if node["Node Type"] == "Seq Scan"
+            and node.get("Relation Name") in SCANNED_TABLES
+        ]
+        if plan["Total Cost"] > COST_BUDGET:
+            problems.append(f"cost {plan['Total Cost']} > {COST_BUDGET}")
+        if problems:
+            violations.append(
+                f"{normalize_statement(statement)}: {', '.join(problems)}"
+            )
+
+    assert not violations, "\n".join(violations)
+
+
+async def assert_index_scans(
+    session: AsyncSession,
+    statements: list[tuple[str, Any]],
+    index_name: str,
+):
+    """Проверяет, что каждый запрос читает таблицу задач по индексу `index_name`."""
+    assert statements, "Сервисы не выполнили ни одного запроса"
+
+    for statement, parameters in statements:
+        plan = await explain(session, statement, parameters)
+        indexes = {node.get("Index Name") for node in _plan_nodes(plan)}
+        assert index_name in indexes, (
+            f"{normalize_statement(statement)}: индекс {index_name} не используется, "
+            f"план: {json.dumps(plan, ensure_ascii=False)}"
+        )
+
+
+async def test_task_read_query_plans(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    dataset: UserModel,
+):
+    """Тестирует планы запросов чтения задач."""
+    user = dataset
+
+    async with capture_statements(engine) as statements:
+        for status in TaskStatusFilter:
+            for sort in TaskSortField:
+                for order in SortOrder:
+                    page = await get_user_tasks(
+                        session=session,
+                        user_id=user.id,
+                        limit=10,
+                        status=status,
+                        sort=sort,
+                        order=order,
+                    )
+                    await get_user_tasks(
+                        session=session,
+                        user_id=user.id,
+                        limit=10,
+                        after=page.next_cursor,
+                        status=status,
+                        sort=sort,
+                        order=order,
+                    )
+
+        await get_user_tasks_with_etag(session=session, user_id=user.id, limit=10)
+        await get_user_tasks_etag(session=session, user_id=user.id)
+        await search_user_tasks(
+            session=session, user_id=user.id, text="отчет", limit=10
+        )
+        await autocomplete_user_tasks(
+            session=session, user_id=user.id, text="отче", limit=10
+        )
+        await get_task_by_id(session=session, task_id=page.tasks[0].id, user_id=user.id)
+        async for _ in export_user_tasks(
+            session=session,
+            user_id=user.id,
+            export_format=TaskFileFormat.NDJSON,
+        ):
+            pass
+
+    await assert_plans(session, statements)
+
+
+async def test_task_write_query_plans(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    dataset: UserModel,
+):
+    """Тестирует планы запросов изменения задач."""
+    user = dataset
+    page = await get_user_tasks(session=session, user_id=user.id, limit=4)
+    task_ids = [task.id for task in page.tasks]
+
+    async with capture_statements(engine) as statements:
+        await create_task(
+            session=session,
+            task_data=TaskCreateSchema(title="Новая задача"),
+            user_id=user.id,
+        )
+        await create_tasks(
+            session=session,
+            tasks_data=[{"title": "Первая"}, {"title": "Вторая"}],
+            user_id=user.id,
+        )
+        await update_task(
+            session=session,
+            task_id=task_ids[0],
+            task_data=TaskUpdateSchema(is_completed=True),
+            user_id=user.id,
+        )
+        await update_tasks(
+            session=session,
+            task_data=TaskUpdateSchema(is_completed=True),
+            user_id=user.id,
+            ids=task_ids[1:3],
+        )
+        await update_tasks(
+            session=session,
+            task_data=TaskUpdateSchema(title="Выполнено"),
+            user_id=user.id,
+            status=TaskStatusFilter.COMPLETED,
+        )
+        await delete_task(session=session, task_id=task_ids[3], user_id=user.id)
+        await delete_tasks(session=session, user_id=user.id, ids=task_ids[:2])
+        await delete_tasks(
+            session=session,
+            user_id=user.id,
+            status=TaskStatusFilter.COMPLETED,
+        )
+
+    await assert_plans(session, statements)
+
+
+async def test_auth_query_plans(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    dataset: UserModel,
+    user_data: UserCreateSchema,
+):
+    """Тестирует планы запросов аутентификации и регистрации."""
+    user = dataset
+
+    async with capture_statements(engine) as statements:
+        await create_user(
+            session=session,
+            user_data=UserCreateSchema(
+                email="new-user@example.com",
+                password=user_data.password,
+            ),
+        )
+        await authenticate_user(
+            session=session,
+            email=user.email,
+            password=user_data.password,
+        )
+        await get_principal(session=session, user_id=user.id)
+        await get_principal(session=session, email=user.email)
+        await revoke_user_tokens(session=session, user_id=user.id)
+
+    await assert_plans(session, statements)
+
+
+async def test_heavy_user_search_query_plans(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    dataset: UserModel,
+):
+    """
+    Тестирует, что поиск по задачам пользователя с большим количеством задач
+    читает по составному индексу только совпадения в его задачах, а не все
+    его задачи или совпадения всех пользователей.
+    """
+    async with capture_statements(engine) as statements:
+        await search_user_tasks(
+            session=session, user_id=HEAVY_USER_ID, text="отчет", limit=10
+        )
+
+    await assert_index_scans(session, statements, "ix_tasks_user_id_search_vector")
+
+
+async def test_heavy_user_autocomplete_query_plans(
+    session: AsyncSession,
+    engine: AsyncEngine,
+    dataset: UserModel,
+):
+    """
+    Тестирует, что автодополнение по задачам пользователя с большим
+    количеством задач читает по составному индексу только совпадения в его
+    задачах.
+    """
+    async with capture_statements(engine) as statements:
+        for text in ("отч", "отчет", "атчет"):
+            await autocomplete_user_tasks(
+                session=session, user_id=HEAVY_USER_ID, text=text, limit=10
+            )
+
+    await assert_index_scans(session, statements, "ix_tasks_user_id_title_trgm")
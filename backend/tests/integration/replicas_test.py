@@ -0,0 +1,63 @@
+import pytest
+import pytest_asyncio
+from sqlalchemy import make_url, text
+
+from app.core.config import settings
+from app.db import session as db_session
+from app.db.replicas import ReplicaRouter
+from app.db.session import create_db_engine, mark_user_write, open_read_session
+
+
+@pytest_asyncio.fixture(scope="function")
+async def replica_router():
+    """
+    Фикстура балансировщика из двух реплик: недоступной (несуществующая БД)
+    и доступной (тестовая БД).
+    """
+    url = make_url(str(settings.ASYNC_POSTGRES_URI))
+    router = ReplicaRouter(
+        [
+            create_db_engine(
+                url.set(database="/nonexistent/replica").render_as_string(False),
+                name="test_replica_down",
+            ),
+            create_db_engine(str(settings.ASYNC_POSTGRES_URI), name="test_replica_up"),
+        ],
+        eject_seconds=60,
+    )
+    yield router
+    await router.dispose()
+
+
+async def test_replica_router_ejects_unavailable_replica(
+    replica_router: ReplicaRouter,
+):
+    """Тестирует исключение недоступной реплики из балансировки."""
+    healthy_engine = replica_router.engines[1]
+
+    for _ in range(3):
+        session = await replica_router.open_session()
+        async with session:
+            assert session.bind.pool is healthy_engine.pool
+            assert (await session.execute(text("SELECT 1"))).scalar() == 1
+
+    assert replica_router.next_index() == 1
+
+
+async def test_read_your_writes(
+    monkeypatch: pytest.MonkeyPatch,
+    replica_router: ReplicaRouter,
+):
+    """Тестирует чтение с основной БД после записи пользователя."""
+    monkeypatch.setattr(db_session, "replica_router", replica_router)
+
+    async with await open_read_session(user_id=1) as session:
+        assert session.bind.pool is replica_router.engines[1].pool
+
+    mark_user_write(1)
+
+    async with await open_read_session(user_id=1) as session:
+        assert session.bind.pool is db_session.engine.pool
+
+    async with await open_read_session(user_id=None) as session:
+        assert session.bind.pool is db_session.engine.pool
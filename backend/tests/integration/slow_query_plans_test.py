@@ -0,0 +1,65 @@
+import asyncio
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine
+from sqlalchemy.pool import NullPool
+
+from app.core.config import settings
+from app.db import TaskDAO
+from app.db.instrumentation import register_query_instrumentation
+from app.db.slow_queries import SlowQueryLog
+from app.models import TaskModel
+
+
+async def test_slow_query_plans():
+    """
+    Тестирует снятие планов медленных запросов на чтение, в том числе
+    запросов с CTE, в транзакции только для чтения с параметрами запроса.
+    """
+    engine = create_async_engine(str(settings.ASYNC_POSTGRES_URI), poolclass=NullPool)
+    slow_query_log = SlowQueryLog(
+        threshold_seconds=1e-9,
+        explain_sample_rate=1,
+        explain_timeout_seconds=5,
+        max_plans=100,
+        max_concurrent_explains=100,
+    )
+    register_query_instrumentation(engine, slow_query_log=slow_query_log)
+
+    try:
+        async with AsyncSession(engine) as session:
+            await TaskDAO.find_owner_page(
+                session,
+                1,
+                columns=[TaskModel.id, TaskModel.title, TaskModel.created_at],
+                order_by=[TaskModel.created_at, TaskModel.id],
+                limit=10,
+            )
+            # Изменяющий данные запрос не выполняется повторно: транзакция,
+            # в которой снимается план, доступна только для чтения
+            await session.execute(
+                text(
+                    "WITH deleted AS "
+                    "(DELETE FROM tasks WHERE id = :id RETURNING id) "
+                    "SELECT count(*) FROM deleted"
+                ),
+                {"id": 0},
+            )
+            await session.rollback()
+
+        await asyncio.gather(*slow_query_log._explains)
+    finally:
+        await engine.dispose()
+
+    owner_plans = [
+        plan
+        for plan in slow_query_log.plans
+        if plan.statement.startswith("WITH owner AS")
+    ]
+    assert len(owner_plans) == 1
+    # План снят с параметрами исходного запроса
+    assert owner_plans[0].parameters != "()"
+    assert "Execution Time" in owner_plans[0].plan[0]
+    assert not any(
+        plan.statement.startswith("WITH deleted AS") for plan in slow_query_log.plans
+    )
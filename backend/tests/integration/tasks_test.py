@@ -1,12 +1,29 @@
+import asyncio
+import csv
+import io
+import json
+
 import pytest
 import pytest_asyncio
 from httpx import AsyncClient
+from sqlalchemy import event, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from app.api.v1.tasks import router as tasks_router
+from app.core.config import settings
+from app.core.constants import TASKS_BATCH_MAX_SIZE
 from app.models import TaskModel, UserModel
-from app.schemas import TaskCreateSchema, TaskUpdateSchema
-from app.services import create_task, create_user_token
+from app.schemas import TaskCreateSchema, TaskUpdateSchema, UserCreateSchema
+from app.services import (
+    create_task,
+    create_user,
+    create_user_token,
+    revoke_user_tokens,
+    tasks_cache,
+    update_task,
+)
+from app.services.task import clear_tasks_cache
+from app.utils.security import create_access_token
 from tests.integration.conftest import BaseTestRouter
 
 
@@ -68,6 +85,597 @@ class TestTasksRouter(BaseTestRouter):
         # В списке должна быть одна задача, созданная в фикстуре task
         assert len(json["tasks"]) == 1
 
+    async def test_tasks_list_empty_and_unknown_user(
+        self,
+        client: AsyncClient,
+        user: UserModel,
+        user_token: str,
+    ):
+        """
+        Тестирует, что пользователь без задач получает пустой список, а токен
+        несуществующего пользователя отклоняется.
+        """
+        response = await client.get(
+            "/tasks",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert response.status_code == 200
+        assert response.json()["tasks"] == []
+
+        unknown_user_token = create_access_token(
+            email="unknown@example.com",
+            user_id=user.id + 1,
+        )
+        response = await client.get(
+            "/tasks",
+            headers={"Authorization": f"Bearer {unknown_user_token}"},
+        )
+        assert response.status_code == 401
+
+    async def test_tasks_list_with_revoked_token(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+    ):
+        """Тестирует отклонение отозванного токена при получении списка задач."""
+        headers = {"Authorization": f"Bearer {user_token}"}
+
+        response = await client.get("/tasks", headers=headers)
+        assert response.status_code == 200
+
+        await revoke_user_tokens(session=session, user_id=user.id)
+
+        response = await client.get("/tasks", headers=headers)
+        assert response.status_code == 401
+
+    async def test_tasks_list_pagination(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        task_data: TaskCreateSchema,
+    ):
+        """Тестирует постраничное получение списка задач по курсору."""
+        created_ids = []
+        for _ in range(3):
+            created_task = await create_task(
+                session=session,
+                task_data=task_data,
+                user_id=user.id,
+            )
+            created_ids.append(created_task.id)
+
+        response = await client.get(
+            "/tasks",
+            params={"limit": 2},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        first_page = response.json()
+
+        assert response.status_code == 200
+        assert [t["id"] for t in first_page["tasks"]] == created_ids[:2]
+        assert first_page["next_cursor"] is not None
+
+        response = await client.get(
+            "/tasks",
+            params={"limit": 2, "after": first_page["next_cursor"]},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        second_page = response.json()
+
+        assert response.status_code == 200
+        assert [t["id"] for t in second_page["tasks"]] == created_ids[2:]
+        assert second_page["next_cursor"] is None
+
+    async def test_tasks_list_with_invalid_cursor(
+        self,
+        client: AsyncClient,
+        user_token: str,
+    ):
+        """Тестирует получение списка задач с некорректным курсором."""
+        response = await client.get(
+            "/tasks",
+            params={"after": "not-a-cursor"},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert response.status_code == 400
+
+    async def test_tasks_list_filter_and_sort(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        task_data: TaskCreateSchema,
+    ):
+        """Тестирует фильтрацию задач по статусу и сортировку по убыванию."""
+        created_ids = []
+        for _ in range(3):
+            created_task = await create_task(
+                session=session,
+                task_data=task_data,
+                user_id=user.id,
+            )
+            created_ids.append(created_task.id)
+
+        await update_task(
+            session=session,
+            task_id=created_ids[0],
+            task_data=TaskUpdateSchema(is_completed=True),
+            user_id=user.id,
+        )
+
+        response = await client.get(
+            "/tasks",
+            params={"status": "pending", "sort": "created_at", "order": "desc"},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        json = response.json()
+
+        assert response.status_code == 200
+        assert [t["id"] for t in json["tasks"]] == created_ids[:0:-1]
+
+        response = await client.get(
+            "/tasks",
+            params={"status": "completed"},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        json = response.json()
+
+        assert response.status_code == 200
+        assert [t["id"] for t in json["tasks"]] == created_ids[:1]
+
+    async def test_tasks_list_not_modified(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        task: TaskModel,
+    ):
+        """Тестирует условный запрос списка задач по ETag."""
+        headers = {"Authorization": f"Bearer {user_token}"}
+
+        response = await client.get("/tasks", headers=headers)
+        etag = response.headers["ETag"]
+        assert response.status_code == 200
+
+        response = await client.get(
+            "/tasks",
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+        assert response.content == b""
+        assert response.headers["ETag"] == etag
+
+        # ETag зависит от параметров запроса
+        response = await client.get(
+            "/tasks",
+            params={"status": "completed"},
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+
+        tasks_version, updated_at = user.tasks_version, user.updated_at
+        await update_task(
+            session=session,
+            task_id=task.id,
+            task_data=TaskUpdateSchema(is_completed=True),
+            user_id=user.id,
+        )
+
+        response = await client.get(
+            "/tasks",
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 200
+        assert response.headers["ETag"] != etag
+
+        # Запись задач увеличивает версию списка, не меняя время изменения
+        # пользователя
+        await session.refresh(user)
+        assert user.tasks_version == tasks_version + 1
+        assert user.updated_at == updated_at
+
+    async def test_tasks_list_cache(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        task: TaskModel,
+        monkeypatch: pytest.MonkeyPatch,
+    ):
+        """Тестирует кэширование списка задач и его сброс при изменении задач."""
+        headers = {"Authorization": f"Bearer {user_token}"}
+        title = task.title
+
+        response = await client.get("/tasks", headers=headers)
+        etag = response.headers["ETag"]
+        assert response.json()["tasks"][0]["title"] == title
+
+        # Изменение в обход сервисов не меняет версию списка: страница
+        # отдается из кэша
+        await session.execute(
+            update(TaskModel)
+            .where(TaskModel.id == task.id)
+            .values(title="Изменена в обход сервисов")
+        )
+
+        response = await client.get("/tasks", headers=headers)
+        assert response.json()["tasks"][0]["title"] == title
+        assert response.headers["ETag"] == etag
+
+        response = await client.get(
+            "/tasks",
+            headers={**headers, "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+        # При совпадении ETag страница не читается из кэша
+        async def get_page(key: str) -> bytes | None:
+            raise AssertionError(f"Страница {key} прочитана из кэша")
+
+        with monkeypatch.context() as patch:
+            patch.setattr(tasks_cache, "get", get_page)
+            response = await client.get(
+                "/tasks",
+                headers={**headers, "If-None-Match": etag},
+            )
+        assert response.status_code == 304
+
+        # Запись через сервис меняет версию списка пользователя
+        await update_task(
+            session=session,
+            task_id=task.id,
+            task_data=TaskUpdateSchema(is_completed=True),
+            user_id=user.id,
+        )
+
+        response = await client.get("/tasks", headers=headers)
+        assert response.json()["tasks"][0]["title"] == "Изменена в обход сервисов"
+        assert response.json()["tasks"][0]["is_completed"] is True
+        assert response.headers["ETag"] != etag
+
+        monkeypatch.setattr(settings, "TASKS_CACHE_ENABLED", False)
+        await session.execute(
+            update(TaskModel).where(TaskModel.id == task.id).values(title="Без кэша")
+        )
+
+        response = await client.get("/tasks", headers=headers)
+        assert response.json()["tasks"][0]["title"] == "Без кэша"
+
+    async def test_tasks_list_cache_miss_queries(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user_token: str,
+        task: TaskModel,
+    ):
+        """
+        Тестирует, что при промахе кэша ETag и страница загружаются одним
+        запросом, а при несовпадении ETag условного запроса - двумя.
+        """
+        headers = {"Authorization": f"Bearer {user_token}"}
+        statements = []
+
+        def on_execute(conn, cursor, statement, parameters, context, executemany):
+            statements.append(statement)
+
+        # Первый запрос загружает пользователя в кэш аутентификации
+        response = await client.get("/tasks", headers=headers)
+        assert response.status_code == 200
+        clear_tasks_cache()
+
+        connection = (await session.connection()).sync_connection
+        event.listen(connection, "before_cursor_execute", on_execute)
+        try:
+            response = await client.get("/tasks", headers=headers)
+            assert response.status_code == 200
+            assert len(statements) == 1
+
+            statements.clear()
+            clear_tasks_cache()
+            response = await client.get(
+                "/tasks",
+                headers={**headers, "If-None-Match": '"outdated"'},
+            )
+            assert response.status_code == 200
+            assert len(statements) == 2
+        finally:
+            event.remove(connection, "before_cursor_execute", on_execute)
+
+    async def test_tasks_export(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        task_data: TaskCreateSchema,
+    ):
+        """Тестирует выгрузку задач в форматах NDJSON и CSV."""
+        created_ids = []
+        for _ in range(3):
+            created_task = await create_task(
+                session=session,
+                task_data=task_data,
+                user_id=user.id,
+            )
+            created_ids.append(created_task.id)
+
+        response = await client.get(
+            "/tasks/export",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+
+        assert response.status_code == 200
+        assert response.headers["Content-Type"] == "application/x-ndjson"
+        lines = response.text.splitlines()
+        assert [json.loads(line)["id"] for line in lines] == created_ids
+
+        response = await client.get(
+            "/tasks/export",
+            params={"format": "csv"},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+
+        assert response.status_code == 200
+        rows = list(csv.DictReader(io.StringIO(response.text)))
+        assert [int(row["id"]) for row in rows] == created_ids
+        assert rows[0]["title"] == task_data.title
+
+    # MARK: Search
+    async def test_tasks_search(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        user_data: UserCreateSchema,
+    ):
+        """Тестирует полнотекстовый поиск задач с ранжированием и пагинацией."""
+        other_user = await create_user(
+            session=session,
+            user_data=UserCreateSchema(
+                email="other@example.com",
+                password=user_data.password,
+            ),
+        )
+        for title, description, user_id in [
+            ("Купить продукты", "Молоко и хлеб", user.id),
+            ("Позвонить клиенту", "Обсудить отчеты за квартал", user.id),
+            ("Подготовить отчет", None, user.id),
+            ("Проверить отчет", "Отчет по продажам", user.id),
+            ("Подготовить отчет", None, other_user.id),
+        ]:
+            await create_task(
+                session=session,
+                task_data=TaskCreateSchema(title=title, description=description),
+                user_id=user_id,
+            )
+        headers = {"Authorization": f"Bearer {user_token}"}
+
+        response = await client.get(
+            "/tasks/search",
+            params={"q": "отчеты"},
+            headers=headers,
+        )
+        assert response.status_code == 200
+        tasks = response.json()["tasks"]
+        # Совпадения в заголовке и описании выше совпадений только в описании
+        assert [task["title"] for task in tasks] == [
+            "Проверить отчет",
+            "Подготовить отчет",
+            "Позвонить клиенту",
+        ]
+        assert {task["user_id"] for task in tasks} == {user.id}
+
+        titles = []
+        after = None
+        while True:
+            response = await client.get(
+                "/tasks/search",
+                params={
+                    "q": "отчеты",
+                    "limit": 1,
+                    **({"after": after} if after else {}),
+                },
+                headers=headers,
+            )
+            assert response.status_code == 200
+            json_data = response.json()
+            titles += [task["title"] for task in json_data["tasks"]]
+            after = json_data["next_cursor"]
+            if after is None:
+                break
+        assert titles == [task["title"] for task in tasks]
+
+        response = await client.get(
+            "/tasks/search",
+            params={"q": "молоко -хлеб"},
+            headers=headers,
+        )
+        assert response.json()["tasks"] == []
+
+        # Курсор другого поискового запроса не принимается
+        response = await client.get(
+            "/tasks/search",
+            params={"q": "отчеты", "limit": 1},
+            headers=headers,
+        )
+        response = await client.get(
+            "/tasks/search",
+            params={"q": "продукты", "after": response.json()["next_cursor"]},
+            headers=headers,
+        )
+        assert response.status_code == 400
+
+    async def test_tasks_autocomplete(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        user_data: UserCreateSchema,
+    ):
+        """Тестирует подсказки задач по подстроке и похожему слову."""
+        other_user = await create_user(
+            session=session,
+            user_data=UserCreateSchema(
+                email="other@example.com",
+                password=user_data.password,
+            ),
+        )
+        for title, user_id in [
+            ("Отчеты за квартал", user.id),
+            ("Купить продукты", user.id),
+            ("Подготовить отчет", user.id),
+            ("Проверить ОТЧЕТ", user.id),
+            ("Подготовить отчет", other_user.id),
+        ]:
+            await create_task(
+                session=session,
+                task_data=TaskCreateSchema(title=title),
+                user_id=user_id,
+            )
+        headers = {"Authorization": f"Bearer {user_token}"}
+
+        async def autocomplete(q: str, **params) -> list[str]:
+            response = await client.get(
+                "/tasks/autocomplete",
+                params={"q": q, **params},
+                headers=headers,
+            )
+            assert response.status_code == 200
+            return [task["title"] for task in response.json()["tasks"]]
+
+        # Подстрока без учета регистра; слово целиком выше части слова
+        assert await autocomplete("отчет") == [
+            "Проверить ОТЧЕТ",
+            "Подготовить отчет",
+            "Отчеты за квартал",
+        ]
+        assert await autocomplete("отчет", limit=1) == ["Проверить ОТЧЕТ"]
+        assert await autocomplete("упит") == ["Купить продукты"]
+        # Опечатка
+        assert await autocomplete("продукиы") == ["Купить продукты"]
+        # Символы шаблона LIKE ищутся как обычные символы
+        assert await autocomplete("%%%") == []
+
+        response = await client.get(
+            "/tasks/autocomplete",
+            params={"q": "от"},
+            headers=headers,
+        )
+        assert response.status_code == 422
+
+        # Из серии быстрых запросов пользователя выполняются первый, если
+        # перед ним была пауза, и последний
+        first, second, third = await asyncio.gather(
+            *(
+                client.get(
+                    "/tasks/autocomplete",
+                    params={"q": q},
+                    headers=headers,
+                )
+                for q in ("отч", "отче", "отчет")
+            )
+        )
+        assert first.status_code in (200, 204)
+        assert second.status_code == 204
+        assert third.status_code == 200
+        assert len(third.json()["tasks"]) == 3
+
+    # MARK: Import
+    async def test_tasks_import_ndjson(
+        self,
+        client: AsyncClient,
+        user_token: str,
+    ):
+        """Тестирует загрузку задач из NDJSON с некорректными записями."""
+        content = "\n".join(
+            [
+                json.dumps({"title": "Первая задача", "description": "Описание"}),
+                "",
+                json.dumps({"title": "X"}),
+                "not json",
+                json.dumps({"title": "Вторая задача"}),
+            ]
+        )
+
+        response = await client.post(
+            "/tasks/import",
+            content=content.encode(),
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        json_response = response.json()
+
+        assert response.status_code == 201
+        assert json_response["imported"] == 2
+        assert json_response["rejected"] == 2
+        assert [e["index"] for e in json_response["errors"]] == [1, 2]
+
+        response = await client.get(
+            "/tasks",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert [t["title"] for t in response.json()["tasks"]] == [
+            "Первая задача",
+            "Вторая задача",
+        ]
+
+    async def test_tasks_import_csv(
+        self,
+        client: AsyncClient,
+        user_token: str,
+    ):
+        """Тестирует загрузку задач из CSV со значениями в кавычках."""
+        content = (
+            'title,description\r\n"Задача, с запятой","Две\nстроки"\r\nЗадача,\r\n'
+        )
+
+        response = await client.post(
+            "/tasks/import",
+            params={"format": "csv"},
+            content=content.encode(),
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+
+        assert response.status_code == 201
+        assert response.json()["imported"] == 2
+
+        response = await client.get(
+            "/tasks",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        tasks = response.json()["tasks"]
+        assert tasks[0]["title"] == "Задача, с запятой"
+        assert tasks[0]["description"] == "Две\nстроки"
+        assert tasks[1]["description"] is None
+
+    async def test_tasks_import_malformed_file(
+        self,
+        client: AsyncClient,
+        user_token: str,
+    ):
+        """Тестирует, что при ошибке разбора файла не загружается ни одна задача."""
+        response = await client.post(
+            "/tasks/import",
+            params={"format": "csv"},
+            content='title\r\nЗадача\r\n"Незакрытая кавычка\r\n'.encode(),
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert response.status_code == 400
+
+        response = await client.get(
+            "/tasks",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert response.json()["tasks"] == []
+
     # MARK: Create
     async def test_task_create_without_token(
         self,
@@ -99,6 +707,29 @@ class TestTasksRouter(BaseTestRouter):
         assert json["title"] == task_data.title
         assert json["description"] == task_data.description
 
+    async def test_tasks_batch_create(
+        self,
+        client: AsyncClient,
+        user_token: str,
+    ):
+        """Тестирует пакетное создание задач с некорректным элементом в пакете."""
+        response = await client.post(
+            "/tasks/batch",
+            json={
+                "tasks": [
+                    {"title": "Первая задача"},
+                    {"title": "x"},
+                    {"title": "Третья задача", "description": "Описание"},
+                ],
+            },
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        json = response.json()
+
+        assert response.status_code == 201
+        assert [t["title"] for t in json["tasks"]] == ["Первая задача", "Третья задача"]
+        assert [e["index"] for e in json["errors"]] == [1]
+
     # MARK: Update
     async def test_update_task_without_token(
         self,
@@ -135,7 +766,125 @@ class TestTasksRouter(BaseTestRouter):
         assert json["title"] == updated_title
         assert json["description"] == updated_description
 
+    async def test_update_tasks_bulk(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        task_data: TaskCreateSchema,
+    ):
+        """Тестирует массовое обновление задач по списку идентификаторов."""
+        created_ids = []
+        for _ in range(3):
+            created_task = await create_task(
+                session=session,
+                task_data=task_data,
+                user_id=user.id,
+            )
+            created_ids.append(created_task.id)
+
+        response = await client.patch(
+            "/tasks",
+            json={"ids": created_ids[:2], "changes": {"is_completed": True}},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        json = response.json()
+
+        assert response.status_code == 200
+        assert sorted(json["ids"]) == created_ids[:2]
+        assert json["count"] == 2
+
+        # Статус `all` без идентификаторов выбрал бы все задачи пользователя
+        response = await client.patch(
+            "/tasks",
+            json={"status": "all", "changes": {"is_completed": True}},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert response.status_code == 422
+
     # MARK: Delete
+    async def test_delete_tasks_bulk_by_status(
+        self,
+        client: AsyncClient,
+        session: AsyncSession,
+        user: UserModel,
+        user_token: str,
+        task: TaskModel,
+        task_data: TaskCreateSchema,
+    ):
+        """Тестирует удаление всех выполненных задач."""
+        completed_task = await create_task(
+            session=session,
+            task_data=task_data,
+            user_id=user.id,
+        )
+        await update_task(
+            session=session,
+            task_id=completed_task.id,
+            task_data=TaskUpdateSchema(is_completed=True),
+            user_id=user.id,
+        )
+
+        response = await client.delete(
+            "/tasks",
+            params={"status": "completed"},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        json = response.json()
+
+        assert response.status_code == 200
+        assert json["ids"] == [completed_task.id]
+
+        response = await client.get(
+            "/tasks",
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert [t["id"] for t in response.json()["tasks"]] == [task.id]
+        etag = response.headers["ETag"]
+
+        # Удаление, не затронувшее задач, не меняет версию списка
+        response = await client.delete(
+            "/tasks",
+            params={"status": "completed"},
+            headers={"Authorization": f"Bearer {user_token}"},
+        )
+        assert response.json()["count"] == 0
+
+        response = await client.get(
+            "/tasks",
+            headers={"Authorization": f"Bearer {user_token}", "If-None-Match": etag},
+        )
+        assert response.status_code == 304
+
+    async def test_delete_tasks_bulk_without_selector(
+        self,
+        client: AsyncClient,
+        user_token: str,
+    ):
+        """
+        Тестирует, что массовое удаление без условий, со статусом `all` или со
+        слишком длинным списком идентификаторов отклоняется.
+        """
+        headers = {"Authorization": f"Bearer {user_token}"}
+
+        response = await client.delete("/tasks", headers=headers)
+        assert response.status_code == 400
+
+        response = await client.delete(
+            "/tasks",
+            params={"status": "all"},
+            headers=headers,
+        )
+        assert response.status_code == 400
+
+        response = await client.delete(
+            "/tasks",
+            params={"ids": list(range(1, TASKS_BATCH_MAX_SIZE + 2))},
+            headers=headers,
+        )
+        assert response.status_code == 422
+
     async def test_delete_task_without_token(
         self,
         client: AsyncClient,
@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+
+from sqlalchemy.dialects import postgresql
+
+from app.db import TaskDAO
+from app.models import TaskModel
+from app.schemas import TaskUpdateSchema
+
+
+def _compile(stmt) -> str:
+    return str(stmt.compile(dialect=postgresql.dialect()))
+
+
+def test_build_select_with_keyset_pagination():
+    """Тестирует построение запроса страницы с keyset-пагинацией."""
+    stmt = TaskDAO.build_select(
+        TaskModel.is_completed.is_(False),
+        order_by=(TaskModel.created_at, TaskModel.id),
+        descending=True,
+        after=(datetime(2025, 1, 1, tzinfo=timezone.utc), 10),
+        limit=101,
+        user_id=1,
+    )
+    sql = _compile(stmt)
+
+    assert "(tasks.created_at, tasks.id) < (" in sql
+    assert "ORDER BY tasks.created_at DESC, tasks.id DESC" in sql
+    assert "LIMIT" in sql
+
+
+def test_build_select_columns():
+    """Тестирует выбор отдельных столбцов вместо объектов модели."""
+    stmt = TaskDAO.build_select(columns=(TaskModel.id, TaskModel.title), user_id=1)
+
+    assert _compile(stmt).startswith("SELECT tasks.id, tasks.title \nFROM tasks")
+
+
+def test_build_update_from_schema():
+    """Тестирует, что UPDATE изменяет только переданные поля схемы."""
+    stmt = TaskDAO.build_update(
+        TaskModel.id == 1,
+        obj_in=TaskUpdateSchema(is_completed=True),
+    )
+    sql = _compile(stmt)
+
+    assert "SET is_completed=" in sql
+    assert "title" not in sql
@@ -0,0 +1,252 @@
+import asyncio
+import time
+from typing import AsyncGenerator
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+
+from app.utils.cache import MemoryCacheBackend, RedisCacheBackend, TTLCache
+from app.utils.resp import RespClient, encode_command
+
+
+def test_cache_get_and_set():
+    """Тестирует сохранение и получение значения из кэша."""
+    cache = TTLCache(name="test_get_set", maxsize=10, ttl=60)
+    cache.set("key", "value")
+
+    assert cache.get("key") == "value"
+    assert cache.get("missing") is None
+
+
+def test_cache_evicts_least_recently_used():
+    """Тестирует вытеснение давно не использовавшихся записей."""
+    cache = TTLCache(name="test_lru", maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    # Обращение к "a" делает самой старой запись "b"
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == 1
+    assert cache.get("c") == 3
+
+
+def test_cache_expires_entries():
+    """Тестирует устаревание записей по истечении TTL."""
+    cache = TTLCache(name="test_ttl", maxsize=10, ttl=30)
+
+    with patch("app.utils.cache.monotonic", return_value=100.0):
+        cache.set("key", "value")
+    with patch("app.utils.cache.monotonic", return_value=129.0):
+        assert cache.get("key") == "value"
+    with patch("app.utils.cache.monotonic", return_value=130.0):
+        assert cache.get("key") is None
+
+
+def test_cache_invalidate():
+    """Тестирует явное удаление записи из кэша."""
+    cache = TTLCache(name="test_invalidate", maxsize=10, ttl=60)
+    cache.set("key", "value")
+    cache.invalidate("key")
+
+    assert cache.get("key") is None
+
+
+def test_disabled_cache():
+    """Тестирует, что кэш с нулевым TTL ничего не хранит."""
+    cache = TTLCache(name="test_disabled", maxsize=10, ttl=0)
+    cache.set("key", "value")
+
+    assert cache.get("key") is None
+
+
+def test_cache_evicts_by_weight():
+    """Тестирует вытеснение записей при превышении суммарного размера."""
+    cache = TTLCache(name="test_weight", maxsize=10, ttl=60, weigher=len, maxweight=5)
+    cache.set("a", b"12")
+    cache.set("b", b"34")
+    cache.set("a", b"1")
+    cache.set("c", b"567")
+
+    # "b" - самая старая запись после перезаписи "a"
+    assert cache.get("b") is None
+    assert cache.get("a") == b"1"
+    assert cache.get("c") == b"567"
+    assert cache.weight == 4
+
+    # Запись больше всего кэша не сохраняется и не вытесняет другие записи
+    cache.set("d", b"123456")
+    assert cache.get("d") is None
+    assert len(cache) == 2
+
+
+async def test_memory_backend_versions():
+    """Тестирует смену версии в хранилище кэша в памяти процесса."""
+    backend = MemoryCacheBackend(name="test_memory", ttl=60, maxsize=10, maxbytes=100)
+
+    version = await backend.get_version("version")
+    assert await backend.get_version("version") == version
+
+    await backend.set(f"page:{version}", b"data")
+    assert await backend.get(f"page:{version}") == b"data"
+
+    await backend.bump_version("version")
+    assert await backend.get_version("version") != version
+
+
+@pytest_asyncio.fixture()
+async def redis_url() -> AsyncGenerator[str, None]:
+    """
+    Фикстура, запускающая заменитель сервера Redis, поддерживающий команды
+    GET и SET (с NX) протокола RESP2.
+    """
+    data: dict[bytes, bytes] = {}
+
+    async def read_command(reader: asyncio.StreamReader) -> list[bytes]:
+        count = int((await reader.readuntil(b"\r\n"))[1:-2])
+        args = []
+        for _ in range(count):
+            length = int((await reader.readuntil(b"\r\n"))[1:-2])
+            args.append((await reader.readexactly(length + 2))[:-2])
+        return args
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            while True:
+                command, key, *args = await read_command(reader)
+                if command == b"GET":
+                    value = data.get(key)
+                    if value is None:
+                        writer.write(b"$-1\r\n")
+                    else:
+                        writer.write(b"$%d\r\n%s\r\n" % (len(value), value))
+                elif b"NX" in args[1:] and key in data:
+                    writer.write(b"$-1\r\n")
+                else:
+                    data[key] = args[0]
+                    writer.write(b"+OK\r\n")
+                await writer.drain()
+        except asyncio.IncompleteReadError:
+            writer.close()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+
+    yield f"redis://127.0.0.1:{port}/0"
+
+    server.close()
+    await server.wait_closed()
+
+
+async def test_redis_backend(redis_url: str):
+    """Тестирует хранилище кэша на сервере Redis."""
+    backend = RedisCacheBackend(
+        name="test_redis",
+        ttl=60,
+        url=redis_url,
+        timeout=1,
+        pool_size=2,
+    )
+
+    version = await backend.get_version("version")
+    assert version is not None
+    assert await backend.get_version("version") == version
+
+    await backend.set(f"page:{version}", b"line\r\nbreak")
+    assert await backend.get(f"page:{version}") == b"line\r\nbreak"
+    assert await backend.get("missing") is None
+
+    await backend.bump_version("version")
+    assert await backend.get_version("version") != version
+
+    await backend.close()
+
+
+async def test_redis_backend_unavailable():
+    """Тестирует, что недоступность сервера Redis не приводит к ошибкам."""
+    backend = RedisCacheBackend(
+        name="test_redis_unavailable",
+        ttl=60,
+        url="redis://127.0.0.1:1/0",
+        timeout=1,
+        pool_size=2,
+    )
+
+    assert await backend.get_version("version") is None
+    assert await backend.get("key") is None
+    await backend.set("key", b"value")
+    await backend.bump_version("version")
+
+
+async def test_redis_backend_malformed_reply():
+    """Тестирует, что некорректный ответ сервера не приводит к ошибкам."""
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.read(1024)
+        writer.write(b"$abc\r\n")
+        await writer.drain()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    backend = RedisCacheBackend(
+        name="test_redis_malformed",
+        ttl=60,
+        url=f"redis://127.0.0.1:{port}/0",
+        timeout=1,
+        pool_size=1,
+    )
+
+    assert await backend.get("key") is None
+
+    await backend.close()
+    server.close()
+    await server.wait_closed()
+
+
+async def test_redis_client_pool_timeout():
+    """
+    Тестирует, что ожидание свободного соединения ограничено тайм-аутом, а
+    команды на разных соединениях выполняются параллельно.
+    """
+    replied = asyncio.Event()
+
+    async def handle(reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        await reader.read(1024)
+        await replied.wait()
+        writer.write(b"+OK\r\n")
+        await writer.drain()
+
+    server = await asyncio.start_server(handle, "127.0.0.1", 0)
+    port = server.sockets[0].getsockname()[1]
+    client = RespClient(f"redis://127.0.0.1:{port}/0", timeout=0.3, pool_size=1)
+
+    # Единственное соединение занято командой, ответ на которую задерживается
+    pending = asyncio.create_task(client.execute("GET", "slow"))
+    await asyncio.sleep(0.05)
+    started_at = time.perf_counter()
+    with pytest.raises(asyncio.TimeoutError):
+        await client.execute("GET", "key")
+    assert time.perf_counter() - started_at < 0.45
+
+    with pytest.raises(asyncio.TimeoutError):
+        await pending
+
+    # С двумя соединениями команды не ждут друг друга
+    client = RespClient(f"redis://127.0.0.1:{port}/0", timeout=1, pool_size=2)
+    first = asyncio.create_task(client.execute("GET", "first"))
+    second = asyncio.create_task(client.execute("GET", "second"))
+    await asyncio.sleep(0.05)
+    replied.set()
+    assert await asyncio.gather(first, second) == ["OK", "OK"]
+
+    await client.close()
+    server.close()
+    await server.wait_closed()
+
+
+def test_encode_command():
+    """Тестирует кодирование команды протокола Redis."""
+    assert encode_command(("GET", b"key")) == b"*2\r\n$3\r\nGET\r\n$3\r\nkey\r\n"
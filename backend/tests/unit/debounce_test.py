@@ -0,0 +1,43 @@
+import asyncio
+import time
+
+from app.utils.debounce import Debouncer
+
+
+async def test_debouncer_supersedes_older_calls():
+    """Тестирует пропуск операций, вместо которых запрошена более новая."""
+    debouncer: Debouncer[int] = Debouncer(name="test", delay=0.2, maxsize=10)
+
+    # Первая операция серии выполняется без задержки
+    started_at = time.perf_counter()
+    assert await debouncer.settle(1) is True
+    assert await debouncer.settle(2) is True
+    assert time.perf_counter() - started_at < 0.1
+
+    started_at = time.perf_counter()
+    second = asyncio.create_task(debouncer.settle(1))
+    await asyncio.sleep(0.01)
+    third = asyncio.create_task(debouncer.settle(1))
+
+    # Вытесненная операция завершается, не дожидаясь конца задержки
+    assert await second is False
+    assert time.perf_counter() - started_at < 0.1
+
+    assert await third is True
+    assert not debouncer._pending
+
+    # После паузы серия начинается заново
+    await asyncio.sleep(0.2)
+    started_at = time.perf_counter()
+    assert await debouncer.settle(1) is True
+    assert time.perf_counter() - started_at < 0.1
+
+
+async def test_debouncer_disabled():
+    """Тестирует выполнение всех операций без задержки."""
+    debouncer: Debouncer[int] = Debouncer(name="test", delay=0, maxsize=10)
+
+    assert await asyncio.gather(debouncer.settle(1), debouncer.settle(1)) == [
+        True,
+        True,
+    ]
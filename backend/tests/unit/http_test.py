@@ -0,0 +1,51 @@
+import json
+from datetime import datetime, timezone
+
+import pytest
+
+from app.schemas import TaskListResponseSchema, TaskResponseSchema
+from app.utils.http import etag_matches, json_response, make_etag
+
+
+@pytest.mark.parametrize(
+    ("if_none_match", "expected"),
+    [
+        (None, False),
+        ('"other"', False),
+        ("*", True),
+        ('"other", W/{etag}', True),
+    ],
+)
+def test_etag_matches(if_none_match: str | None, expected: bool):
+    """Тестирует сравнение ETag с заголовком If-None-Match."""
+    etag = make_etag(1, "value")
+    if if_none_match is not None:
+        if_none_match = if_none_match.format(etag=etag)
+
+    assert etag_matches(etag=etag, if_none_match=if_none_match) is expected
+
+
+def test_json_response_matches_validated_schema():
+    """Тестирует, что быстрая сериализация совпадает с сериализацией FastAPI."""
+    row = {
+        "id": 1,
+        "user_id": 2,
+        "title": "Задача",
+        "description": None,
+        "is_completed": False,
+        "created_at": datetime(2025, 5, 24, 15, 20, 1, tzinfo=timezone.utc),
+        "updated_at": datetime(2025, 5, 24, 15, 20, 2, tzinfo=timezone.utc),
+    }
+    task = TaskResponseSchema.model_construct(**row)
+    content = TaskListResponseSchema.model_construct(
+        tasks=[task],
+        total=1,
+        next_cursor=None,
+    )
+
+    response = json_response(content)
+
+    assert response.media_type == "application/json"
+    assert json.loads(response.body) == TaskListResponseSchema(
+        tasks=[row], total=1
+    ).model_dump(mode="json")
@@ -0,0 +1,31 @@
+from datetime import datetime, timezone
+
+import pytest
+from pydantic import TypeAdapter
+
+from app.utils.pagination import decode_cursor, encode_cursor
+
+adapter = TypeAdapter(tuple[datetime, int])
+
+
+def test_cursor_roundtrip():
+    """Тестирует кодирование и декодирование курсора пагинации."""
+    values = (datetime(2025, 5, 24, 15, 20, 1, 842976, tzinfo=timezone.utc), 42)
+
+    cursor = encode_cursor(values=values)
+
+    assert decode_cursor(cursor=cursor, adapter=adapter) == values
+
+
+@pytest.mark.parametrize(
+    "cursor",
+    [
+        "not-a-cursor",
+        encode_cursor(values=("2025-05-24", "id")),
+        encode_cursor(values=(1,)),
+    ],
+)
+def test_decode_invalid_cursor(cursor: str):
+    """Тестирует декодирование повреждённого или чужого курсора."""
+    with pytest.raises(ValueError):
+        decode_cursor(cursor=cursor, adapter=adapter)
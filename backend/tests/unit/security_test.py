@@ -1,11 +1,19 @@
+import asyncio
+from unittest.mock import patch
+
 import jwt
+import pytest
 
 from app.core.config import settings
 from app.core.constants import AUTH_ALGORITHM
+from app.core.exceptions import ServiceOverloadedException
+from app.utils import security
 from app.utils.security import (
     create_access_token,
     hash_password,
+    hash_password_async,
     verify_password,
+    verify_password_async,
 )
 
 
@@ -44,3 +52,61 @@ def test_create_access_token():
     assert isinstance(token, str)
     assert len(token) > 0
     assert token_email == email
+
+
+def test_create_access_token_with_user_id():
+    """Тестирует создание токена, содержащего ID и версию токенов пользователя."""
+    token = create_access_token(
+        email="user@example.com",
+        user_id=42,
+        token_version=3,
+    )
+
+    payload = jwt.decode(
+        token,
+        settings.AUTH_SECRET_KEY,
+        algorithms=[AUTH_ALGORITHM],
+    )
+
+    assert payload["sub"] == "user@example.com"
+    assert payload["uid"] == 42
+    assert payload["ver"] == 3
+
+
+async def test_hash_password_async():
+    """Тестирует хэширование и проверку пароля в пуле потоков."""
+    password = "my_secure_password"
+    hashed_password = await hash_password_async(plaintext=password)
+
+    assert await verify_password_async(plain_password=password, hashed=hashed_password)
+    assert not await verify_password_async(
+        plain_password="wrong_password",
+        hashed=hashed_password,
+    )
+
+
+async def test_hash_password_async_overloaded():
+    """Тестирует отклонение операций при переполнении очереди хэширования."""
+    with patch.object(settings, "PASSWORD_HASH_MAX_PENDING", 0):
+        with pytest.raises(ServiceOverloadedException):
+            await hash_password_async(plaintext="my_secure_password")
+
+
+async def test_hash_password_async_cancelled():
+    """
+    Тестирует, что отмененная операция занимает место в очереди хэширования,
+    пока не завершится в пуле потоков.
+    """
+    with patch.object(settings, "PASSWORD_HASH_MAX_PENDING", 1):
+        task = asyncio.create_task(hash_password_async(plaintext="password"))
+        await asyncio.sleep(0.01)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        with pytest.raises(ServiceOverloadedException):
+            await hash_password_async(plaintext="password")
+
+        while security._hash_pending:
+            await asyncio.sleep(0.01)
+        assert await hash_password_async(plaintext="password")
@@ -0,0 +1,67 @@
+import random
+from datetime import datetime, timedelta, timezone
+
+import pytest
+
+from app.tools.seed import SeedOptions, allocate_tasks, generate_tasks
+
+options = SeedOptions(
+    users=100,
+    tasks=10_000,
+    distribution="zipf",
+    zipf_alpha=1.1,
+    lognormal_sigma=1.0,
+    completed_ratio=0.3,
+    description_min=10,
+    description_max=50,
+    spread_days=30,
+    until=datetime(2025, 1, 1, tzinfo=timezone.utc),
+    email_domain="seed.example.com",
+    seed=0,
+)
+
+
+@pytest.mark.parametrize("distribution", ["uniform", "zipf", "lognormal"])
+def test_allocate_tasks(distribution: str):
+    """Тестирует распределение задач между пользователями."""
+    counts = allocate_tasks(
+        10_000, 100, distribution=distribution, rng=random.Random(0)
+    )
+
+    assert len(counts) == 100
+    assert sum(counts) == 10_000
+    if distribution == "uniform":
+        assert set(counts) == {100}
+    if distribution == "zipf":
+        # Самому активному пользователю достается больше 10% всех задач
+        assert max(counts) > 1000
+
+
+def test_allocate_tasks_unknown_distribution():
+    """Тестирует ошибку при неизвестном распределении."""
+    with pytest.raises(ValueError):
+        allocate_tasks(10, 10, distribution="normal", rng=random.Random(0))
+
+
+def test_generate_tasks():
+    """Тестирует воспроизводимость и параметры генерации задач."""
+    owners = list(zip(range(1, 101), [100] * 100))
+
+    def generate():
+        return list(
+            generate_tasks(
+                first_id=1, owners=owners, options=options, rng=random.Random(0)
+            )
+        )
+
+    tasks = generate()
+    assert tasks == generate()
+
+    assert [task[0] for task in tasks] == list(range(1, 10_001))
+    assert [task[1] for task in tasks[:101]] == [1] * 100 + [2]
+    assert all(0 < len(task[2]) <= 64 for task in tasks)
+    assert all(10 <= len(task[3]) <= 50 for task in tasks)
+    assert 0.25 < sum(task[4] for task in tasks) / len(tasks) < 0.35
+
+    since = options.until - timedelta(days=options.spread_days)
+    assert all(since <= task[5] <= task[6] <= options.until for task in tasks)
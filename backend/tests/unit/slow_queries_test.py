@@ -0,0 +1,72 @@
+import logging
+from types import SimpleNamespace
+
+import pytest
+
+from app.db.slow_queries import SlowQueryLog, describe_parameters, normalize_statement
+
+
+@pytest.mark.parametrize(
+    "statement, expected",
+    [
+        (
+            "SELECT tasks.id\nFROM tasks\nWHERE tasks.user_id = $1 LIMIT $2",
+            "SELECT tasks.id FROM tasks WHERE tasks.user_id = ? LIMIT ?",
+        ),
+        (
+            "DELETE FROM tasks WHERE tasks.id IN ($1, $2, $3)",
+            "DELETE FROM tasks WHERE tasks.id IN (?, ...)",
+        ),
+        (
+            "SELECT * FROM tasks WHERE title = 'it''s' AND id > 42 AND t1.x = 1.5",
+            "SELECT * FROM tasks WHERE title = ? AND id > ? AND t1.x = ?",
+        ),
+    ],
+)
+def test_normalize_statement(statement: str, expected: str):
+    """Тестирует нормализацию текста запроса."""
+    assert normalize_statement(statement) == expected
+
+
+def test_describe_parameters():
+    """Тестирует описание параметров запроса без значений."""
+    assert (
+        describe_parameters((1, "secret", None, [1, 2]))
+        == "(int, str, NoneType, list[2])"
+    )
+    assert describe_parameters({"id": 1}) == "(id: int)"
+    assert describe_parameters([(1, "a"), (2, "b")], executemany=True) == (
+        "2 x (int, str)"
+    )
+
+
+def test_slow_query_log(caplog: pytest.LogCaptureFixture):
+    """Тестирует запись медленных запросов в лог."""
+    slow_query_log = SlowQueryLog(
+        threshold_seconds=0.1,
+        explain_sample_rate=1,
+        explain_timeout_seconds=1,
+        max_plans=10,
+        max_concurrent_explains=1,
+    )
+    engine = SimpleNamespace(dialect=SimpleNamespace(driver="aiosqlite"))
+
+    with caplog.at_level(logging.WARNING, logger="app.db.slow_queries"):
+        for seconds in (0.05, 0.2):
+            slow_query_log.observe(
+                engine,
+                statement="SELECT * FROM users WHERE email = $1",
+                parameters=("user@example.com",),
+                executemany=False,
+                seconds=seconds,
+                route="/api/v1/auth/me",
+            )
+
+    assert len(caplog.records) == 1
+    message = caplog.records[0].getMessage()
+    assert "/api/v1/auth/me" in message
+    assert "email = ?" in message
+    assert "(str)" in message
+    assert "user@example.com" not in message
+    # План снимается только на движке asyncpg
+    assert not slow_query_log._explains
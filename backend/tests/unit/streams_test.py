@@ -0,0 +1,46 @@
+from typing import AsyncIterator
+
+import pytest
+
+from app.utils.streams import iter_csv_rows, iter_lines
+
+
+async def chunked(data: bytes, size: int = 3) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+async def test_iter_lines_splits_multibyte_chunks():
+    """Тестирует разбиение на строки при разрыве символа между частями потока."""
+    data = "первая\r\nвторая\nтретья".encode()
+
+    lines = [line async for line in iter_lines(chunked(data), max_line_size=100)]
+
+    assert lines == ["первая", "вторая", "третья"]
+
+
+async def test_iter_lines_too_long_line():
+    """Тестирует ограничение длины строки."""
+    with pytest.raises(ValueError):
+        async for _ in iter_lines(chunked(b"x" * 100), max_line_size=10):
+            pass
+
+    # Слишком длинная строка, пришедшая целиком в одном фрагменте
+    with pytest.raises(ValueError):
+        data = b"ok\n" + b"x" * 100 + b"\nok\n"
+        async for _ in iter_lines(chunked(data, size=len(data)), max_line_size=10):
+            pass
+
+
+async def test_iter_csv_rows_quoted_newlines():
+    """Тестирует разбор CSV со значениями, содержащими переводы строк."""
+    data = 'title,description\r\n"a, b","multi\nline ""q"""\r\n\r\nc,\r\n'.encode()
+
+    rows = [row async for row in iter_csv_rows(chunked(data), max_line_size=100)]
+
+    assert rows == [
+        ["title", "description"],
+        ["a, b", 'multi\nline "q"'],
+        [],
+        ["c", ""],
+    ]
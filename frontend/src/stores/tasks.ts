@@ -7,6 +7,9 @@ import { API_CONFIG, createApiUrl } from "../config/api";
 import type { Task, TaskCreate, TaskUpdate, TaskListResponse } from "../types/Task";
 import { useAuthStore } from "./auth";
 
+// Количество задач, запрашиваемых за один запрос к API
+const TASKS_PAGE_SIZE = 500;
+
 export const useTasksStore = defineStore("task", () => {
   // State
   const tasks = ref<Task[]>([]);
@@ -36,18 +39,35 @@ export const useTasksStore = defineStore("task", () => {
     error.value = null;
 
     try {
-      const response = await fetch(createApiUrl(API_CONFIG.ENDPOINTS.TASKS.LIST), {
-        method: "GET",
-        headers: getAuthHeaders(),
-      });
-
-      if (!response.ok) {
-        const errorData = await response.json();
-        throw new Error(errorData.detail || "Ошибка получения задач");
-      }
-
-      const data: TaskListResponse = await response.json();
-      tasks.value = data.tasks;
+      // API отдаёт задачи постранично: загружаем страницы, пока есть курсор
+      const fetchedTasks: Task[] = [];
+      let cursor: string | null = null;
+
+      do {
+        const params = new URLSearchParams({ limit: String(TASKS_PAGE_SIZE) });
+        if (cursor) {
+          params.set("after", cursor);
+        }
+
+        const response = await fetch(
+          `${createApiUrl(API_CONFIG.ENDPOINTS.TASKS.LIST)}?${params}`,
+          {
+            method: "GET",
+            headers: getAuthHeaders(),
+          },
+        );
+
+        if (!response.ok) {
+          const errorData = await response.json();
+          throw new Error(errorData.detail || "Ошибка получения задач");
+        }
+
+        const data: TaskListResponse = await response.json();
+        fetchedTasks.push(...data.tasks);
+        cursor = data.next_cursor;
+      } while (cursor);
+
+      tasks.value = fetchedTasks;
     } catch (err) {
       error.value = err instanceof Error ? err.message : "Неизвестная ошибка";
       console.error("Ошибка при получении задач:", err);
@@ -34,4 +34,5 @@ export interface Task {
 export interface TaskListResponse {
   tasks: Task[];
   total: number;
+  next_cursor: string | null;
 }